@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import uuid
+import tempfile
+
+'''
+    Stand-in for the adb binary, to exercise device_readiness without a device:
+
+        ADB=./adb_stub.py python3 device_readiness.py
+
+    Supports reboot, wait-for-device, get-state, "shell getprop sys.boot_completed"
+    and "shell cat /proc/sys/kernel/random/boot_id". After "reboot" the device keeps
+    its old boot for ADB_STUB_LINGER seconds (boot_completed still 1), is offline for
+    ADB_STUB_OFFLINE seconds, then boots with a new boot id and reports
+    boot_completed=1 ADB_STUB_BOOT seconds after the reboot command. With
+    ADB_STUB_NO_BOOT_ID=1 the boot id can not be read. The state is kept in the
+    ADB_STUB_STATE file.
+'''
+
+STATE_PATH = os.environ.get('ADB_STUB_STATE', os.path.join(tempfile.gettempdir(), 'adb_stub_state'))
+LINGER = float(os.environ.get('ADB_STUB_LINGER', 0.3))
+OFFLINE = float(os.environ.get('ADB_STUB_OFFLINE', 0.5))
+BOOT = float(os.environ.get('ADB_STUB_BOOT', 1.5))
+
+
+def load_state():
+    '''
+        (reboot time, old boot id, new boot id), never rebooted when the file is missing.
+    '''
+    try:
+        with open(STATE_PATH) as f:
+            rebooted, old, new = f.read().split()
+        return float(rebooted), old, new
+    except (OSError, ValueError):
+        return 0.0, 'boot-0', 'boot-0'
+
+
+def main(args):
+    rebooted, old_boot, new_boot = load_state()
+    if args[:1] == ['-s']:
+        args = args[2:]
+    command = ' '.join(args)
+    if command == 'reboot':
+        with open(STATE_PATH, 'w') as f:
+            f.write('{} {} {}'.format(time.time(), new_boot, uuid.uuid4()))
+        return 0
+    since = time.time() - rebooted
+    lingering = since < LINGER
+    offline = not lingering and since < LINGER + OFFLINE
+    if command == 'wait-for-device':
+        if offline:
+            time.sleep(LINGER + OFFLINE - since)
+        return 0
+    if command == 'get-state':
+        if offline:
+            print('error: device offline', file=sys.stderr)
+            return 1
+        print('device')
+        return 0
+    if offline:
+        print('error: device offline', file=sys.stderr)
+        return 1
+    if command == 'shell getprop sys.boot_completed':
+        print('1' if lingering or since >= BOOT else '')
+        return 0
+    if command == 'shell cat /proc/sys/kernel/random/boot_id':
+        if os.environ.get('ADB_STUB_NO_BOOT_ID'):
+            print('cat: /proc/sys/kernel/random/boot_id: Permission denied', file=sys.stderr)
+            return 1
+        print(old_boot if lingering else new_boot)
+        return 0
+    print('adb_stub: unsupported command "{}"'.format(command), file=sys.stderr)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+import os
+import time
+import asyncio
+import functools
+from light_control import light_source, ArriFrameEncoder, SolBoxReader
+import settle
+from ramp_engine import render_frames
+
+
+class AsyncLightSource(object):
+    '''
+        asyncio driver on top of a light_source.
+        Uses the same backends (arri, solbox, dxo, dummy) and the same device state,
+        but never blocks the event loop: serial writes and SolBox acks go through the
+        loop's reader/writer callbacks on the port file descriptor, and ports without
+        one (DummySerial) are polled with asyncio.sleep. Several light boxes can then be
+        driven concurrently from one loop, e.g.
+            await asyncio.gather(box_a.set_light(0.5, 5000), box_b.set_light(0.2, 6500))
+    '''
+
+    def __init__(self, light, poll_interval=0.005):
+        self.light = light
+        self.poll_interval = poll_interval
+        self._lock = asyncio.Lock()
+        self._reader = None
+        self._reader_fd = None
+        self._reader_loop = None
+        self._backends = {'arri': self._set_light_arri,
+                          'solbox': self._set_light_iq_sol,
+                          'dxo': self._set_light_dxo,
+                          'dummy': self._set_light_dxo}
+
+    @classmethod
+    async def open(cls, poll_interval=0.005, **kwargs):
+        '''
+            Create the underlying light_source (port discovery, device probing and
+            chromameter start up) in the default executor and wrap it.
+        '''
+        loop = asyncio.get_running_loop()
+        light = await loop.run_in_executor(None, functools.partial(light_source, **kwargs))
+        return cls(light, poll_interval=poll_interval)
+
+    def close(self):
+        self._remove_reader()
+        self.light.__del__()
+
+    @property
+    def luminance(self):
+        return self.light.luminance
+
+    @property
+    def cct(self):
+        return self.light.cct
+
+    def _fileno(self):
+        try:
+            return self.light.serial.fileno()
+        except Exception:
+            return None
+
+    async def _write(self, data):
+        fd = self._fileno()
+        if fd is None:
+            self.light.serial.write(data)
+            return
+        loop = asyncio.get_running_loop()
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(fd, view):]
+            except BlockingIOError:
+                pass
+            if view:
+                writable = loop.create_future()
+                loop.add_writer(fd, writable.set_result, None)
+                try:
+                    await writable
+                finally:
+                    loop.remove_writer(fd)
+
+    def _ack_reader(self):
+        if self._reader is None or self._reader.serial is not self.light.serial:
+            self._remove_reader()
+            # The light's own reader thread would take the acks, and stops ours in turn.
+            self.light._stop_solbox_reader()
+            self.light._release_ack_reader = self._remove_reader
+            self._reader = SolBoxReader(self.light.serial)
+            fd = self._fileno()
+            if fd is not None:
+                self._reader_loop = asyncio.get_running_loop()
+                self._reader_loop.add_reader(fd, self._on_readable, fd)
+                self._reader_fd = fd
+        return self._reader
+
+    def _remove_reader(self):
+        '''
+            Remove the reader from the loop it was added on, also when called from
+            another thread (close() after the loop is done with the light).
+        '''
+        loop, fd = self._reader_loop, self._reader_fd
+        if fd is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop or not loop.is_running():
+                loop.remove_reader(fd)
+            else:
+                loop.call_soon_threadsafe(loop.remove_reader, fd)
+        self._reader_fd = None
+        self._reader_loop = None
+        self._reader = None
+        if self.light._release_ack_reader == self._remove_reader:
+            self.light._release_ack_reader = None
+
+    def _on_readable(self, fd):
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._reader.stop()
+            self._remove_reader()
+            return
+        self._reader.feed(data)
+
+    async def _wait_ack(self, ack, timeout):
+        if self._reader_fd is not None:
+            return await asyncio.wait_for(asyncio.wrap_future(ack), timeout)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not ack.done():
+            waiting = self.light.serial.in_waiting
+            if waiting:
+                self._reader.feed(self.light.serial.read(waiting))
+                continue
+            if loop.time() >= deadline:
+                ack.cancel()
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(self.poll_interval)
+        return ack.result()
+
+    async def _set_light_arri(self, **kwargs):
+        light = self.light
+        if light._arri_encoder is None:
+            light._arri_encoder = ArriFrameEncoder()
+        await self._write(light._arri_encoder.encode(kwargs['luminance'], kwargs['cct']))
+        await asyncio.sleep(0.05)
+
+    async def _set_light_iq_sol(self, **kwargs):
+        light = self.light
+        light._select_flicker_freq(**kwargs)
+        reader = self._ack_reader()
+        ack = reader.expect_ack()
+        try:
+            await self._write(light._iq_sol_message(light.luminance, light.cct, light.flicker_freq))
+        except BaseException:
+            reader.discard(ack)
+            raise
+        # Reset flicker_freq
+        light.flicker_freq = 0
+        try:
+            with light.instrumentation.span('solbox_ack_wait', driver='async'):
+                await self._wait_ack(ack, light.timeout)
+        except asyncio.TimeoutError:
+            received = reader.pending_data()
+            reader.discard(ack)
+            light.instrumentation.count('solbox_ack_timeout')
+            raise Exception('Unexpected return from IQ Solution Box: {}'.format(received))
+        return True
+
+    async def _set_light_dxo(self, **kwargs):
+        pass
+
+    async def set_light(self, luminance=None, cct=None, **kwargs):
+        light = self.light
+        async with self._lock:
+            with light.instrumentation.span('set_light', driver='async'):
+                if light.selected_source != 'dummy' and light.serial is None:
+                    await asyncio.get_running_loop().run_in_executor(None, light._open)
+                light._update_state(luminance, cct)
+                with light.instrumentation.span('backend.' + light.selected_source, driver='async'):
+                    await self._backends[light.selected_source](luminance=light.luminance, cct=light.cct, **kwargs)
+
+    async def read_luminance(self):
+        '''
+            Average chromameter luminance. The chromameter drivers are blocking, so
+            the read runs in the loop's shared default executor.
+        '''
+        return await asyncio.get_running_loop().run_in_executor(None, self.light.get_avg_luminance)
+
+    async def wait_for_settle(self, **kwargs):
+        '''
+            asyncio version of light_source.wait_for_settle.
+        '''
+        loop = asyncio.get_running_loop()
+        config = dict(self.light.settle_config, **kwargs)
+        interval = config.pop('interval')
+        timeout = config.pop('timeout')
+        detector = settle.SettleDetector(**config)
+        start = loop.time()
+        wall_start = time.time()
+        while True:
+            reading = await loop.run_in_executor(None, self.light.read_luminance)
+            now = loop.time() - start
+            value = reading.stamped()
+            t = now
+            if isinstance(value, tuple):
+                timestamp, value = value
+                t = timestamp - wall_start
+            if detector.update(t, value):
+                result = detector.result(True, now)
+                break
+            if now >= timeout:
+                result = detector.result(False, now)
+                break
+            await asyncio.sleep(interval)
+        if result.value is None:
+            result.value = await self.read_luminance()
+        self.light.last_settle = result
+        return result
+
+    async def set_light_abs(self, abs_luminance, cct=None, tolerance=0.01, **kwargs):
+        '''
+            Set light condition with absolute luminance measured from chroma meter.
+        '''
+        light = self.light
+        if len(light.chromameters) == 0 or light.calibration_mode == False:
+            raise Exception('No connected chroma meters')
+        light.abs_luminance = abs_luminance
+        commands = light._abs_luminance_commands(cct, tolerance, await self.read_luminance())
+        for luminance in commands:
+            await self.set_light(luminance=luminance, cct=cct)
+            commands.send((await self.wait_for_settle()).value)
+
+    async def ramp(self, luminance, cct=None, duration=1.0, rate=20, easing='linear', **kwargs):
+        '''
+            Transition from the current state to (luminance, cct) over duration seconds
+            at rate commands per second, see ramp_engine for the easing curves.
+            Commands are scheduled on absolute deadlines.
+        '''
+        loop = asyncio.get_running_loop()
+        light = self.light
+        cct = light.cct if cct is None else cct
+        times, lums, ccts = render_frames([(luminance, cct, duration, easing)], rate,
+                                          start=(light.luminance, light.cct))
+        start = loop.time()
+        for offset, lum, frame_cct in zip(times[1:], lums[1:], ccts[1:]):
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self.set_light(luminance=float(lum), cct=float(frame_cct), **kwargs)
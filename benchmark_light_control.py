@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import datetime
+import subprocess
+import tracemalloc
+import numpy as np
+from device_emulator import emulated_light_source
+
+'''
+    Throughput and latency benchmark for the light_source backends.
+
+    Drives light_source through scripted workloads against the emulated devices and
+    reports commands/sec, latency percentiles, CPU time and allocations per command
+    as JSON, timings as the best of --repeats passes. Compare two runs with --compare
+    to catch hot path regressions, changes within the noise floors are ignored:
+
+        python3 benchmark_light_control.py -o before.json
+        python3 benchmark_light_control.py -o after.json --compare before.json
+'''
+
+BACKENDS = ['solbox', 'arri', 'dxo', 'dummy']
+
+
+def random_setpoints(rng, count):
+    return [('set_light', {'luminance': rng.uniform(0, 1), 'cct': rng.randrange(2700, 10001, 100)})
+            for _ in range(count)]
+
+
+def cct_sweep(rng, count):
+    return [('set_light', {'luminance': 0.5, 'cct': cct}) for cct in np.linspace(2700, 10000, count)]
+
+
+def luminance_ramp(rng, count):
+    return [('set_light', {'luminance': lum, 'cct': 5000}) for lum in np.linspace(0, 1, count)]
+
+
+def abs_convergence(rng, count):
+    # set_light_abs waits for the light to settle, a few targets are enough.
+    return [('set_light_abs', {'abs_luminance': rng.uniform(50, 900), 'cct': 5000})
+            for _ in range(max(3, count // 50))]
+
+
+WORKLOADS = {'random': random_setpoints,
+             'cct_sweep': cct_sweep,
+             'ramp': luminance_ramp,
+             'abs': abs_convergence}
+
+
+def _percentiles(latencies):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {'p50_ms': p50 * 1e3, 'p95_ms': p95 * 1e3, 'p99_ms': p99 * 1e3,
+            'mean_ms': float(np.mean(latencies)) * 1e3, 'max_ms': float(np.max(latencies)) * 1e3}
+
+
+def _timed_pass(light, ops):
+    latencies = []
+    # CPU of the calling thread only, the chroma meter and emulator threads add noise
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    for method, kwargs in ops:
+        start = time.perf_counter()
+        getattr(light, method)(**kwargs)
+        latencies.append(time.perf_counter() - start)
+    wall = time.perf_counter() - wall_start
+    cpu = time.thread_time() - cpu_start
+    result = {'ops_per_sec': len(ops) / wall, 'cpu_ms_per_op': cpu / len(ops) * 1e3}
+    result.update(_percentiles(latencies))
+    return result
+
+
+def run_workload(backend, workload, commands=200, seed=0, repeats=5, **emulator):
+    '''
+        Run one workload against one emulated backend, returns the result dict.
+        Timings are the best of repeats passes (highest ops/sec, lowest latencies),
+        which is far less noisy than a single pass.
+    '''
+    if workload == 'abs' and backend in ('dxo', 'dummy'):
+        return None  # No light output to converge on
+    rng = random.Random(seed)
+    ops = WORKLOADS[workload](rng, commands)
+    light = emulated_light_source('solbox' if backend == 'dummy' else backend, **emulator)
+    if backend == 'dummy':
+        light.selected_source = 'dummy'
+    try:
+        device_commands = light.emulated_light.commands
+        passes = [_timed_pass(light, ops) for _ in range(max(1, repeats))]
+        device_commands = (light.emulated_light.commands - device_commands) // len(passes)
+
+        # Second pass under tracemalloc, it slows the hot path down too much to time it.
+        tracemalloc.start()
+        transient = []
+        for method, kwargs in ops:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            getattr(light, method)(**kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+            transient.append(peak - before)
+        tracemalloc.stop()
+    finally:
+        light.__del__()
+
+    result = {'backend': backend, 'workload': workload, 'operations': len(ops), 'repeats': len(passes),
+              'device_commands': device_commands,
+              'alloc_bytes_per_op': float(np.mean(transient))}
+    for metric in passes[0]:
+        best = max if metric == 'ops_per_sec' else min
+        result[metric] = best(p[metric] for p in passes)
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def run(backends=BACKENDS, workloads=list(WORKLOADS), commands=200, seed=0, repeats=5, **emulator):
+    results = []
+    for backend in backends:
+        for workload in workloads:
+            result = run_workload(backend, workload, commands=commands, seed=seed, repeats=repeats, **emulator)
+            if result is not None:
+                results.append(result)
+    return {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'emulator': emulator,
+            'results': results}
+
+
+# Metric -> True when higher is better
+COMPARED_METRICS = {'ops_per_sec': True, 'p50_ms': False, 'p95_ms': False, 'p99_ms': False,
+                    'cpu_ms_per_op': False, 'alloc_bytes_per_op': False}
+# Absolute change below which a metric is noise, ops_per_sec compares ms per op.
+# The tail percentiles rest on a few samples, so their floors are wider.
+NOISE_FLOOR = {'ops_per_sec': 0.05, 'p50_ms': 0.05, 'p95_ms': 1.0, 'p99_ms': 5.0,
+               'cpu_ms_per_op': 0.2, 'alloc_bytes_per_op': 256}
+TIMING_METRICS = ('ops_per_sec', 'p50_ms', 'p95_ms', 'p99_ms', 'cpu_ms_per_op')
+
+
+def compare(baseline, current, threshold=0.1, min_ms=1.0):
+    '''
+        Metrics that got worse by more than threshold (relative) and by more than
+        their NOISE_FLOOR (absolute), as a list of (backend, workload, metric,
+        baseline, current). Timings of workloads whose baseline p50 is below min_ms
+        are not compared: microsecond latencies are dominated by scheduler noise.
+    '''
+    previous = {(r['backend'], r['workload']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        base = previous.get((result['backend'], result['workload']))
+        if base is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric not in base or not base[metric]:
+                continue
+            if metric in TIMING_METRICS and base.get('p50_ms', 0) < min_ms:
+                continue
+            if metric == 'ops_per_sec':
+                # ms per operation, so the floor is in the same unit as the latencies
+                before, after = 1e3 / base[metric], 1e3 / result[metric]
+            else:
+                before, after = base[metric], result[metric]
+                if higher_is_better:
+                    before, after = -before, -after
+            if after - before > max(threshold * abs(before), NOISE_FLOOR[metric]):
+                regressions.append((result['backend'], result['workload'], metric, base[metric], result[metric]))
+    return regressions
+
+
+def print_table(report):
+    print('{:8} {:10} {:>6} {:>10} {:>9} {:>9} {:>9} {:>9} {:>11}'.format(
+        'backend', 'workload', 'ops', 'ops/s', 'p50 ms', 'p95 ms', 'p99 ms', 'cpu ms', 'alloc B'))
+    for r in report['results']:
+        print('{backend:8} {workload:10} {operations:>6} {ops_per_sec:>10.1f} {p50_ms:>9.3f} {p95_ms:>9.3f} '
+              '{p99_ms:>9.3f} {cpu_ms_per_op:>9.3f} {alloc_bytes_per_op:>11.0f}'.format(**r))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='light_source backend benchmark on emulated devices')
+    parser.add_argument('--backends', '-b', nargs='+', default=BACKENDS, choices=BACKENDS)
+    parser.add_argument('--workloads', '-w', nargs='+', default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument('--commands', '-n', help='Commands per workload', default=200, type=int)
+    parser.add_argument('--seed', default=0, type=int)
+    parser.add_argument('--response_latency', help='Emulated device reply latency (s)', default=0.005, type=float)
+    parser.add_argument('--rise_time', help='Emulated light rise time (s)', default=0.05, type=float)
+    parser.add_argument('--read_latency', help='Virtual chromameter read latency (s)', default=0.02, type=float)
+    parser.add_argument('--ambient', help='Emulated ambient light (lux)', default=1.0, type=float)
+    parser.add_argument('--output', '-o', help='Write the JSON report here', default=None)
+    parser.add_argument('--compare', '-c', help='Baseline JSON report to compare against', default=None)
+    parser.add_argument('--threshold', help='Relative change counted as a regression', default=0.1, type=float)
+    parser.add_argument('--repeats', '-r', help='Timed passes per workload, the best one is reported', default=5,
+                        type=int)
+    parser.add_argument('--min_ms', help='Do not compare the timings of workloads with a faster baseline p50',
+                        default=1.0, type=float)
+    args = parser.parse_args()
+
+    report = run(args.backends, args.workloads, commands=args.commands, seed=args.seed, repeats=args.repeats,
+                 response_latency=args.response_latency, rise_time=args.rise_time,
+                 read_latency=args.read_latency, ambient=args.ambient)
+    print_table(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold, args.min_ms)
+        for backend, workload, metric, before, after in regressions:
+            print('REGRESSION {} {} {}: {:.4g} -> {:.4g}'.format(backend, workload, metric, before, after))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
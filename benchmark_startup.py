@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import datetime
+import subprocess
+import numpy as np
+from benchmark_light_control import _git_commit
+
+'''
+    Startup time benchmark for the light_control CLI.
+
+    Runs short light_control invocations in fresh interpreters and reports their wall
+    time, plus the slowest imports of "import light_control" from -X importtime.
+    Fails (exit 1) when a command gets slower than --max_ms or regresses against a
+    previous report:
+
+        python3 benchmark_startup.py -o before.json
+        python3 benchmark_startup.py -o after.json --compare before.json
+'''
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+COMMANDS = {'import': ['-c', 'import light_control'],
+            'list': ['light_control.py', '-L'],
+            'dummy_set': ['light_control.py', '--dummy', '-s', 'dummy', '-l', '0.5', '-t', '5000', '-v', '0']}
+
+
+def time_command(args, repeat=10):
+    '''
+        Wall times (s) of repeat runs of the interpreter with args.
+    '''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=HERE, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def import_profile(top=10):
+    '''
+        The top slowest imports (cumulative us) of "import light_control".
+    '''
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import light_control'],
+                            cwd=HERE, check=True, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL)
+    imports = []
+    for line in output.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append({'module': name.strip(), 'cumulative_us': int(cumulative)})
+    return sorted(imports, key=lambda i: -i['cumulative_us'])[:top]
+
+
+def run(commands=list(COMMANDS), repeat=10):
+    baseline = np.median(time_command(['-c', 'pass'], repeat))
+    results = []
+    for name in commands:
+        times = np.array(time_command(COMMANDS[name], repeat))
+        results.append({'command': name, 'runs': repeat,
+                        'median_ms': float(np.median(times)) * 1e3,
+                        'min_ms': float(times.min()) * 1e3,
+                        'max_ms': float(times.max()) * 1e3,
+                        'over_interpreter_ms': float(np.median(times) - baseline) * 1e3})
+    return {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'interpreter_ms': float(baseline) * 1e3,
+            'results': results,
+            'imports': import_profile()}
+
+
+def compare(baseline, current, threshold=0.2):
+    '''
+        Commands whose median startup got slower by more than threshold (relative),
+        as a list of (command, baseline ms, current ms).
+    '''
+    previous = {r['command']: r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        base = previous.get(result['command'])
+        if base and result['median_ms'] > base['median_ms'] * (1 + threshold):
+            regressions.append((result['command'], base['median_ms'], result['median_ms']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='light_control CLI startup time benchmark')
+    parser.add_argument('--commands', nargs='+', default=list(COMMANDS), choices=list(COMMANDS))
+    parser.add_argument('--repeat', '-n', help='Runs per command', default=10, type=int)
+    parser.add_argument('--max_ms', help='Fail when a median startup exceeds this', default=None, type=float)
+    parser.add_argument('--output', '-o', help='Write the JSON report here', default=None)
+    parser.add_argument('--compare', '-c', help='Baseline JSON report to compare against', default=None)
+    parser.add_argument('--threshold', help='Relative slowdown counted as a regression', default=0.2, type=float)
+    args = parser.parse_args()
+
+    report = run(args.commands, args.repeat)
+    print('interpreter {:.1f} ms'.format(report['interpreter_ms']))
+    print('{:10} {:>10} {:>10} {:>10} {:>14}'.format('command', 'median ms', 'min ms', 'max ms', 'over python ms'))
+    for r in report['results']:
+        print('{command:10} {median_ms:>10.1f} {min_ms:>10.1f} {max_ms:>10.1f} {over_interpreter_ms:>14.1f}'.format(**r))
+    print('slowest imports of light_control:')
+    for i in report['imports']:
+        print('\t{:>8.1f} ms {}'.format(i['cumulative_us'] / 1e3, i['module']))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+
+    failed = False
+    if args.max_ms is not None:
+        for r in report['results']:
+            if r['median_ms'] > args.max_ms:
+                print('TOO SLOW {}: {:.1f} ms > {:.1f} ms'.format(r['command'], r['median_ms'], args.max_ms))
+                failed = True
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        for command, before, after in regressions:
+            print('REGRESSION {}: {:.1f} -> {:.1f} ms'.format(command, before, after))
+        failed = failed or bool(regressions)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import os
+import json
+import math
+import threading
+
+'''
+    Persistent luminance calibration for set_light_abs.
+
+    Every chroma meter measurement taken by set_light_abs is stored as a
+    (command luminance, measured lux) point per device and CCT. predict() inverts
+    the monotone envelope of those points to give the command expected to hit a
+    target lux, so the iteration only has to correct the residual.
+'''
+
+DEFAULT_CALIBRATION_PATH = os.environ.get(
+    'LIGHTBOX_CALIBRATION',
+    os.path.join(os.path.expanduser('~'), '.cache', 'lightbox', 'calibration.json'))
+
+
+class CalibrationTable(object):
+    def __init__(self, path=DEFAULT_CALIBRATION_PATH, max_points=64):
+        self.path = path
+        self.max_points = max_points
+        # Light sources driven from different threads can share one table.
+        self._lock = threading.Lock()
+        try:
+            with open(path) as f:
+                self.table = json.load(f)
+        except (OSError, ValueError):
+            self.table = {}
+
+    def record(self, device, cct, command, lux):
+        '''
+            Add a measurement, replacing an older one at the same command. Only the
+            newest max_points measurements are kept per device and CCT.
+        '''
+        if not math.isfinite(lux) or lux < 0:
+            return
+        with self._lock:
+            points = self.table.setdefault(device, {}).setdefault(str(int(round(cct))), [])
+            points[:] = [p for p in points if abs(p[0] - command) > 1e-6]
+            points.append([float(command), float(lux)])
+            del points[:-self.max_points]
+
+    def curve(self, device, cct):
+        '''
+            (command, lux) arrays for the CCT closest to cct, sorted by command and
+            made non decreasing in lux. None when the device has no measurements.
+        '''
+        with self._lock:
+            ccts = self.table.get(device)
+            if not ccts:
+                return None
+            nearest = min(ccts, key=lambda key: abs(int(key) - cct))
+            points = sorted(ccts[nearest])
+        import numpy as np
+        points = np.array(points, dtype=float).reshape(-1, 2)
+        return points[:, 0], np.maximum.accumulate(points[:, 1])
+
+    def predict(self, device, cct, lux):
+        '''
+            Command luminance expected to produce lux, or None without calibration
+            data. Outside the measured range the closest point is extrapolated
+            proportionally.
+        '''
+        curve = self.curve(device, cct)
+        if curve is None:
+            return None
+        import numpy as np
+        commands, measured = curve
+        # Plateaus (e.g. ambient light at low commands) would make the inverse ambiguous.
+        lux_levels, first = np.unique(measured, return_index=True)
+        commands = commands[first]
+        if lux <= lux_levels[0]:
+            command = commands[0] * lux / lux_levels[0] if lux_levels[0] > 0 else commands[0]
+        elif lux >= lux_levels[-1]:
+            command = commands[-1] * lux / lux_levels[-1]
+        else:
+            command = np.interp(lux, lux_levels, commands)
+        return float(np.clip(command, 0.0, 1.0))
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with self._lock:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.table, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+import time
+import threading
+import numpy as np
+
+'''
+    Background chroma meter sampling.
+
+    A ChromameterSampler reads one chroma meter from its own thread at a fixed rate
+    into a fixed size ring buffer of (timestamp, lux). Callers query the buffer
+    without touching the serial port.
+'''
+
+
+class ChromameterSampler(object):
+    def __init__(self, read, rate=10.0, capacity=4096, name=None):
+        '''
+            read: callable returning (timestamp, lux), timestamp as time.time().
+        '''
+        self.read = read
+        self.rate = rate
+        self.capacity = capacity
+        self.name = name
+        self.errors = 0
+        self._buffer = np.full((capacity, 2), np.nan)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='ChromameterSampler-{}'.format(self.name))
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        interval = 1.0 / self.rate
+        next_sample = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                timestamp, lux = self.read()
+            except Exception:
+                self.errors += 1
+            else:
+                with self._lock:
+                    self._buffer[self._count % self.capacity] = timestamp, lux
+                    self._count += 1
+            # Absolute schedule, skipping missed slots rather than bursting to catch up.
+            next_sample += interval
+            now = time.monotonic()
+            if next_sample < now:
+                next_sample = now
+            self._stop.wait(next_sample - now)
+
+    def samples(self):
+        '''
+            Copy of the buffered samples, oldest first, shape (n, 2).
+        '''
+        with self._lock:
+            count = self._count
+            if count <= self.capacity:
+                return self._buffer[:count].copy()
+            start = count % self.capacity
+            return np.concatenate([self._buffer[start:], self._buffer[:start]])
+
+    def latest(self):
+        '''
+            Most recent (timestamp, lux), None before the first sample.
+        '''
+        with self._lock:
+            if self._count == 0:
+                return None
+            timestamp, lux = self._buffer[(self._count - 1) % self.capacity]
+        return float(timestamp), float(lux)
+
+    def window_since(self, t0, t1=None):
+        samples = self.samples()
+        keep = samples[:, 0] >= t0
+        if t1 is not None:
+            keep &= samples[:, 0] <= t1
+        return samples[keep]
+
+    def mean_over(self, ms):
+        window = self.window_since(time.time() - ms / 1000.0)
+        return float(window[:, 1].mean()) if len(window) else np.nan
+
+    def summary(self, t0, t1=None):
+        '''
+            JSON friendly statistics of the samples between t0 and t1.
+        '''
+        lux = self.window_since(t0, t1)[:, 1]
+        if len(lux) == 0:
+            return {'samples': 0}
+        mean = float(lux.mean())
+        return {'samples': int(len(lux)),
+                'mean': mean,
+                'std': float(lux.std()),
+                'min': float(lux.min()),
+                'max': float(lux.max()),
+                'relative_ripple': float((lux.max() - lux.min()) / mean) if mean else None}
@@ -0,0 +1,2148 @@
+# Generated by generate_cie_tables.py, do not edit.
+
+PLANCK_WAVELENGTHS = (300, 800, 5)
+
+# CMF weights (x, y, z) per Planck grid wavelength inside 360-830 nm.
+PLANCK_CMF_WEIGHTS = [
+    [0.0006495000000000001, 1.9585e-05, 0.0030305],
+    [0.0009689889287768424, 3.383970320570918e-05, 0.004522677822023774],
+    [0.0020745, 6.195000000000002e-05, 0.00973],
+    [0.004015136071223158, 0.00011273154679429084, 0.01889244842797623],
+    [0.006840000000000001, 0.000195, 0.032250005],
+    [0.011332716786330528, 0.00033141348461712753, 0.05351011159107133],
+    [0.021215, 0.0006000000000000001, 0.10025005000000001],
+    [0.04051518428345475, 0.0011024832647371994, 0.1916272695827385],
+    [0.07154999999999999, 0.00198, 0.33925005],
+    [0.12135467107985051, 0.003456778456434076, 0.5771998482029748],
+    [0.21755, 0.006050000000000001, 1.037],
+    [0.3918680063971433, 0.0107316529095265, 1.8723234876053634],
+    [0.6718999999999999, 0.02, 3.2280000000000046],
+    [1.0547233033315764, 0.036007859905459925, 5.103787457625585],
+    [1.4195, 0.057999999999999996, 6.927999999999994],
+    [1.646882530276551, 0.08461815746863381, 8.132564181892295],
+    [1.7413999999999998, 0.11499999999999999, 8.735299999999999],
+    [1.739446575562219, 0.14914451022000488, 8.909012064805225],
+    [1.6810000000000003, 0.19000000000000003, 8.86055],
+    [1.5939186674745731, 0.24042880165134678, 8.728706308886816],
+    [1.4540000000000002, 0.30000000000000004, 8.346],
+    [1.2377787545394896, 0.36912778317460826, 7.541681449647522],
+    [0.9768000000000001, 0.4549, 6.4382],
+    [0.7134163143674698, 0.5640350656502203, 5.2248054550231],
+    [0.47819999999999996, 0.6950999999999998, 4.0647505],
+    [0.29343723799063204, 0.8484944542245105, 3.089066917760081],
+    [0.16005000000000003, 1.0400999999999998, 2.3259],
+    [0.07296598367000205, 1.2894246174517379, 1.766822061436578],
+    [0.024500000000000004, 1.6149999999999998, 1.3599999999999999],
+    [0.010867577329359744, 2.0284820759685385, 1.0475761489936073],
+    [0.0465, 2.515, 0.791],
+    [0.147238707012559, 3.0441595786741105, 0.5666420863389926],
+    [0.31635, 3.549999999999999, 0.39124995],
+    [0.5498713446204044, 3.9723796093350208, 0.28117411190042213],
+    [0.8274999999999999, 4.309999999999995, 0.21080000000000002],
+    [1.1291571645058234, 4.574446983985794, 0.15111757230931894],
+    [1.452, 4.77, 0.10149999999999999],
+    [1.7975124348563019, 4.900426267221789, 0.06659309198730223],
+    [2.1672495, 4.9747505, 0.043749995],
+    [2.5611354085689704, 5.000630634627048, 0.028891295366472152],
+    [2.9725, 4.975, 0.019499999999999997],
+    [3.3925382433678184, 4.893833881770019, 0.013685462171809158],
+    [3.8105, 4.7599999999999945, 0.010499999999999999],
+    [4.213430305459759, 4.5777526507928625, 0.009116855946291214],
+    [4.5815, 4.35, 0.008250005],
+    [4.893740534793153, 4.081405515058516, 0.006878378418025984],
+    [5.1315, 3.785, 0.0055000000000000005],
+    [5.2766700553676325, 3.4741252889730734, 0.0047133947566048474],
+    [5.310999999999995, 3.1550000000000002, 0.004],
+    [5.221079243736301, 2.832718329049191, 0.002824293180554627],
+    [5.013, 2.515, 0.0017000000000000001],
+    [4.695981657187149, 2.207501394830163, 0.0011831825211766447],
+    [4.272249499999999, 1.905, 0.0009499999999999999],
+    [3.7554614400151, 1.6047760916301579, 0.0005929767284887941],
+    [3.2119999999999944, 1.3250000000000002, 0.00024999995],
+    [2.7059523952524374, 1.0833942386492066, 0.000119910421118179],
+    [2.2394999999999996, 0.8749999999999998, 9.999999999999999e-05],
+    [1.8050101664751361, 0.6916469537730163, 5.238144328848987e-05],
+    [1.4174999999999995, 0.5349999999999999, 4.235164736271502e-21],
+    [1.0924444388470171, 0.4075179462587285, -1.0686200522138476e-05],
+    [0.8245, 0.30499999999999994, 1.4558378780933287e-21],
+    [0.6055245781367949, 0.22265626119206974, 2.8633588000640484e-06],
+    [0.43700000000000006, 0.16, 5.293955920339377e-22],
+    [0.31868849860580317, 0.11623200897299243, -7.672346781177099e-07],
+    [0.23384999999999995, 0.085, -8.271806125530277e-24],
+    [0.1656651774399922, 0.06004695291596053, 2.0557991240679275e-07],
+    [0.1135, 0.04105, 1.34416849539867e-23],
+    [0.0790065166342281, 0.028537679363165487, -5.508497150946133e-08],
+    [0.0567958, 0.02051, 0.0],
+    [0.04075939727309548, 0.01471920463137754, 1.4759973631052522e-08],
+    [0.028951729999999995, 0.010454999999999997, -1.2924697071141057e-25],
+    [0.02047962239838998, 0.007395502111324352, -3.95492301474877e-09],
+    [0.014496634999999999, 0.005234999999999998, -1.9387045606711586e-25],
+    [0.010235619383344594, 0.003696286923325052, 1.0597184279425545e-09],
+    [0.007199855, 0.0026, -4.8467614016778965e-26],
+    [0.005005574193231655, 0.00180760019537544, -2.839506970214494e-10],
+    [0.003450393, 0.0012459999999999997, -1.2116903504194741e-26],
+    [0.002381314406228792, 0.0008599372951731874, 7.608436014324269e-11],
+    [0.0016615055, 0.0006000000000000001, -2.0194839173657902e-27],
+    [0.0011697023068531775, 0.0004224006239318104, -2.0386743551521466e-11],
+    [0.0008307524999999999, 0.0003, 0.0],
+    [0.0005883392851084988, 0.00021246020909957124, 5.46261406284315e-12],
+    [0.00041537635, 0.00015, 1.8932661725304283e-28],
+    [0.00029319289646282786, 0.00010587728966990474, -1.4637126998511418e-12],
+    [0.00020754969999999998, 7.495e-05, -1.262177448353619e-28],
+    [0.00014656672904018992, 5.2927944720809845e-05, 3.922367365614171e-13],
+    [0.00010336915, 3.73285e-05, -1.3805065841367707e-29],
+    [7.276266237641246e-05, 2.62759314468559e-05, -1.0523424639452653e-13],
+]
+
+CCT_TABLE = {'range': (1000, 25000, 2048),
+             'max_error': 8.895741637759969e-08,
+             'xy': [
+    [0.25256641982761313, 0.25234131908790597],
+    [0.2527440858494533, 0.2525881517398868],
+    [0.2529224417035432, 0.25283569454539795],
+    [0.2531014872952348, 0.2530839444746799],
+    [0.25328122251175544, 0.253332898469094],
+    [0.2534616472222277, 0.25358255344137726],
+    [0.2536427612776913, 0.25383290627589766],
+    [0.25382456451112634, 0.2540839538289119],
+    [0.2540070567374773, 0.254335692928825],
+    [0.25419023775367994, 0.25458812037645356],
+    [0.2543741073386884, 0.2548412329452889],
+    [0.2545586652535041, 0.2550950273817646],
+    [0.2547439112412074, 0.2553495004055237],
+    [0.2549298450269881, 0.2556046487096908],
+    [0.2551164663181799, 0.2558604689611416],
+    [0.25530377480429567, 0.2561169578007794],
+    [0.25549177015706226, 0.2563741118438089],
+    [0.25568045203046014, 0.25663192768001536],
+    [0.2558698200607612, 0.25689040187404233],
+    [0.25605987386656975, 0.25714953096567283],
+    [0.2562506130488647, 0.2574093114701118],
+    [0.25644203719104247, 0.2576697398782696],
+    [0.25663414585896194, 0.25793081265704676],
+    [0.25682693860099015, 0.2581925262496214],
+    [0.2570204149480504, 0.2584548770757357],
+    [0.2572145744136697, 0.25871786153198645],
+    [0.25740941649402976, 0.2589814759921141],
+    [0.2576049406680181, 0.2592457168072948],
+    [0.25780114639727975, 0.2595105803064326],
+    [0.2579980331262722, 0.2597760627964527],
+    [0.25819560028231975, 0.2600421605625972],
+    [0.25839384727566994, 0.26030886986871854],
+    [0.25859277349955145, 0.2605761869575776],
+    [0.25879237833023133, 0.2608441080511396],
+    [0.2589926611270773, 0.2611126293508722],
+    [0.2591936212326169, 0.2613817470380448],
+    [0.25939525797260077, 0.261651457274027],
+    [0.259597570656065, 0.2619217562005881],
+    [0.2598005585753968, 0.2621926399401984],
+    [0.26000422100640036, 0.2624641045963294],
+    [0.2602085572083617, 0.2627361462537553],
+    [0.2604135664241183, 0.2630087609788545],
+    [0.2606192478801275, 0.263281944819912],
+    [0.2608256007865365, 0.26355569380742144],
+    [0.2610326243372529, 0.2638300039543869],
+    [0.2612403177100181, 0.26410487125662724],
+    [0.26144868006647826, 0.2643802916930778],
+    [0.26165771055226006, 0.2646562612260933],
+    [0.2618674082970453, 0.2649327758017514],
+    [0.26207777241464647, 0.2652098313501551],
+    [0.26228880200308385, 0.26548742378573625],
+    [0.2625004961446638, 0.2657655490075581],
+    [0.26271285390605703, 0.2660442028996173],
+    [0.2629258743383784, 0.26632338133114725],
+    [0.2631395564772674, 0.26660308015692],
+    [0.2633538993429702, 0.2668832952175478],
+    [0.26356890194042054, 0.26716402233978553],
+    [0.2637845632593243, 0.2674452573368308],
+    [0.2640008822742431, 0.2677269960086249],
+    [0.2642178579446777, 0.26800923414215444],
+    [0.26443548921515553, 0.26829196751174905],
+    [0.2646537750153151, 0.26857519187938184],
+    [0.26487271425999404, 0.26885890299496806],
+    [0.2650923058493173, 0.26914309659666275],
+    [0.265312548668784, 0.26942776841115773],
+    [0.2655334415893578, 0.2697129141539788],
+    [0.26575498346755677, 0.26999852952978104],
+    [0.2659771731455434, 0.27028461023264416],
+    [0.2662000094512157, 0.2705711519463667],
+    [0.2664234911982997, 0.27085815034475885],
+    [0.2666476171864409, 0.2711456010919354],
+    [0.26687238620129844, 0.2714334998426069],
+    [0.26709779701463715, 0.27172184224237],
+    [0.26732384838442325, 0.2720106239279971],
+    [0.26755053905491816, 0.2722998405277248],
+    [0.26777786775677415, 0.2725894876615408],
+    [0.26800583320712984, 0.27287956094147037],
+    [0.2682344341097064, 0.27317005597186134],
+    [0.26846366915490527, 0.27346096834966754],
+    [0.26869353701990384, 0.27375229366473214],
+    [0.26892403636875395, 0.2740440275000683],
+    [0.26915516585248084, 0.27433616543213896],
+    [0.2693869241091797, 0.27462870303113707],
+    [0.26961930976411697, 0.27492163586126117],
+    [0.26985232142982757, 0.2752149594809923],
+    [0.27008595770621635, 0.2755086694433691],
+    [0.27032021718065696, 0.2758027612962599],
+    [0.27055509842809283, 0.2760972305826355],
+    [0.27079060001113825, 0.27639207284083855],
+    [0.27102672048017845, 0.27668728360485295],
+    [0.271263458373472, 0.2769828584045709],
+    [0.2715008122172524, 0.2772787927660586],
+    [0.2717387805258289, 0.27757508221181987],
+    [0.2719773618016908, 0.27787172226106005],
+    [0.2722165545356069, 0.2781687084299451],
+    [0.27245635720673184, 0.27846603623186156],
+    [0.27269676828270545, 0.2787637011776752],
+    [0.2729377862197583, 0.27906169877598497],
+    [0.2731794094628138, 0.27936002453337844],
+    [0.2734216364455919, 0.27965867395468386],
+    [0.27366446559071306, 0.2799576425432215],
+    [0.273907895309801, 0.28025692580105094],
+    [0.2741519240035876, 0.28055651922922054],
+    [0.2743965500620162, 0.28085641832801084],
+    [0.27464177186434624, 0.28115661859717933],
+    [0.2748875877792566, 0.2814571155362012],
+    [0.2751339961649513, 0.28175790464451017],
+    [0.27538099536926136, 0.28205898142173574],
+    [0.2756285837297519, 0.28236034136794014],
+    [0.2758767595738251, 0.2826619799838518],
+    [0.2761255212188236, 0.2829638927710978],
+    [0.2763748669721374, 0.283266075232435],
+    [0.27662479513130633, 0.283568522871978],
+    [0.2768753039841249, 0.2838712311954257],
+    [0.2771263918087471, 0.28417419571028596],
+    [0.2773780568737903, 0.28447741192609904],
+    [0.27763029743843937, 0.2847808753546567],
+    [0.2778831117525519, 0.28508458151022315],
+    [0.2781364980567612, 0.28538852590974945],
+    [0.2783904545825804, 0.28569270407309016],
+    [0.27864497955250744, 0.28599711152321505],
+    [0.27890007118012794, 0.2863017437864206],
+    [0.2791557276702194, 0.2866065963925379],
+    [0.2794119472188545, 0.28691166487514014],
+    [0.27966872801350545, 0.28721694477174714],
+    [0.2799260682331453, 0.28752243162402763],
+    [0.2801839660483536, 0.2878281209780005],
+    [0.2804424196214175, 0.2881340083842328],
+    [0.280701427106436, 0.28844008939803717],
+    [0.2809609866494203, 0.2887463595796654],
+    [0.2812210963883998, 0.28905281449450165],
+    [0.28148175445352047, 0.28935944971325234],
+    [0.28174295896714957, 0.289666260812135],
+    [0.2820047080439761, 0.28997324337306446],
+    [0.2822669997911126, 0.29028039298383684],
+    [0.2825298323081966, 0.2905877052383119],
+    [0.2827932036874917, 0.2908951757365942],
+    [0.28305711201398753, 0.2912028000852095],
+    [0.28332155536550163, 0.29151057389728147],
+    [0.2835865318127785, 0.2918184927927067],
+    [0.2838520394195894, 0.2921265523983255],
+    [0.28411807624283353, 0.29243474834809224],
+    [0.28438464033263555, 0.2927430762832431],
+    [0.284651729732445, 0.2930515318524621],
+    [0.28491934247913653, 0.2933601107120444],
+    [0.28518747660310584, 0.29366880852605926],
+    [0.2854561301283692, 0.2939776209665083],
+    [0.2857253010726612, 0.2942865437134835],
+    [0.2859949874475311, 0.29459557245532403],
+    [0.28626518725844113, 0.29490470288876847],
+    [0.28653589850486183, 0.2952139307191073],
+    [0.28680711918036933, 0.29552325166033194],
+    [0.28707884727273997, 0.29583266143528303],
+    [0.287351080764048, 0.29614215577579533],
+    [0.28762381763075795, 0.2964517304228422],
+    [0.2878970558438214, 0.29676138112667627],
+    [0.28817079336877083, 0.2970711036469701],
+    [0.28844502816581225, 0.2973808937529528],
+    [0.2887197581899215, 0.2976907472235463],
+    [0.2889949813909341, 0.2980006598475004],
+    [0.28927069571364084, 0.29831062742352177],
+    [0.2895468990978772, 0.29862064576040653],
+    [0.2898235894786182, 0.29893071067716637],
+    [0.2901007647860673, 0.2992408180031559],
+    [0.29037842294574884, 0.2995509635781956],
+    [0.29065656187859784, 0.2998611432526955],
+    [0.29093517950105047, 0.30017135288777363],
+    [0.2912142737251337, 0.3004815883553766],
+    [0.29149384245855364, 0.30079184553839383],
+    [0.291773883604786, 0.30110212033077405],
+    [0.2920543950631623, 0.30141240863763796],
+    [0.2923353747289595, 0.30172270637538756],
+    [0.29261682049348564, 0.3020330094718178],
+    [0.2928987302441679, 0.3023433138662219],
+    [0.293181101864639, 0.30265361550949776],
+    [0.293463933234822, 0.30296391036425163],
+    [0.29374722223101696, 0.30327419440489994],
+    [0.2940309667259852, 0.30358446361776925],
+    [0.2943151645890336, 0.3038947140011951],
+    [0.2945998136860989, 0.30420494156561795],
+    [0.2948849118798318, 0.30451514233367893],
+    [0.2951704570296787, 0.30482531234031185],
+    [0.2954564469919646, 0.30513544763283623],
+    [0.2957428796199756, 0.305445544271045],
+    [0.29602975276404, 0.30575559832729415],
+    [0.2963170642716088, 0.3060656058865885],
+    [0.29660481198733707, 0.30637556304666613],
+    [0.2968929937531638, 0.3066854659180816],
+    [0.297181607408391, 0.3069953106242872],
+    [0.297470650789762, 0.3073050933017133],
+    [0.29776012173154154, 0.30761481009984504],
+    [0.29805001806559256, 0.30792445718130057],
+    [0.29834033762145373, 0.30823403072190436],
+    [0.2986310782264164, 0.30854352691076153],
+    [0.298922237705602, 0.3088529419503291],
+    [0.2992138138820363, 0.3091622720564868],
+    [0.2995058045767251, 0.30947151345860474],
+    [0.29979820760873094, 0.3097806623996113],
+    [0.30009102079524497, 0.3100897151360587],
+    [0.3003842419516625, 0.3103986679381864],
+    [0.3006778688916547, 0.3107075170899846],
+    [0.30097189942724356, 0.3110162588892546],
+    [0.30126633136887204, 0.31132488964767],
+    [0.3015611625254771, 0.3116334056908321],
+    [0.3018563907045607, 0.3119418033583296],
+    [0.3021520137122601, 0.3122500790037923],
+    [0.30244802935341886, 0.3125582289949461],
+    [0.30274443543165547, 0.312866249713664],
+    [0.3030412297494335, 0.3131741375560188],
+    [0.3033384101081298, 0.313481888932333],
+    [0.30363597430810224, 0.3137895002672261],
+    [0.30393392014875864, 0.31409696799966225],
+    [0.30423224542862215, 0.31440428858299624],
+    [0.30453094794539964, 0.31471145848501836],
+    [0.30483002549604604, 0.3150184741879966],
+    [0.30512947587683104, 0.3153253321887194],
+    [0.3054292968834041, 0.3156320289985359],
+    [0.30572948631085844, 0.3159385611433959],
+    [0.30603004195379585, 0.3162449251638867],
+    [0.3063309616063893, 0.31655111761527166],
+    [0.3066322430624463, 0.31685713506752494],
+    [0.3069338841154727, 0.31716297410536604],
+    [0.30723588255873185, 0.31746863132829345],
+    [0.30753823618530957, 0.31777410335061634],
+    [0.3078409427881725, 0.31807938680148595],
+    [0.3081440001602292, 0.3183844783249254],
+    [0.3084474060943915, 0.3186893745798578],
+    [0.3087511583836323, 0.31899407224013504],
+    [0.30905525482104573, 0.3192985679945625],
+    [0.30935969319990525, 0.3196028585469261],
+    [0.3096644713137212, 0.31990694061601554],
+    [0.30996958695629945, 0.3202108109356477],
+    [0.31027503792179795, 0.3205144662546893],
+    [0.3105808220047821, 0.3208179033370772],
+    [0.31088693700028347, 0.3211211189618393],
+    [0.3111933807038529, 0.3214241099231125],
+    [0.31150015091161687, 0.3217268730301626],
+    [0.31180724542033184, 0.32202940510739886],
+    [0.31211466202743826, 0.32233170299439234],
+    [0.31242239853111475, 0.3226337635458901],
+    [0.31273045273033107, 0.32293558363182856],
+    [0.31303882242490055, 0.3232371601373483],
+    [0.31334750541553247, 0.3235384899628053],
+    [0.3136564995038847, 0.3238395700237822],
+    [0.31396580249261347, 0.32414039725110033],
+    [0.31427541218542576, 0.3244409685908263],
+    [0.31458532638712916, 0.32474128100428357],
+    [0.31489554290368127, 0.32504133146805947],
+    [0.31520605954224057, 0.32534111697401],
+    [0.31551687411121404, 0.32564063452927045],
+    [0.3158279844203064, 0.3259398811562557],
+    [0.31613938828056826, 0.3262388538926684],
+    [0.31645108350444423, 0.3265375497915001],
+    [0.31676306790581976, 0.32683596592103636],
+    [0.31707533930006737, 0.3271340993648566],
+    [0.31738789550409474, 0.32743194722183677],
+    [0.3177007343363883, 0.3277295066061499],
+    [0.31801385361706147, 0.3280267746472646],
+    [0.31832725116789756, 0.32832374848994555],
+    [0.31864092481239575, 0.3286204252942509],
+    [0.3189548723758142, 0.3289168022355303],
+    [0.3192690916852151, 0.3292128765044213],
+    [0.3195835805695074, 0.329508645306846],
+    [0.3198983368594898, 0.32980410586400527],
+    [0.3202133583878933, 0.3300992554123764],
+    [0.3205286429894238, 0.33039409120370306],
+    [0.3208441885008035, 0.3306886105049921],
+    [0.32115999276081175, 0.3309828105985054],
+    [0.3214760536103276, 0.3312766887817514],
+    [0.321792368892368, 0.3315702423674771],
+    [0.3221089364521304, 0.33186346868365935],
+    [0.32242575413703056, 0.332156365073494],
+    [0.3227428197967426, 0.3324489288953869],
+    [0.3230601312832388, 0.3327411575229423],
+    [0.32337768645082654, 0.3330330483449515],
+    [0.3236954831561875, 0.33332459876538073],
+    [0.32401351925841565, 0.33361580620335896],
+    [0.3243317926190545, 0.33390666809316394],
+    [0.32465030110213317, 0.3341971818842096],
+    [0.3249690425742048, 0.33448734504103045],
+    [0.32528801490438114, 0.33477715504326844],
+    [0.32560721596436987, 0.33506660938565613],
+    [0.32592664362850954, 0.33535570557800165],
+    [0.3262462957738043, 0.3356444411451729],
+    [0.32656617027996004, 0.33593281362707944],
+    [0.3268862650294176, 0.3362208205786569],
+    [0.32720657790738766, 0.33650845956984765],
+    [0.32752710680188396, 0.33679572818558345],
+    [0.3278478496037574, 0.33708262402576694],
+    [0.3281688042067285, 0.3373691447052519],
+    [0.3284899685074206, 0.3376552878538245],
+    [0.32881134040539234, 0.3379410511161821],
+    [0.3291329178031684, 0.3382264321519142],
+    [0.3294546986062735, 0.33851142863548106],
+    [0.3297766807232618, 0.33879603825619237],
+    [0.33009886206574907, 0.3390802587181848],
+    [0.3304212405484429, 0.339364087740402],
+    [0.33074381408917336, 0.3396475230565705],
+    [0.3310665806089223, 0.33993056241517694],
+    [0.3313895380318549, 0.3402132035794464],
+    [0.33171268428534695, 0.3404954443273161],
+    [0.33203601730001603, 0.34077728245141464],
+    [0.3323595350097484, 0.3410587157590357],
+    [0.33268323535172845, 0.3413397420721142],
+    [0.3330071162664673, 0.3416203592271999],
+    [0.33333117569783016, 0.34190056507543515],
+    [0.3336554115930633, 0.34218035748252634],
+    [0.33397982190282294, 0.34245973432871835],
+    [0.3343044045812004, 0.34273869350877073],
+    [0.33462915758574996, 0.34301723293192854],
+    [0.33495407887751544, 0.3432953505218958],
+    [0.3352791664210549, 0.3435730442168097],
+    [0.33560441818446807, 0.343850311969212],
+    [0.33592983213942085, 0.3441271517460213],
+    [0.33625540626117106, 0.34440356152850565],
+    [0.3365811385285929, 0.3446795393122538],
+    [0.3369070269242024, 0.3449550831071472],
+    [0.3372330694341803, 0.3452301909373304],
+    [0.337559264048399, 0.34550486084118137],
+    [0.33788560876044305, 0.34577909087128506],
+    [0.33821210156763515, 0.34605287909440036],
+    [0.33853874047105864, 0.34632622359143217],
+    [0.3388655234755799, 0.34659912245740204],
+    [0.3391924485898728, 0.34687157380141487],
+    [0.3395195138264397, 0.3471435757466318],
+    [0.3398467172016345, 0.34741512643023786],
+    [0.34017405673568407, 0.3476862240034106],
+    [0.3405015304527107, 0.3479568666312906],
+    [0.34082913638075335, 0.34822705249294805],
+    [0.3411568725517888, 0.3484967797813522],
+    [0.34148473700175236, 0.34876604670334055],
+    [0.34181272777055965, 0.349034851479585],
+    [0.34214084290212593, 0.34930319234456136],
+    [0.3424690804443871, 0.34957106754651557],
+    [0.34279743844931965, 0.34983847534743245],
+    [0.3431259149729604, 0.3501054140230022],
+    [0.343454508075426, 0.35037188186258833],
+    [0.3437832158209322, 0.35063787716919353],
+    [0.34411203627781334, 0.3509033982594276],
+    [0.3444409675185409, 0.3511684434634733],
+    [0.3447700076197421, 0.3514330111250535],
+    [0.3450991546622187, 0.3516970996013968],
+    [0.34542840673096453, 0.3519607072632042],
+    [0.3457577619151843, 0.35222383249461603],
+    [0.346087218308311, 0.35248647369317515],
+    [0.34641677400802307, 0.35274862926979594],
+    [0.34674642711626247, 0.3530102976487281],
+    [0.34707617573925087, 0.3532714772675225],
+    [0.34740601798750737, 0.3535321665769963],
+    [0.34773595197586493, 0.35379236404119957],
+    [0.34806597582348653, 0.3540520681373779],
+    [0.3483960876538823, 0.35431127735594065],
+    [0.3487262855949246, 0.35456999020042246],
+    [0.3490565677788637, 0.3548282051874511],
+    [0.34938693234234564, 0.3550859208467099],
+    [0.34971737742642456, 0.3553431357209041],
+    [0.35004790117657975, 0.3555998483657238],
+    [0.35037850174273133, 0.35585605734980874],
+    [0.35070917727925377, 0.35611176125471355],
+    [0.35103992594499045, 0.3563669586748713],
+    [0.35137074590326983, 0.35662164821755693],
+    [0.3517016353219179, 0.3568758285028525],
+    [0.3520325923732735, 0.35712949816360967],
+    [0.35236361523420145, 0.3573826558454155],
+    [0.3526947020861069, 0.3576353002065547],
+    [0.35302585111494866, 0.35788742991797307],
+    [0.35335706051125165, 0.35813904366324273],
+    [0.35368832847012305, 0.3583901401385239],
+    [0.3540196531912607, 0.35864071805252984],
+    [0.3543510328789704, 0.3588907761264889],
+    [0.35468246574217527, 0.35914031309410893],
+    [0.3550139499944304, 0.3593893277015404],
+    [0.35534548385393444, 0.35963781870733835],
+    [0.3556770655435404, 0.3598857848824277],
+    [0.35600869329077023, 0.36013322501006456],
+    [0.3563403653278244, 0.3603801378857995],
+    [0.3566720798915947, 0.36062652231744124],
+    [0.357003835223675, 0.3608723771250196],
+    [0.3573356295703729, 0.3611177011407473],
+    [0.3576674611827211, 0.361362493208984],
+    [0.35799932831648734, 0.36160675218619853],
+    [0.3583312292321864, 0.36185047694093114],
+    [0.3586631621950905, 0.36209366635375695],
+    [0.3589951254752387, 0.36233631931724847],
+    [0.3593271173474487, 0.3625784347359378],
+    [0.3596591360913261, 0.36282001152628],
+    [0.35999117999127456, 0.36306104861661465],
+    [0.3603232473365058, 0.36330154494712896],
+    [0.3606553364210487, 0.36354149946982],
+    [0.3609874455437602, 0.3637809111484573],
+    [0.36131957300833295, 0.3640197789585451],
+    [0.361651717123306, 0.364258101887285],
+    [0.36198387620207295, 0.36449587893353813],
+    [0.3623160485628915, 0.36473310910778706],
+    [0.36264823252889167, 0.36496979143209907],
+    [0.36298042642808476, 0.36520592494008747],
+    [0.3633126285933722, 0.36544150867687414],
+    [0.36364483736255276, 0.3656765416990526],
+    [0.3639770510783328, 0.3659110230746485],
+    [0.36430926808833175, 0.36614495188308355],
+    [0.36464148674509195, 0.36637832721513686],
+    [0.3649737054060859, 0.3666111481729073],
+    [0.3653059224337238, 0.36684341386977515],
+    [0.3656381361953606, 0.3670751234303651],
+    [0.36597034506330495, 0.36730627599050747],
+    [0.3663025474148243, 0.36753687069720176],
+    [0.36663474163215326, 0.3677669067085768],
+    [0.3669669261025013, 0.36799638319385425],
+    [0.367299099218057, 0.3682252993333107],
+    [0.3676312593759975, 0.36845365431823873],
+    [0.367963404978494, 0.3686814473509097],
+    [0.3682955344327181, 0.3689086776445362],
+    [0.36862764615084714, 0.3691353444232333],
+    [0.3689597385500724, 0.36936144692198136],
+    [0.36929181005260403, 0.36958698438658694],
+    [0.36962385908567663, 0.3698119560736463],
+    [0.36995588408155555, 0.37003636125050704],
+    [0.3702878834775429, 0.3702601991952291],
+    [0.370619855715982, 0.3704834691965485],
+    [0.3709517992442638, 0.3707061705538382],
+    [0.37128371251483205, 0.3709283025770704],
+    [0.37161559398518756, 0.3711498645867794],
+    [0.37194744211789443, 0.3713708559140219],
+    [0.37227925538058415, 0.37159127590034197],
+    [0.37261103224596065, 0.3718111238977299],
+    [0.37294277119180524, 0.3720303992685865],
+    [0.37327447070098085, 0.37224910138568446],
+    [0.37360612926143644, 0.3724672296321307],
+    [0.37393774536621177, 0.37268478340132777],
+    [0.37426931751344056, 0.3729017620969374],
+    [0.37460084420635603, 0.37311816513284113],
+    [0.3749323239532936, 0.37333399193310374],
+    [0.3752637552676955, 0.3735492419319344],
+    [0.37559513666811445, 0.3737639145736491],
+    [0.3759264666782162, 0.3739780093126342],
+    [0.37625774382678545, 0.37419152561330565],
+    [0.3765889666477263, 0.37440446295007496],
+    [0.3769201336800678, 0.37461682080730835],
+    [0.3772512434679658, 0.37482859867929],
+    [0.37758229456070663, 0.3750397960701855],
+    [0.3779132855127106, 0.3752504124940023],
+    [0.37824421488353266, 0.37546044747455337],
+    [0.37857508123786854, 0.37566990054541866],
+    [0.37890588314555335, 0.3758787712499082],
+    [0.3792366191815681, 0.37608705914102347],
+    [0.3795672879260389, 0.3762947637814207],
+    [0.37989788796424107, 0.3765018847433732],
+    [0.38022841788660094, 0.3767084216087329],
+    [0.38055887628869767, 0.37691437396889377],
+    [0.38088926177126486, 0.3771197414247541],
+    [0.3812195729401939, 0.3773245235866781],
+    [0.3815498084065339, 0.37752872007445987],
+    [0.3818799667864946, 0.37773233051728416],
+    [0.3822100467014478, 0.3779353545536909],
+    [0.3825400467779277, 0.3781377918315367],
+    [0.38286996564763426, 0.3783396420079568],
+    [0.38319980194743225, 0.37854090474932844],
+    [0.38352955431935404, 0.37874157973123457],
+    [0.38385922141060014, 0.37894166663842416],
+    [0.38418880187353943, 0.3791411651647767],
+    [0.38451829436571183, 0.3793400750132642],
+    [0.3848476975498264, 0.37953839589591476],
+    [0.3851770100937644, 0.37973612753377345],
+    [0.3855062306705792, 0.3799332696568672],
+    [0.3858353579584953, 0.3801298220041667],
+    [0.3861643906409105, 0.380325784323549],
+    [0.38649332740639575, 0.3805211563717613],
+    [0.3868221669486943, 0.3807159379143827],
+    [0.3871509079667231, 0.3809101287257876],
+    [0.3874795491645717, 0.3811037285891095],
+    [0.38780808925150295, 0.38129673729620284],
+    [0.38813652694195233, 0.38148915464760635],
+    [0.3884648609555278, 0.38168098045250615],
+    [0.38879309001700857, 0.3818722145286996],
+    [0.3891212128563462, 0.3820628567025568],
+    [0.3894492282086631, 0.38225290680898505],
+    [0.3897771348142512, 0.3824423646913922],
+    [0.390104931418572, 0.38263123020164835],
+    [0.390432616772256, 0.38281950320005087],
+    [0.39076018963110076, 0.38300718355528623],
+    [0.3910876487560709, 0.38319427114439414],
+    [0.39141499291329535, 0.3833807658527311],
+    [0.39174222087406785, 0.38356666757393315],
+    [0.3920693314148449, 0.3837519762098787],
+    [0.39239632331724394, 0.3839366916706545],
+    [0.3927231953680431, 0.38412081387451535],
+    [0.39304994635917717, 0.38430434274785163],
+    [0.393376575087739, 0.3844872782251494],
+    [0.39370308035597534, 0.3846696202489561],
+    [0.39402946097128577, 0.38485136876984355],
+    [0.3943557157462218, 0.3850325237463712],
+    [0.39468184349848234, 0.3852130851450513],
+    [0.3950078430509139, 0.3853930529403102],
+    [0.3953337132315078, 0.385572427114454],
+    [0.3956594528733969, 0.38575120765763155],
+    [0.39598506081485435, 0.3859293945677998],
+    [0.3963105358992908, 0.38610698785068487],
+    [0.3966358769752506, 0.3862839875197484],
+    [0.3969610828964125, 0.38646039359614986],
+    [0.39728615252158256, 0.3866362061087121],
+    [0.39761108471469503, 0.3868114250938846],
+    [0.3979358783448063, 0.3869860505957071],
+    [0.39826053228609565, 0.38716008266577423],
+    [0.3985850454178583, 0.3873335213631998],
+    [0.3989094166245048, 0.3875063667545806],
+    [0.3992336447955573, 0.38767861891396127],
+    [0.39955772882564555, 0.3878502779227971],
+    [0.39988166761450444, 0.38802134386992054],
+    [0.40020546006696983, 0.38819181685150356],
+    [0.40052910509297524, 0.3883616969710232],
+    [0.4008526016075488, 0.3885309843392255],
+    [0.4011759485308082, 0.3886996790740903],
+    [0.4014991447879581, 0.38886778130079547],
+    [0.40182218930928615, 0.38903529115168195],
+    [0.4021450810301583, 0.38920220876621764],
+    [0.4024678188910159, 0.38936853429096235],
+    [0.4027904018373702, 0.3895342678795334],
+    [0.4031128288197999, 0.38969940969256867],
+    [0.40343509879394457, 0.3898639598976927],
+    [0.40375721072050347, 0.39002791866948094],
+    [0.404079163565228, 0.3901912861894248],
+    [0.40440095629891915, 0.3903540626458965],
+    [0.4047225878974224, 0.39051624823411435],
+    [0.40504405734162324, 0.39067784315610704],
+    [0.40536536361744163, 0.3908388476206801],
+    [0.405686505715829, 0.3909992618433787],
+    [0.40600748263276126, 0.3911590860464548],
+    [0.40632829336923576, 0.3913183204588324],
+    [0.406648936931265, 0.39147696531607074],
+    [0.40696941232987194, 0.39163502086033214],
+    [0.4072897185810851, 0.39179248734034533],
+    [0.40760985470593325, 0.3919493650113721],
+    [0.4079298197304397, 0.3921056541351724],
+    [0.4082496126856178, 0.3922613549799693],
+    [0.40856923260746486, 0.392416467820415],
+    [0.40888867853695576, 0.39257099293755693],
+    [0.40920794952004, 0.392724930618802],
+    [0.4095270446076333, 0.3928782811578837],
+    [0.40984596285561326, 0.39303104485482704],
+    [0.41016470332481414, 0.39318322201591477],
+    [0.4104832650810182, 0.3933348129536525],
+    [0.4108016471949541, 0.3934858179867354],
+    [0.4111198487422873, 0.3936362374400137],
+    [0.41143786880361544, 0.39378607164445906],
+    [0.41175570646446213, 0.3939353209371298],
+    [0.4120733608152709, 0.3940839856611383],
+    [0.4123908309513982, 0.3942320661656155],
+    [0.41270811597310847, 0.39437956280567876],
+    [0.41302521498556577, 0.39452647594239726],
+    [0.4133421270988294, 0.39467280594275794],
+    [0.41365885142784564, 0.3948185531796326],
+    [0.4139753870924427, 0.3949637180317441],
+    [0.41429173321732254, 0.3951083008836326],
+    [0.41460788893205536, 0.3952523021256226],
+    [0.41492385337107196, 0.39539572215378904],
+    [0.4152396256736579, 0.3955385613699234],
+    [0.41555520498394516, 0.39568082018150225],
+    [0.415870590450907, 0.39582249900165173],
+    [0.41618578122834876, 0.3959635982491169],
+    [0.4165007764749027, 0.3961041183482254],
+    [0.4168155753540198, 0.39624405972885735],
+    [0.4171301770339629, 0.3963834228264106],
+    [0.4174445806877988, 0.39652220808176836],
+    [0.41775878549339246, 0.3966604159412662],
+    [0.41807279063339736, 0.3967980468566594],
+    [0.41838659529524985, 0.3969351012850897],
+    [0.41870019867116137, 0.3970715796890529],
+    [0.4190135999581097, 0.39720748253636606],
+    [0.41932679835783265, 0.3973428103001349],
+    [0.41963979307681953, 0.397477563458722],
+    [0.41995258332630414, 0.3976117424957124],
+    [0.42026516832225597, 0.39774534789988364],
+    [0.4205775472853733, 0.39787838016517096],
+    [0.42088971944107484, 0.3980108397906367],
+    [0.4212016840194915, 0.3981427272804376],
+    [0.42151344025545845, 0.39827404314379244],
+    [0.4218249873885078, 0.39840478789494954],
+    [0.4221363246628592, 0.3985349620531561],
+    [0.42244745132741257, 0.39866456614262424],
+    [0.4227583666357394, 0.3987936006925005],
+    [0.42306906984607456, 0.39892206623683385],
+    [0.423379560221308, 0.39904996331454273],
+    [0.42368983702897645, 0.3991772924693848],
+    [0.42399989954125383, 0.39930405424992477],
+    [0.42430974703494506, 0.3994302492095015],
+    [0.42461937879147443, 0.39955587790619884],
+    [0.4249287940968801, 0.3996809409028121],
+    [0.42523799224180275, 0.39980543876681746],
+    [0.4255469725214786, 0.39992937207034046],
+    [0.4258557342357301, 0.40005274139012537],
+    [0.4261642766889563, 0.4001755473075023],
+    [0.4264725991901255, 0.40029779040835806],
+    [0.42678070105276494, 0.40041947128310335],
+    [0.42708858159495244, 0.4005405905266432],
+    [0.4273962401393076, 0.40066114873834474],
+    [0.4277036760129815, 0.4007811465220068],
+    [0.42801088854764985, 0.40090058448583],
+    [0.4283178770795013, 0.40101946324238447],
+    [0.42862464094923, 0.40113778340857875],
+    [0.4289311795020247, 0.40125554560563287],
+    [0.4292374920875618, 0.4013727504590431],
+    [0.4295435780599929, 0.4014893985985542],
+    [0.42984943677793874, 0.4016054906581282],
+    [0.4301550676044774, 0.40172102727591436],
+    [0.4304604699071347, 0.40183600909421885],
+    [0.4307656430578764, 0.40195043675947445],
+    [0.4310705864330975, 0.40206431092220984],
+    [0.43137529941361186, 0.4021776322370213],
+    [0.43167978138464475, 0.40229040136254],
+    [0.4319840317358204, 0.40240261896140544],
+    [0.4322880498611549, 0.40251428570023223],
+    [0.43259183515904415, 0.40262540224958226],
+    [0.4328953870322549, 0.40273596928393546],
+    [0.4331987048879164, 0.40284598748165823],
+    [0.43350178813750645, 0.4029554575249762],
+    [0.43380463619684645, 0.4030643800999416],
+    [0.43410724848608756, 0.4031727558964081],
+    [0.4344096244297023, 0.40328058560799773],
+    [0.4347117634564742, 0.4033878699320731],
+    [0.43501366499948774, 0.40349460956970873],
+    [0.4353153284961179, 0.403600805225661],
+    [0.43561675338802014, 0.4037064576083397],
+    [0.43591793912112026, 0.4038115674297786],
+    [0.43621888514560364, 0.40391613540560706],
+    [0.4365195909159063, 0.4040201622550205],
+    [0.4368200558907022, 0.40412364870075335],
+    [0.43712027953289506, 0.40422659546904743],
+    [0.4374202613096069, 0.40432900328962657],
+    [0.4377200006921677, 0.4044308728956658],
+    [0.438019497156105, 0.40453220502376397],
+    [0.4383187501811331, 0.4046330004139154],
+    [0.438617759251143, 0.4047332598094812],
+    [0.43891652385419133, 0.4048329839571613],
+    [0.43921504348248996, 0.4049321736069668],
+    [0.43951331763239504, 0.40503082951219],
+    [0.4398113458043971, 0.40512895242937935],
+    [0.44010912750310943, 0.4052265431183094],
+    [0.4404066622372577, 0.4053236023419536],
+    [0.4407039495196687, 0.40542013086645695],
+    [0.4410009888672605, 0.4055161294611073],
+    [0.4412977798010309, 0.40561159889830956],
+    [0.44159432184604624, 0.40570653995355643],
+    [0.44189061453143164, 0.4058009534054019],
+    [0.442186657390359, 0.4058948400354335],
+    [0.4424824499600359, 0.4059882006282456],
+    [0.44277799178169575, 0.4060810359714117],
+    [0.44307328240058586, 0.40617334685545775],
+    [0.4433683213659563, 0.4062651340738344],
+    [0.4436631082310492, 0.4063563984228914],
+    [0.44395764255308806, 0.40644714070184923],
+    [0.44425192389326534, 0.40653736171277316],
+    [0.4445459518167326, 0.40662706226054696],
+    [0.4448397258925881, 0.40671624315284544],
+    [0.4451332456938672, 0.40680490520010776],
+    [0.44542651079752904, 0.4068930492155129],
+    [0.4457195207844477, 0.40698067601495],
+    [0.4460122752393982, 0.40706778641699576],
+    [0.4463047737510473, 0.4071543812428857],
+    [0.4465970159119417, 0.40724046131648817],
+    [0.4468890013184959, 0.40732602746428037],
+    [0.4471807295709815, 0.4074110805153198],
+    [0.44747220027351536, 0.4074956213012203],
+    [0.44776341303404926, 0.4075796506561252],
+    [0.4480543674643566, 0.4076631694166827],
+    [0.4483450631800223, 0.40774617842201855],
+    [0.44863549980043177, 0.4078286785137118],
+    [0.4489256769487573, 0.40791067053576974],
+    [0.4492155942519485, 0.4079921553346015],
+    [0.4495052513407197, 0.40807313375899307],
+    [0.4497946478495393, 0.40815360666008216],
+    [0.4500837834166174, 0.4082335748913333],
+    [0.45037265768389384, 0.4083130393085129],
+    [0.45066127029702807, 0.40839200076966337],
+    [0.4509496209053847, 0.40847046013508054],
+    [0.4512377091620267, 0.4085484182672854],
+    [0.4515255347236984, 0.4086258760310021],
+    [0.4518130972508166, 0.40870283429313337],
+    [0.4521003964074588, 0.4087792939227345],
+    [0.45238743186135005, 0.4088552557909901],
+    [0.45267420328385344, 0.408930720771189],
+    [0.45296071034995683, 0.40900568973869983],
+    [0.45324695273826, 0.40908016357094934],
+    [0.45353293013096585, 0.40915414314739446],
+    [0.4538186422138666, 0.40922762934950047],
+    [0.45410408867633095, 0.4093006230607183],
+    [0.4543892692112951, 0.40937312516645746],
+    [0.454674183515249, 0.40944513655406517],
+    [0.45495883128822445, 0.40951665811280136],
+    [0.4552432122337842, 0.40958769073381546],
+    [0.4555273260590093, 0.409658235310123],
+    [0.4558111724744875, 0.4097282927365821],
+    [0.45609475119430093, 0.40979786390987016],
+    [0.45637806193601527, 0.40986694972846066],
+    [0.45666110442066626, 0.4099355510926],
+    [0.45694387837274936, 0.41000366890428486],
+    [0.45722638352020617, 0.41007130406723946],
+    [0.4575086195944145, 0.4101384574868903],
+    [0.4577905863301741, 0.4102051300703475],
+    [0.4580722834656963, 0.4102713227263786],
+    [0.45835371074259196, 0.4103370363653878],
+    [0.45863486790585845, 0.41040227189939266],
+    [0.4589157547038684, 0.41046703024200226],
+    [0.45919637088835735, 0.41053131230839485],
+    [0.45947671621441294, 0.4105951190152946],
+    [0.45975679044046097, 0.4106584512809505],
+    [0.460036593328254, 0.4107213100251149],
+    [0.46031612464286104, 0.4107836961690191],
+    [0.4605953841526527, 0.4108456106353542],
+    [0.460874371629291, 0.41090705434824765],
+    [0.4611530868477175, 0.41096802823324186],
+    [0.46143152958613937, 0.41102853321727345],
+    [0.4617096996260195, 0.4110885702286506],
+    [0.4619875967520633, 0.41114814019703183],
+    [0.4622652207522068, 0.41120724405340486],
+    [0.4625425714176045, 0.4112658827300658],
+    [0.46281964854261765, 0.41132405716059706],
+    [0.46309645192480187, 0.4113817682798472],
+    [0.4633729813648943, 0.41143901702390945],
+    [0.46364923666680413, 0.4114958043300999],
+    [0.4639252176375977, 0.41155213113693845],
+    [0.4642009240874868, 0.41160799838412765],
+    [0.46447635582981905, 0.41166340701253035],
+    [0.46475151268106185, 0.4117183579641521],
+    [0.46502639446079425, 0.41177285218211784],
+    [0.46530100099169297, 0.41182689061065225],
+    [0.46557533209951885, 0.4118804741950621],
+    [0.46584938761310807, 0.41193360388171174],
+    [0.46612316736435744, 0.4119862806180065],
+    [0.46639667118821354, 0.4120385053523708],
+    [0.46666989892266003, 0.41209027903422896],
+    [0.4669428504087062, 0.41214160261398525],
+    [0.4672155254903745, 0.4121924770430039],
+    [0.46748792401468836, 0.41224290327358937],
+    [0.46776004583166003, 0.4122928822589685],
+    [0.46803189079427954, 0.41234241495326734],
+    [0.4683034587585012, 0.412391502311496],
+    [0.46857474958323225, 0.41244014528952605],
+    [0.46884576313032034, 0.41248834484407376],
+    [0.4691164992645432, 0.41253610193267876],
+    [0.46938695785359397, 0.41258341751368616],
+    [0.46965713876807075, 0.41263029254622857],
+    [0.4699270418814649, 0.4126767279902049],
+    [0.47019666707014685, 0.4127227248062643],
+    [0.47046601421335776, 0.4127682839557846],
+    [0.47073508319319307, 0.41281340640085656],
+    [0.47100387389459397, 0.4128580931042633],
+    [0.4712723862053343, 0.4129023450294623],
+    [0.47154062001600766, 0.41294616314056837],
+    [0.4718085752200161, 0.4129895484023338],
+    [0.47207625171355927, 0.41303250178013096],
+    [0.4723436493956199, 0.41307502423993403],
+    [0.47261076816795416, 0.41311711674830165],
+    [0.47287760793507844, 0.4131587802723577],
+    [0.47314416860425784, 0.41320001577977555],
+    [0.47341045008549415, 0.4132408242387578],
+    [0.4736764522915136, 0.4132812066180213],
+    [0.47394217513775533, 0.41332116388677753],
+    [0.4742076185423596, 0.4133606970147164],
+    [0.4744727824261554, 0.41339980697198814],
+    [0.4747376667126483, 0.41343849472918714],
+    [0.4750022713280096, 0.4134767612573328],
+    [0.4752665962010636, 0.413514607527855],
+    [0.4755306412632763, 0.41355203451257505],
+    [0.47579440644874255, 0.4135890431836898],
+    [0.47605789169417556, 0.413625634513754],
+    [0.47632109693889335, 0.41366180947566517],
+    [0.4765840221248093, 0.41369756904264515],
+    [0.47684666719641805, 0.41373291418822383],
+    [0.4771090321007845, 0.41376784588622445],
+    [0.4773711167875325, 0.4138023651107451],
+    [0.477632921208833, 0.413836472836143],
+    [0.47789444531939135, 0.41387017003701854],
+    [0.47815568907643624, 0.4139034576882],
+    [0.478416652439708, 0.41393633676472613],
+    [0.4786773353714467, 0.41396880824183024],
+    [0.47893773783638066, 0.4140008730949259],
+    [0.47919785980171503, 0.41403253229958814],
+    [0.4794577012371182, 0.4140637868315424],
+    [0.4797172621147131, 0.41409463766664395],
+    [0.4799765424090629, 0.4141250857808659],
+    [0.4802355420971617, 0.4141551321502821],
+    [0.4804942611584203, 0.4141847777510519],
+    [0.4807526995746571, 0.41421402355940606],
+    [0.48101085733008503, 0.41424287055162995],
+    [0.4812687344112999, 0.4142713197040496],
+    [0.4815263308072697, 0.41429937199301603],
+    [0.4817836465093231, 0.41432702839489094],
+    [0.4820406815111362, 0.4143542898860315],
+    [0.48229743580872314, 0.4143811574427754],
+    [0.4825539094004232, 0.4144076320414274],
+    [0.48281010228689086, 0.4144337146582418],
+    [0.483066014471082, 0.41445940626941224],
+    [0.48332164595824395, 0.41448470785105396],
+    [0.48357699675590504, 0.4145096203791899],
+    [0.4838320668738605, 0.4145341448297382],
+    [0.4840868563241637, 0.41455828217849655],
+    [0.4843413651211131, 0.41458203340112776],
+    [0.4845955932812409, 0.414605399473148],
+    [0.4848495408233037, 0.4146283813699097],
+    [0.48510320776826865, 0.4146509800665908],
+    [0.48535659413930327, 0.41467319653817836],
+    [0.48560969996176445, 0.4146950317594578],
+    [0.4858625252631867, 0.41471648670499583],
+    [0.4861150700732711, 0.4147375623491303],
+    [0.4863673344238742, 0.4147582596659543],
+    [0.4866193183489959, 0.414778579629305],
+    [0.48687102188477016, 0.414798523212748],
+    [0.4871224450694517, 0.4148180913895662],
+    [0.48737358794340646, 0.41483728513274576],
+    [0.4876244505490995, 0.41485610541496315],
+    [0.4878750329310845, 0.4148745532085725],
+    [0.4881253351359924, 0.41489262948559297],
+    [0.4883753572125201, 0.41491033521769494],
+    [0.48862509921142067, 0.41492767137618825],
+    [0.4888745611854896, 0.41494463893201033],
+    [0.48912374318955676, 0.4149612388557116],
+    [0.4893726452804744, 0.41497747211744473],
+    [0.48962126751710605, 0.4149933396869517],
+    [0.48986960996031426, 0.4150088425335516],
+    [0.49011767267295236, 0.41502398162612886],
+    [0.49036545571985174, 0.41503875793311995],
+    [0.4906129591678114, 0.41505317242250256],
+    [0.4908601830855876, 0.41506722606178326],
+    [0.4911071275438814, 0.4150809198179855],
+    [0.49135379261533074, 0.41509425465763805],
+    [0.4916001783744965, 0.415107231546763],
+    [0.49184628489785365, 0.41511985145086433],
+    [0.4920921122637813, 0.41513211533491573],
+    [0.49233766055254885, 0.41514402416335056],
+    [0.4925829298463085, 0.4151555789000493],
+    [0.4928279202290834, 0.4151667805083282],
+    [0.4930726317867559, 0.41517762995092855],
+    [0.4933170646070598, 0.4151881281900051],
+    [0.49356121877956616, 0.41519827618711547],
+    [0.49380509439567566, 0.4152080749032084],
+    [0.4940486915486063, 0.4152175252986137],
+    [0.4942920103333846, 0.41522662833303076],
+    [0.49453505084683214, 0.415235384965518],
+    [0.4947778131875595, 0.4152437961544817],
+    [0.4950202974559509, 0.41525186285766646],
+    [0.49526250375415837, 0.41525958603214325],
+    [0.49550443218608775, 0.4152669666342999],
+    [0.49574608285739036, 0.4152740056198308],
+    [0.49598745587545173, 0.41528070394372596],
+    [0.4962285513493823, 0.41528706256026054],
+    [0.49646936939000613, 0.4152930824229857],
+    [0.4967099101098508, 0.41529876448471764],
+    [0.4969501736231375, 0.4153041096975285],
+    [0.4971901600457712, 0.4153091190127343],
+    [0.497429869495329, 0.4153137933808878],
+    [0.49766930209105154, 0.41531813375176757],
+    [0.4979084579538323, 0.4153221410743669],
+    [0.49814733720620746, 0.41532581629688603],
+    [0.498385939972345, 0.41532916036672224],
+    [0.4986242663780369, 0.415332174230459],
+    [0.49886231655068664, 0.4153348588338585],
+    [0.4991000906193004, 0.4153372151218502],
+    [0.4993375887144768, 0.4153392440385237],
+    [0.49957481096839806, 0.41534094652711717],
+    [0.4998117575148176, 0.41534232353001066],
+    [0.5000484284890525, 0.41534337598871507],
+    [0.500284824027973, 0.41534410484386386],
+    [0.500520944269992, 0.4153445110352043],
+    [0.5007567893550555, 0.4153445955015883],
+    [0.5009923594246336, 0.41534435918096385],
+    [0.5012276546217095, 0.41534380301036583],
+    [0.5014626750907712, 0.4153429279259079],
+    [0.5016974209778008, 0.4153417348627733],
+    [0.501931892430264, 0.4153402247552075],
+    [0.5021660895971031, 0.41533839853650806],
+    [0.502400012628725, 0.4153362571390176],
+    [0.5026336616769921, 0.41533380149411514],
+    [0.5028670368952135, 0.4153310325322072],
+    [0.5031001384381352, 0.41532795118272053],
+    [0.5033329664619297, 0.4153245583740935],
+    [0.5035655211241876, 0.4153208550337686],
+    [0.5037978025839077, 0.4153168420881834],
+    [0.5040298110014884, 0.4153125204627634],
+    [0.504261546538716, 0.4153078910819145],
+    [0.504493009358758, 0.41530295486901475],
+    [0.5047241996261527, 0.415297712746406],
+    [0.504955117506799, 0.41529216563538823],
+    [0.505185763167949, 0.4152863144562093],
+    [0.5054161367781967, 0.41528016012805996],
+    [0.5056462385074709, 0.4152737035690649],
+    [0.5058760685270239, 0.4152669456962753],
+    [0.5061056270094237, 0.415259887425663],
+    [0.5063349141285448, 0.4152525296721118],
+    [0.506563930059558, 0.4152448733494101],
+    [0.506792674978923, 0.41523691937024554],
+    [0.5070211490643779, 0.4152286686461961],
+    [0.5072493524949313, 0.4152201220877238],
+    [0.5074772854508519, 0.4152112806041682],
+    [0.5077049481136612, 0.415202145103739],
+    [0.507932340666123, 0.41519271649350964],
+    [0.5081594632922359, 0.41518299567940964],
+    [0.5083863161772234, 0.4151729835662196],
+    [0.5086128995075259, 0.4151626810575624],
+    [0.5088392134707904, 0.41515208905589907],
+    [0.5090652582558641, 0.41514120846252034],
+    [0.5092910340527832, 0.41513004017754107],
+    [0.5095165410527657, 0.41511858509989424],
+    [0.5097417794482022, 0.41510684412732346],
+    [0.5099667494326471, 0.41509481815637794],
+    [0.5101914512008103, 0.4150825080824063],
+    [0.510415884948548, 0.4150699147995492],
+    [0.5106400508728556, 0.41505703920073406],
+    [0.5108639491718565, 0.4150438821776701],
+    [0.5110875800447973, 0.41503044462083954],
+    [0.5113109436920349, 0.4150167274194959],
+    [0.5115340403150311, 0.4150027314616544],
+    [0.5117568701163446, 0.4149884576340876],
+    [0.5119794332996199, 0.4149739068223203],
+    [0.5122017300695809, 0.4149590799106233],
+    [0.5124237606320223, 0.41494397778200715],
+    [0.5126455251938006, 0.41492860131821846],
+    [0.5128670239628259, 0.4149129513997327],
+    [0.5130882571480553, 0.4148970289057494],
+    [0.5133092249594828, 0.4148808347141866],
+    [0.5135299276081308, 0.4148643697016766],
+    [0.5137503653060442, 0.4148476347435585],
+    [0.5139705382662794, 0.41483063071387627],
+    [0.5141904467028989, 0.41481335848537004],
+    [0.5144100908309619, 0.41479581892947337],
+    [0.5146294708665159, 0.4147780129163076],
+    [0.5148485870265889, 0.4147599413146774],
+    [0.5150674395291821, 0.4147416049920646],
+    [0.5152860285932617, 0.4147230048146244],
+    [0.5155043544387503, 0.4147041416471801],
+    [0.5157224172865194, 0.4146850163532193],
+    [0.5159402173583821, 0.4146656297948876],
+    [0.5161577548770843, 0.4146459828329849],
+    [0.516375030066298, 0.4146260763269613],
+    [0.5165920431506117, 0.41460591113491163],
+    [0.5168087943555251, 0.41458548811357154],
+    [0.5170252839074391, 0.414564808118313],
+    [0.5172415120336499, 0.4145438720031393],
+    [0.5174574789623402, 0.414522680620682],
+    [0.5176731849225713, 0.41450123482219575],
+    [0.5178886301442774, 0.4144795354575543],
+    [0.5181038148582561, 0.41445758337524635],
+    [0.5183187392961615, 0.414435379422371],
+    [0.5185334036904967, 0.4144129244446349],
+    [0.5187478082746061, 0.41439021928634695],
+    [0.518961953282669, 0.41436726479041525],
+    [0.5191758389496903, 0.4143440617983426],
+    [0.519389465511495, 0.4143206111502227],
+    [0.5196028332047196, 0.4142969136847373],
+    [0.5198159422668053, 0.4142729702391507],
+    [0.5200287929359902, 0.41424878164930795],
+    [0.5202413854513032, 0.4142243487496299],
+    [0.5204537200525549, 0.41419967237310973],
+    [0.5206657969803327, 0.4141747533513097],
+    [0.5208776164759911, 0.41414959251435834],
+    [0.5210891787816464, 0.4141241906909456],
+    [0.5213004841401692, 0.41409854870831986],
+    [0.5215115327951768, 0.41407266739228527],
+    [0.5217223249910264, 0.4140465475671981],
+    [0.5219328609728079, 0.4140201900559632],
+    [0.5221431409863377, 0.4139935956800305],
+    [0.5223531652781502, 0.4139667652593932],
+    [0.5225629340954925, 0.41393969961258253],
+    [0.5227724476863166, 0.41391239955666653],
+    [0.5229817062992721, 0.41388486590724705],
+    [0.5231907101837004, 0.4138570994784547],
+    [0.5233994595896274, 0.41382910108294796],
+    [0.5236079547677563, 0.4138008715319096],
+    [0.5238161959694613, 0.4137724116350437],
+    [0.5240241834467809, 0.4137437222005733],
+    [0.5242319174524112, 0.4137148040352365],
+    [0.524439398239698, 0.41368565794428563],
+    [0.5246466260626325, 0.41365628473148275],
+    [0.5248536011758419, 0.4136266851990982],
+    [0.525060323834586, 0.4135968601479071],
+    [0.5252667942947475, 0.4135668103771879],
+    [0.5254730128128275, 0.41353653668471885],
+    [0.5256789796459382, 0.4135060398667761],
+    [0.5258846950517965, 0.4134753207181311],
+    [0.5260901592887172, 0.4134443800320489],
+    [0.5262953726156077, 0.4134132186002842],
+    [0.5265003352919604, 0.4133818372130809],
+    [0.526705047577847, 0.41335023665916854],
+    [0.5269095097339119, 0.41331841772576117],
+    [0.5271137220213662, 0.413286381198554],
+    [0.5273176847019806, 0.41325412786172244],
+    [0.5275213980380803, 0.4132216584979195],
+    [0.527724862292538, 0.4131889738882731],
+    [0.5279280777287678, 0.41315607481238503],
+    [0.5281310446107192, 0.41312296204832955],
+    [0.5283337632028716, 0.4130896363726488],
+    [0.5285362337702257, 0.41305609856035463],
+    [0.528738456578301, 0.413022349384924],
+    [0.5289404318931274, 0.4129883896182977],
+    [0.5291421599812396, 0.41295422003087945],
+    [0.5293436411096712, 0.4129198413915335],
+    [0.5295448755459488, 0.41288525446758334],
+    [0.5297458635580861, 0.41285046002480935],
+    [0.529946605414578, 0.41281545882744847],
+    [0.5301471013843941, 0.412780251638191],
+    [0.5303473517369744, 0.4127448392181803],
+    [0.5305473567422214, 0.412709222327011],
+    [0.530747116670496, 0.4126734017227272],
+    [0.5309466317926106, 0.4126373781618216],
+    [0.5311459023798241, 0.41260115239923356],
+    [0.5313449287038359, 0.4125647251883486],
+    [0.5315437110367801, 0.4125280972809955],
+    [0.5317422496512199, 0.41249126942744696],
+    [0.531940544820142, 0.41245424237641704],
+    [0.5321385968169516, 0.41241701687506044],
+    [0.5323364059154654, 0.41237959366897114],
+    [0.5325339723899066, 0.4123419735021822],
+    [0.5327312965149014, 0.41230415711716256],
+    [0.5329283785654697, 0.4122661452548179],
+    [0.5331252188170226, 0.4122279386544896],
+    [0.5333218175453565, 0.41218953805395175],
+    [0.533518175026646, 0.4121509441894134],
+    [0.5337142915374403, 0.41211215779551436],
+    [0.5339101673546582, 0.41207317960532575],
+    [0.53410580275558, 0.4120340103503508],
+    [0.5343011980178454, 0.41199465076052066],
+    [0.534496353419446, 0.4119551015641959],
+    [0.5346912692387215, 0.4119153634881657],
+    [0.5348859457543533, 0.41187543725764614],
+    [0.5350803832453602, 0.41183532359628],
+    [0.5352745819910927, 0.4117950232261362],
+    [0.535468542271228, 0.41175453686770935],
+    [0.5356622643657649, 0.41171386523991815],
+    [0.5358557485550187, 0.4116730090601065],
+    [0.5360489951196159, 0.4116319690440415],
+    [0.5362420043404894, 0.41159074590591355],
+    [0.5364347764988738, 0.41154934035833535],
+    [0.5366273118762996, 0.4115077531123432],
+    [0.5368196107545892, 0.4114659848773938],
+    [0.5370116734158509, 0.4114240363613662],
+    [0.5372035001424746, 0.4113819082705605],
+    [0.5373950912171271, 0.41133960130969816],
+    [0.5375864469227467, 0.41129711618192005],
+    [0.5377775675425395, 0.4112544535887879],
+    [0.5379684533599715, 0.4112116142302846],
+    [0.5381591046587687, 0.41116859880481094],
+    [0.5383495217229082, 0.4111254080091894],
+    [0.538539704836615, 0.4110820425386601],
+    [0.5387296542843573, 0.4110385030868846],
+    [0.5389193703508424, 0.41099479034594183],
+    [0.5391088533210103, 0.410950905006332],
+    [0.539298103480031, 0.41090684775697306],
+    [0.5394871211132987, 0.41086261928520307],
+    [0.5396759065064269, 0.41081822027677894],
+    [0.5398644599452465, 0.4107736514158771],
+    [0.540052781715796, 0.41072891338509415],
+    [0.5402408721043235, 0.4106840068654448],
+    [0.5404287313972774, 0.4106389325363643],
+    [0.5406163598813031, 0.4105936910757082],
+    [0.5408037578432401, 0.410548283159751],
+    [0.5409909255701156, 0.4105027094631879],
+    [0.5411778633491411, 0.410456970659135],
+    [0.5413645714677081, 0.41041106741912836],
+    [0.5415510502133836, 0.4103650004131259],
+    [0.5417372998739053, 0.4103187703095062],
+    [0.5419233207371781, 0.4102723777750699],
+    [0.54210911309127, 0.41022582347503955],
+    [0.542294677224406, 0.4101791080730601],
+    [0.5424800134249665, 0.41013223223119954],
+    [0.5426651219814813, 0.41008519660994924],
+    [0.5428500031826258, 0.41003800186822376],
+    [0.5430346573172175, 0.40999064866336266],
+    [0.5432190846742105, 0.4099431376511298],
+    [0.5434032855426936, 0.4098954694857141],
+    [0.5435872602118839, 0.4098476448197314],
+    [0.5437710089711242, 0.4097996643042228],
+    [0.5439545321098783, 0.40975152858865704],
+    [0.5441378299177276, 0.40970323832093014],
+    [0.5443209026843662, 0.409654794147367],
+    [0.5445037506995981, 0.40960619671272125],
+    [0.544686374253332, 0.4095574466601764],
+    [0.5448687736355785, 0.40950854463134617],
+    [0.5450509491364458, 0.4094594912662751],
+    [0.5452329010461361, 0.40941028720344],
+    [0.54541462965494, 0.40936093307975113],
+    [0.5455961352532357, 0.4093114295305509],
+    [0.5457774181314831, 0.40926177718961715],
+    [0.5459584785802203, 0.4092119766891621],
+    [0.5461393168900601, 0.409162028659835],
+    [0.5463199333516867, 0.40911193373072113],
+    [0.5465003282558516, 0.4090616925293441],
+    [0.5466805018933689, 0.4090113056816662],
+    [0.5468604545551137, 0.4089607738120899],
+    [0.547040186532017, 0.40891009754345753],
+    [0.5472196981150621, 0.4088592774970541],
+    [0.547398989595282, 0.40880831429260683],
+    [0.5475780612637547, 0.4087572085482865],
+    [0.5477569134115997, 0.40870596088070993],
+    [0.5479355463299763, 0.40865457190493804],
+    [0.5481139603100775, 0.40860304223447996],
+    [0.5482921556431276, 0.408551372481293],
+    [0.5484701326203797, 0.4084995632557829],
+    [0.5486478915331106, 0.4084476151668068],
+    [0.5488254326726185, 0.40839552882167257],
+    [0.5490027563302197, 0.40834330482614073],
+    [0.5491798627972433, 0.408290943784427],
+    [0.5493567523650309, 0.4082384462992009],
+    [0.549533425324931, 0.408185812971589],
+    [0.5497098819682965, 0.4081330444011752],
+    [0.549886122586481, 0.408080141186003],
+    [0.5500621474708356, 0.4080271039225755],
+    [0.5502379569127066, 0.4079739332058578],
+    [0.550413551203431, 0.40792062962927755],
+    [0.5505889306343341, 0.4078671937847267],
+    [0.5507640954967252, 0.40781362626256307],
+    [0.550939046081896, 0.40775992765161084],
+    [0.5511137826811162, 0.4077060985391635],
+    [0.5512883055856311, 0.4076521395109838],
+    [0.5514626150866583, 0.4075980511513053],
+    [0.5516367114753844, 0.4075438340428346],
+    [0.5518105950429616, 0.407489488766753],
+    [0.5519842660805059, 0.40743501590271647],
+    [0.5521577248790926, 0.40738041602885855],
+    [0.5523309717297543, 0.4073256897217913],
+    [0.5525040069234779, 0.4072708375566068],
+    [0.5526768307512003, 0.40721586010687916],
+    [0.5528494435038075, 0.40716075794466533],
+    [0.5530218454721301, 0.40710553164050695],
+    [0.5531940369469411, 0.4070501817634324],
+    [0.5533660182189523, 0.40699470888095823],
+    [0.5535377895788126, 0.40693911355908985],
+    [0.5537093513171043, 0.40688339636232423],
+    [0.5538807037243404, 0.4068275578536513],
+    [0.5540518470909614, 0.4067715985945555],
+    [0.5542227817073335, 0.40671551914501763],
+    [0.5543935078637455, 0.4066593200635158],
+    [0.5545640258504054, 0.4066030019070278],
+    [0.554734335957437, 0.40654656523103394],
+    [0.5549044384748802, 0.4064900105895156],
+    [0.5550743336926857, 0.4064333385349601],
+    [0.5552440219007118, 0.40637654961836117],
+    [0.5554135033887242, 0.4063196443892204],
+    [0.5555827784463918, 0.4062626233955498],
+    [0.5557518473632841, 0.40620548718387295],
+    [0.555920710428868, 0.40614823629922764],
+    [0.5560893679325081, 0.4060908712851664],
+    [0.5562578201634598, 0.40603339268375915],
+    [0.5564260674108708, 0.40597580103559516],
+    [0.5565941099637752, 0.405918096879785],
+    [0.5567619481110935, 0.4058602807539611],
+    [0.5569295821416289, 0.4058023531942822],
+    [0.5570970123440653, 0.40574431473543177],
+    [0.5572642390069642, 0.40568616591062284],
+    [0.5574312624187624, 0.4056279072515993],
+    [0.5575980828677702, 0.40556953928863654],
+    [0.5577647006421687, 0.4055110625505445],
+    [0.5579311160300074, 0.4054524775646692],
+    [0.5580973293192013, 0.4053937848568952],
+    [0.5582633407975288, 0.4053349849516475],
+    [0.55842915075263, 0.4052760783718924],
+    [0.5585947594720038, 0.4052170656391408],
+    [0.5587601672430056, 0.40515794727344956],
+    [0.558925374352845, 0.40509872379342393],
+    [0.5590903810885838, 0.405039395716219],
+    [0.5592551877371337, 0.4049799635575425],
+    [0.5594197945852534, 0.40492042783165605],
+    [0.5595842019195472, 0.40486078905137757],
+    [0.5597484100264623, 0.4048010477280836],
+    [0.5599124191922876, 0.4047412043717107],
+    [0.5600762297031496, 0.40468125949075795],
+    [0.5602398418450119, 0.40462121359228986],
+    [0.5604032559036722, 0.4045610671819367],
+    [0.5605664721647617, 0.40450082076389715],
+    [0.5607294909137402, 0.4044404748409426],
+    [0.5608923124358962, 0.4043800299144157],
+    [0.5610549370163447, 0.4043194864842353],
+    [0.5612173649400234, 0.40425884504889736],
+    [0.5613795964916942, 0.4041981061054765],
+    [0.5615416319559364, 0.40413727014963063],
+    [0.5617034716171485, 0.40407633767560014],
+    [0.5618651157595446, 0.40401530917621176],
+    [0.5620265646671528, 0.4039541851428806],
+    [0.5621878186238132, 0.40389296606561215],
+    [0.5623488779131753, 0.4038316524330043],
+    [0.5625097428186975, 0.40377024473225],
+    [0.5626704136236436, 0.4037087434491386],
+    [0.5628308906110819, 0.4036471490680601],
+    [0.5629911740638834, 0.40358546207200435],
+    [0.5631512642647191, 0.4035236829425656],
+    [0.5633111614960584, 0.40346181215994475],
+    [0.5634708660401688, 0.4033998502029493],
+    [0.5636303781791108, 0.4033377975489992],
+    [0.563789698194739, 0.40327565467412585],
+    [0.5639488263686996, 0.40321342205297644],
+    [0.5641077629824283, 0.4031511001588147],
+    [0.5642665083171478, 0.4030886894635248],
+    [0.5644250626538672, 0.4030261904376126],
+    [0.5645834262733803, 0.4029636035502083],
+    [0.5647415994562633, 0.40290092926906823],
+    [0.5648995824828728, 0.402838168060578],
+    [0.5650573756333453, 0.40277532038975433],
+    [0.5652149791875936, 0.40271238672024745],
+    [0.5653723934253073, 0.40264936751434366],
+    [0.5655296186259502, 0.4025862632329673],
+    [0.5656866550687575, 0.40252307433568363],
+    [0.5658435030327367, 0.40245980128069986],
+    [0.5660001627966637, 0.40239644452487017],
+    [0.5661566346390818, 0.4023330045236948],
+    [0.5663129188383018, 0.40226948173132454],
+    [0.5664690156723972, 0.40220587660056356],
+    [0.5666249254192052, 0.40214218958286985],
+    [0.5667806483563258, 0.40207842112835795],
+    [0.5669361847611158, 0.40201457168580434],
+    [0.5670915349106941, 0.40195064170264466],
+    [0.5672466990819329, 0.4018866316249818],
+    [0.5674016775514626, 0.40182254189758276],
+    [0.5675564705956662, 0.40175837296388567],
+    [0.5677110784906786, 0.4016941252659998],
+    [0.5678655015123871, 0.40162979924470815],
+    [0.5680197399364276, 0.4015653953394708],
+    [0.5681737940381845, 0.40150091398842647],
+    [0.5683276640927889, 0.40143635562839525],
+    [0.5684813503751168, 0.4013717206948813],
+    [0.5686348531597887, 0.4013070096220753],
+    [0.5687881727211678, 0.4012422228428559],
+    [0.568941309333358, 0.4011773607887932],
+    [0.5690942632702031, 0.401112423890152],
+    [0.5692470348052858, 0.40104741257589177],
+    [0.5693996242119255, 0.40098232727367206],
+    [0.5695520317631787, 0.40091716840985137],
+    [0.5697042577318349, 0.4008519364094944],
+    [0.5698563023904177, 0.4007866316963701],
+    [0.5700081660111831, 0.40072125469295666],
+    [0.5701598488661175, 0.40065580582044275],
+    [0.570311351226937, 0.40059028549873116],
+    [0.5704626733650855, 0.40052469414644065],
+    [0.5706138155517353, 0.4004590321809076],
+    [0.5707647780577828, 0.400393300018191],
+    [0.5709155611538501, 0.4003274980730721],
+    [0.5710661651102835, 0.4002616267590584],
+    [0.5712165901971504, 0.40019568648838605],
+    [0.5713668366842397, 0.4001296776720226],
+    [0.5715169048410603, 0.400063600719669],
+    [0.5716667949368408, 0.3999974560397616],
+    [0.5718165072405264, 0.3999312440394763],
+    [0.5719660420207789, 0.3998649651247302],
+    [0.5721153995459769, 0.39979861970018316],
+    [0.5722645800842121, 0.399732208169242],
+    [0.5724135839032906, 0.3996657309340621],
+    [0.57256241127073, 0.39959918839554975],
+    [0.5727110624537588, 0.3995325809533664],
+    [0.5728595377193172, 0.399465909005928],
+    [0.573007837334053, 0.39939917295041044],
+    [0.5731559615643226, 0.39933237318275133],
+    [0.5733039106761899, 0.39926551009765154],
+    [0.5734516849354244, 0.3991985840885789],
+    [0.5735992846075005, 0.3991315955477707],
+    [0.5737467099575976, 0.39906454486623494],
+    [0.573893961250597, 0.39899743243375474],
+    [0.5740410387510833, 0.3989302586388895],
+    [0.5741879427233417, 0.3988630238689782],
+    [0.5743346734313575, 0.3987957285101418],
+    [0.574481231138816, 0.39872837294728525],
+    [0.5746276161091005, 0.39866095756410075],
+    [0.5747738286052918, 0.39859348274307055],
+    [0.5749198688901672, 0.3985259488654686],
+    [0.5750657372262, 0.3984583563113636],
+    [0.5752114338755588, 0.39839070545962124],
+    [0.5753569591001046, 0.39832299668790827],
+    [0.5755023131613936, 0.3982552303726924],
+    [0.5756474963206727, 0.398187406889247],
+    [0.575792508838881, 0.398119526611653],
+    [0.5759373509766469, 0.3980515899128026],
+    [0.5760820229942913, 0.3979835971643983],
+    [0.5762265251518213, 0.39791554873696017],
+    [0.5763708577089339, 0.3978474449998247],
+    [0.5765150209250122, 0.39777928632115],
+    [0.5766590150591272, 0.3977110730679164],
+    [0.5768028403700344, 0.39764280560593046],
+    [0.5769464971161756, 0.39757448429982645],
+    [0.5770899855556769, 0.3975061095130694],
+    [0.5772333059463464, 0.39743768160795856],
+    [0.5773764585456771, 0.397369200945628],
+    [0.5775194436108422, 0.39730066788605145],
+    [0.5776622613986981, 0.3972320827880426],
+    [0.5778049121657809, 0.3971634460092601],
+    [0.5779473961683067, 0.3970947579062079],
+    [0.5780897136621709, 0.3970260188342392],
+    [0.5782318649029485, 0.3969572291475587],
+    [0.5783738501458913, 0.3968883891992253],
+    [0.5785156696459286, 0.3968194993411541],
+    [0.5786573236576674, 0.3967505599241197],
+    [0.5787988124353891, 0.39668157129775855],
+    [0.578940136233052, 0.3966125338105715],
+    [0.5790812953042884, 0.39654344780992606],
+    [0.5792222899024047, 0.39647431364205954],
+    [0.5793631202803816, 0.39640513165208113],
+    [0.5795037866908712, 0.3963359021839757],
+    [0.5796442893861998, 0.3962666255806039],
+    [0.5797846286183647, 0.39619730218370747],
+    [0.5799248046390338, 0.39612793233390997],
+    [0.5800648176995468, 0.39605851637072015],
+    [0.5802046680509124, 0.3959890546325347],
+    [0.5803443559438094, 0.3959195474566406],
+    [0.580483881628586, 0.3958499951792165],
+    [0.5806232453552582, 0.39578039813533744],
+    [0.5807624473735098, 0.3957107566589766],
+    [0.5809014879326933, 0.3956410710830068],
+    [0.5810403672818265, 0.39557134173920455],
+    [0.5811790856695945, 0.39550156895825217],
+    [0.5813176433443484, 0.3954317530697396],
+    [0.5814560405541045, 0.395361894402168],
+    [0.5815942775465444, 0.395291993282952],
+    [0.5817323545690135, 0.3952220500384221],
+    [0.5818702718685222, 0.3951520649938272],
+    [0.5820080296917438, 0.39508203847333756],
+    [0.582145628285015, 0.3950119708000469],
+    [0.5822830678943357, 0.3949418622959752],
+    [0.5824203487653671, 0.3948717132820714],
+    [0.5825574711434333, 0.3948015240782155],
+    [0.5826944352735189, 0.39473129500322207],
+    [0.5828312414002701, 0.3946610263748418],
+    [0.5829678897679943, 0.39459071850976374],
+    [0.5831043806206578, 0.39452037172362014],
+    [0.5832407142018883, 0.3944499863309858],
+    [0.5833768907549717, 0.3943795626453834],
+    [0.583512910522854, 0.39430910097928423],
+    [0.5836487737481397, 0.3942386016441117],
+    [0.5837844806730912, 0.39416806495024376],
+    [0.5839200315396293, 0.3940974912070153],
+    [0.5840554265893331, 0.3940268807227203],
+    [0.5841906660634388, 0.393956233804615],
+    [0.5843257502028385, 0.39388555075892046],
+    [0.584460679248083, 0.39381483189082467],
+    [0.5845954534393784, 0.3937440775044848],
+    [0.5847300730165869, 0.39367328790303135],
+    [0.584864538219227, 0.3936024633885686],
+    [0.5849988492864723, 0.39353160426217887],
+    [0.5851330064571516, 0.3934607108239233],
+    [0.58526700996975, 0.39338978337284614],
+    [0.5854008600624052, 0.3933188222069765],
+    [0.5855345569729105, 0.3932478276233308],
+    [0.5856681009387135, 0.3931767999179152],
+    [0.5858014921969155, 0.3931057393857284],
+    [0.5859347309842714, 0.3930346463207642],
+    [0.5860678175371894, 0.392963521016014],
+    [0.5862007520917313, 0.3928923637634688],
+    [0.5863335348836115, 0.39282117485412243],
+    [0.5864661661481978, 0.3927499545779736],
+    [0.5865986461205094, 0.3926787032240292],
+    [0.5867309750352183, 0.39260742108030533],
+    [0.5868631531266495, 0.39253610843383113],
+    [0.5869951806287793, 0.3924647655706502],
+    [0.587127057775235, 0.392393392775825],
+    [0.5872587847992964, 0.39232199033343645],
+    [0.5873903619338947, 0.39225055852658935],
+    [0.5875217894116116, 0.3921790976374128],
+    [0.5876530674646803, 0.39210760794706406],
+    [0.587784196324985, 0.39203608973572973],
+    [0.5879151762240602, 0.39196454328262964],
+    [0.588046007393091, 0.391892968866018],
+    [0.5881766900629135, 0.39182136676318674],
+    [0.5883072244640138, 0.391749737250468],
+    [0.5884376108265277, 0.3916780806032363],
+    [0.5885678493802414, 0.39160639709591083],
+    [0.5886979403545913, 0.3915346870019579],
+    [0.5888278839786633, 0.3914629505938946],
+    [0.5889576804811921, 0.3913911881432899],
+    [0.589087330090564, 0.39131939992076664],
+    [0.5892168330348131, 0.39124758619600647],
+    [0.5893461895416231, 0.3911757472377501],
+    [0.5894753998383278, 0.39110388331379986],
+    [0.5896044641519096, 0.391031994691023],
+    [0.5897333827090003, 0.3909600816353541],
+    [0.58986215573588, 0.3908881444117973],
+    [0.589990783458479, 0.3908161832844281],
+    [0.590119266102376, 0.3907441985163965],
+    [0.5902476038927978, 0.39067219036993034],
+    [0.5903757970546216, 0.39060015910633483],
+    [0.5905038458123723, 0.3905281049859987],
+    [0.5906317503902235, 0.3904560282683934],
+    [0.5907595110119978, 0.39038392921207793],
+    [0.5908871279011668, 0.39031180807469923],
+    [0.5910146012808501, 0.3902396651129965],
+    [0.5911419313738165, 0.39016750058280214],
+    [0.5912691184024829, 0.3900953147390452],
+    [0.5913961625889149, 0.3900231078357525],
+    [0.5915230641548272, 0.3899508801260528],
+    [0.591649823321582, 0.38987863186217825],
+    [0.5917764403101914, 0.3898063632954655],
+    [0.5919029153413156, 0.38973407467636084],
+    [0.5920292486352626, 0.3896617662544202],
+    [0.5921554404119905, 0.38958943827831316],
+    [0.5922814908911043, 0.38951709099582466],
+    [0.5924074002918595, 0.38944472465385616],
+    [0.5925331688331587, 0.38937233949843086],
+    [0.5926587967335548, 0.38929993577469296],
+    [0.592784284211248, 0.38922751372691294],
+    [0.5929096314840878, 0.38915507359848756],
+    [0.5930348387695733, 0.3890826156319436],
+    [0.5931599062848513, 0.3890101400689393],
+    [0.5932848342467184, 0.38893764715026763],
+    [0.5934096228716204, 0.38886513711585824],
+    [0.5935342723756514, 0.38879261020477934],
+    [0.5936587829745552, 0.38872006665524095],
+    [0.5937831548837247, 0.38864750670459675],
+    [0.5939073883182026, 0.38857493058934606],
+    [0.5940314834926798, 0.3885023385451372],
+    [0.5941554406214979, 0.3884297308067688],
+    [0.5942792599186478, 0.3883571076081921],
+    [0.5944029415977695, 0.3882844691825149],
+    [0.5945264858721531, 0.38821181576200187],
+    [0.5946498929547392, 0.388139147578077],
+    [0.5947731630581176, 0.38806646486132806],
+    [0.5948962963945281, 0.3879937678415067],
+    [0.5950192931758613, 0.38792105674753125],
+    [0.5951421536136577, 0.38784833180748995],
+    [0.5952648779191089, 0.38777559324864186],
+    [0.5953874663030557, 0.3877028412974206],
+    [0.5955099189759909, 0.3876300761794353],
+    [0.595632236148058, 0.3875572981194736],
+    [0.5957544180290505, 0.3874845073415043],
+    [0.5958764648284142, 0.38741170406867853],
+    [0.595998376755245, 0.3873388885233335],
+    [0.5961201540182914, 0.38726606092699306],
+    [0.5962417968259529, 0.387193221500371],
+    [0.5963633053862804, 0.38712037046337394],
+    [0.5964846799069766, 0.38704750803510224],
+    [0.5966059205953971, 0.38697463443385266],
+    [0.5967270276585491, 0.38690174987712106],
+    [0.596848001303092, 0.3868288545816045],
+    [0.5969688417353382, 0.38675594876320335],
+    [0.5970895491612525, 0.3866830326370232],
+    [0.5972101237864524, 0.3866101064173777],
+    [0.5973305658162087, 0.3865371703177914],
+    [0.5974508754554461, 0.3864642245509991],
+    [0.5975710529087416, 0.38639126932895207],
+    [0.5976910983803262, 0.38631830486281743],
+    [0.5978110120740854, 0.3862453313629812],
+    [0.5979307941935582, 0.3861723490390507],
+    [0.5980504449419375, 0.38609935809985696],
+    [0.5981699645220714, 0.3860263587534561],
+    [0.5982893531364619, 0.3859533512071324],
+    [0.5984086109872667, 0.3858803356673998],
+    [0.5985277382762976, 0.38580731234000476],
+    [0.5986467352050225, 0.3857342814299276],
+    [0.5987656019745645, 0.38566124314138595],
+    [0.5988843387857025, 0.38558819767783553],
+    [0.5990029458388716, 0.3855151452419731],
+    [0.5991214233341616, 0.3854420860357394],
+    [0.5992397714713215, 0.3853690202603186],
+    [0.5993579904497547, 0.38529594811614387],
+    [0.5994760804685219, 0.3852228698028977],
+    [0.5995940417263418, 0.38514978551951384],
+    [0.5997118744215899, 0.3850766954641805],
+    [0.5998295787522988, 0.3850035998343418],
+    [0.5999471549161606, 0.38493049882669905],
+    [0.6000646031105235, 0.38485739263721613],
+    [0.6001819235323954, 0.38478428146111726],
+    [0.6002991163784432, 0.38471116549289214],
+    [0.6004161818449913, 0.3846380449262977],
+    [0.6005331201280242, 0.3845649199543592],
+    [0.6006499314231858, 0.3844917907693727],
+    [0.6007666159257793, 0.38441865756290766],
+    [0.6008831738307683, 0.384345520525809],
+    [0.6009996053327771, 0.38427237984819834],
+    [0.601115910626089, 0.3841992357194778],
+    [0.6012320899046499, 0.3841260883283298],
+    [0.6013481433620654, 0.3840529378627213],
+    [0.6014640711916033, 0.3839797845099046],
+    [0.6015798735861927, 0.38390662845641993],
+    [0.6016955507384245, 0.383833469888098],
+    [0.6018111028405525, 0.3837603089900601],
+    [0.6019265300844926, 0.38368714594672276],
+    [0.602041832661823, 0.38361398094179866],
+    [0.6021570107637862, 0.3835408141582977],
+    [0.6022720645812875, 0.3834676457785314],
+    [0.6023869943048953, 0.3833944759841125],
+    [0.6025018001248434, 0.3833213049559587],
+    [0.6026164822310285, 0.3832481328742942],
+    [0.6027310408130139, 0.3831749599186505],
+    [0.6028454760600253, 0.383101786267872],
+    [0.6029597881609555, 0.38302861210011324],
+    [0.6030739773043629, 0.38295543759284484],
+    [0.6031880436784708, 0.382882262922853],
+    [0.6033019874711695, 0.3828090882662438],
+    [0.6034158088700157, 0.3827359137984433],
+    [0.6035295080622326, 0.38266273969419995],
+    [0.6036430852347112, 0.38258956612758716],
+    [0.6037565405740102, 0.38251639327200526],
+    [0.603869874266355, 0.38244322130018366],
+    [0.6039830864976399, 0.3823700503841814],
+    [0.604096177453429, 0.38229688069539064],
+    [0.604209147318953, 0.3822237124045389],
+    [0.6043219962791131, 0.3821505456816899],
+    [0.6044347245184798, 0.3820773806962457],
+    [0.6045473322212936, 0.38200421761695],
+    [0.6046598195714661, 0.38193105661188714],
+    [0.604772186752577, 0.3818578978484889],
+    [0.6048844339478796, 0.3817847414935313],
+    [0.604996561340297, 0.38171158771314007],
+    [0.6051085691124244, 0.3816384366727906],
+    [0.6052204574465295, 0.3815652885373113],
+    [0.6053322265245511, 0.38149214347088506],
+    [0.6054438765281019, 0.3814190016370503],
+    [0.6055554076384667, 0.3813458631987051],
+    [0.605666820036605, 0.38127272831810594],
+    [0.6057781139031486, 0.3811995971568732],
+    [0.6058892894184043, 0.38112646987599025],
+    [0.6060003467623536, 0.38105334663580614],
+    [0.6061112861146524, 0.3809802275960391],
+    [0.606222107654632, 0.38090711291577606],
+    [0.6063328115612995, 0.3808340027534764],
+    [0.6064433980133378, 0.38076089726697254],
+    [0.6065538671891064, 0.3806877966134725],
+    [0.6066642192666413, 0.3806147009495625],
+    [0.6067744544236557, 0.3805416104312068],
+    [0.6068845728375408, 0.38046852521375185],
+    [0.6069945746853644, 0.3803954454519275],
+    [0.6071044601438741, 0.3803223712998472],
+    [0.6072142293894952, 0.38024930291101267],
+    [0.6073238825983324, 0.3801762404383132],
+    [0.6074334199461702, 0.3801031840340295],
+    [0.6075428416084717, 0.38003013384983425],
+    [0.6076521477603812, 0.379957090036795],
+    [0.6077613385767235, 0.37988405274537496],
+    [0.6078704142320043, 0.37981102212543527],
+    [0.6079793749004101, 0.3797379983262376],
+    [0.6080882207558107, 0.37966498149644434],
+    [0.6081969519717563, 0.3795919717841223],
+    [0.6083055687214804, 0.3795189693367437],
+    [0.6084140711778999, 0.3794459743011869],
+    [0.6085224595136146, 0.3793729868237405],
+    [0.6086307339009079, 0.379300007050103],
+    [0.6087388945117477, 0.3792270351253865],
+    [0.6088469415177862, 0.3791540711941171],
+    [0.6089548750903614, 0.37908111540023653],
+    [0.6090626954004952, 0.379008167887106],
+    [0.6091704026188967, 0.3789352287975054],
+    [0.6092779969159602, 0.3788622982736371],
+    [0.6093854784617675, 0.37878937645712624],
+    [0.6094928474260867, 0.3787164634890237],
+    [0.6096001039783735, 0.3786435595098076],
+    [0.6097072482877716, 0.3785706646593842],
+    [0.6098142805231133, 0.37849777907709065],
+    [0.6099212008529185, 0.3784249029016967],
+    [0.6100280094453974, 0.3783520362714061],
+    [0.6101347064684485, 0.3782791793238586],
+    [0.6102412920896615, 0.3782063321961308],
+    [0.6103477664763157, 0.3781334950247401],
+    [0.610454129795381, 0.37806066794564375],
+    [0.6105603822135194, 0.37798785109424227],
+    [0.6106665238970834, 0.37791504460538133],
+    [0.610772555012118, 0.3778422486133525],
+    [0.6108784757243608, 0.3777694632518954],
+    [0.6109842861992424, 0.3776966886541994],
+    [0.611089986601886, 0.3776239249529064],
+    [0.6111955770971095, 0.37755117228010937],
+    [0.6113010578494241, 0.3774784307673588],
+    [0.6114064290230363, 0.37740570054566014],
+    [0.6115116907818472, 0.37733298174547775],
+    [0.6116168432894534, 0.3772602744967363],
+    [0.6117218867091472, 0.3771875789288222],
+    [0.6118268212039178, 0.3771148951705849],
+    [0.6119316469364512, 0.3770422233503393],
+    [0.612036364069129, 0.37696956359586753],
+    [0.6121409727640327, 0.3768969160344195],
+    [0.6122454731829403, 0.3768242807927159],
+    [0.6123498654873291, 0.376751657996949],
+    [0.6124541498383743, 0.3766790477727851],
+    [0.6125583263969522, 0.37660645024536477],
+    [0.6126623953236374, 0.37653386553930646],
+    [0.6127663567787044, 0.3764612937787072],
+    [0.6128702109221307, 0.37638873508714255],
+    [0.6129739579135923, 0.37631618958767216],
+    [0.6130775979124684, 0.37624365740283766],
+    [0.6131811310778397, 0.3761711386546662],
+    [0.6132845575684892, 0.3760986334646717],
+    [0.6133878775429031, 0.3760261419538566],
+    [0.6134910911592711, 0.3759536642427128],
+    [0.6135941985754857, 0.37588120045122475],
+    [0.6136971999491453, 0.37580875069886904],
+    [0.613800095437551, 0.37573631510461825],
+    [0.6139028851977107, 0.3756638937869404],
+    [0.6140055693863373, 0.3755914868638021],
+    [0.6141081481598495, 0.3755190944526699],
+    [0.6142106216743726, 0.37544671667051077],
+    [0.6143129900857386, 0.37537435363379557],
+    [0.6144152535494875, 0.37530200545849896],
+    [0.6145174122208666, 0.37522967226010157],
+    [0.6146194662548317, 0.37515735415359236],
+    [0.6147214158060469, 0.37508505125346836],
+    [0.6148232610288862, 0.3750127636737384],
+    [0.614925002077433, 0.37494049152792314],
+    [0.6150266391054797, 0.37486823492905763],
+    [0.6151281722665313, 0.37479599398969143],
+    [0.615229601713802, 0.37472376882189196],
+    [0.6153309276002182, 0.3746515595372451],
+    [0.6154321500784179, 0.3745793662468568],
+    [0.6155332693007521, 0.3745071890613541],
+    [0.6156342854192838, 0.37443502809088836],
+    [0.6157351985857893, 0.3743628834451349],
+    [0.6158360089517596, 0.3742907552332952],
+    [0.615936716668399, 0.37421864356409884],
+    [0.6160373218866262, 0.3741465485458051],
+    [0.6161378247570756, 0.3740744702862038],
+    [0.6162382254300975, 0.3740024088926165],
+    [0.6163385240557568, 0.37393036447189965],
+    [0.6164387207838364, 0.37385833713044464],
+    [0.6165388157638352, 0.3737863269741798],
+    [0.6166388091449697, 0.3737143341085716],
+    [0.6167387010761746, 0.37364235863862655],
+    [0.616838491706102, 0.37357040066889285],
+    [0.6169381811831242, 0.37349846030346123],
+    [0.6170377696553314, 0.3734265376459668],
+    [0.6171372572705333, 0.37335463279959125],
+    [0.6172366441762617, 0.37328274586706167],
+    [0.6173359305197668, 0.37321087695065613],
+    [0.6174351164480212, 0.37313902615220174],
+    [0.6175342021077181, 0.3730671935730776],
+    [0.6176331876452738, 0.37299537931421606],
+    [0.6177320732068263, 0.3729235834761039],
+    [0.6178308589382365, 0.37285180615878405],
+    [0.617929544985089, 0.3727800474618573],
+    [0.6180281314926919, 0.37270830748448314],
+    [0.6181266186060776, 0.3726365863253816],
+    [0.6182250064700041, 0.37256488408283406],
+    [0.6183232952289538, 0.372493200854686],
+    [0.6184214850271347, 0.37242153673834694],
+    [0.6185195760084811, 0.3723498918307938],
+    [0.6186175683166547, 0.3722782662285691],
+    [0.6187154620950432, 0.3722066600277857],
+    [0.6188132574867623, 0.37213507332412693],
+    [0.618910954634656, 0.3720635062128471],
+    [0.6190085536812961, 0.3719919587887745],
+    [0.6191060547689844, 0.3719204311463117],
+    [0.6192034580397507, 0.37184892337943753],
+    [0.6193007636353561, 0.37177743558170745],
+    [0.6193979716972907, 0.37170596784625726],
+    [0.6194950823667765, 0.37163452026580146],
+    [0.619592095784766, 0.371563092932637],
+    [0.6196890120919442, 0.3714916859386433],
+    [0.6197858314287277, 0.3714202993752846],
+    [0.6198825539352657, 0.37134893333361024],
+    [0.6199791797514411, 0.3712775879042573],
+    [0.6200757090168698, 0.37120626317745115],
+    [0.6201721418709023, 0.3711349592430061],
+    [0.6202684784526231, 0.3710636761903289],
+    [0.6203647189008519, 0.3709924141084181],
+    [0.6204608633541441, 0.3709211730858666],
+    [0.6205569119507904, 0.3708499532108615],
+    [0.6206528648288189, 0.37077875457118753],
+    [0.6207487221259933, 0.3707075772542271],
+    [0.6208444839798156, 0.3706364213469612],
+    [0.6209401505275253, 0.37056528693597196],
+    [0.6210357219061, 0.3704941741074433],
+    [0.6211311982522562, 0.3704230829471623],
+    [0.6212265797024491, 0.37035201354052083],
+    [0.6213218663928742, 0.370280965972516],
+    [0.6214170584594672, 0.37020994032775245],
+    [0.6215121560379033, 0.3701389366904433],
+    [0.6216071592635997, 0.37006795514441165],
+    [0.621702068271715, 0.36999699577309086],
+    [0.6217968831971493, 0.369926058659528],
+    [0.6218916041745459, 0.36985514388638224],
+    [0.6219862313382901, 0.36978425153592903],
+    [0.6220807648225113, 0.3697133816900591],
+    [0.6221752047610823, 0.3696425344302812],
+    [0.6222695512876202, 0.36957170983772314],
+    [0.6223638045354872, 0.3695009079931323],
+    [0.6224579646377904, 0.36943012897687716],
+    [0.6225520317273827, 0.36935937286894976],
+    [0.6226460059368625, 0.3692886397489654],
+    [0.6227398873985767, 0.3692179296961644],
+    [0.6228336762446167, 0.369147242789414],
+    [0.6229273726068234, 0.36907657910720865],
+    [0.6230209766167852, 0.36900593872767173],
+    [0.6231144884058382, 0.36893532172855725],
+    [0.6232079081050687, 0.36886472818724986],
+    [0.623301235845311, 0.36879415818076783],
+    [0.62339447175715, 0.3687236117857624],
+    [0.6234876159709217, 0.3686530890785201],
+    [0.6235806686167114, 0.3685825901349643],
+    [0.623673629824356, 0.36851211503065556],
+    [0.6237664997234451, 0.36844166384079313],
+    [0.6238592784433193, 0.3683712366402167],
+    [0.6239519661130724, 0.36830083350340664],
+    [0.6240445628615509, 0.3682304545044861],
+    [0.6241370688173554, 0.3681600997172217],
+    [0.6242294841088398, 0.3680897692150251],
+    [0.6243218088641133, 0.36801946307095396],
+    [0.624414043211039, 0.36794918135771304],
+    [0.6245061872772362, 0.3678789241476558],
+    [0.6245982411900802, 0.3678086915127847],
+    [0.6246902050767017, 0.367738483524754],
+    [0.6247820790639889, 0.3676683002548692],
+    [0.6248738632785864, 0.3675981417740898],
+    [0.6249655578468979, 0.36752800815302805],
+    [0.6250571628950841, 0.3674578994619536],
+    [0.6251486785490641, 0.3673878157707919],
+    [0.6252401049345172, 0.36731775714912623],
+    [0.6253314421768812, 0.36724772366619896],
+    [0.6254226904013541, 0.3671777153909131],
+    [0.6255138497328947, 0.36710773239183253],
+    [0.6256049202962221, 0.367037774737184],
+    [0.6256959022158174, 0.3669678424948572],
+    [0.625786795615923, 0.3668979357324075],
+    [0.6258776006205437, 0.3668280545170557],
+    [0.6259683173534466, 0.3667581989156902],
+    [0.6260589459381629, 0.3666883689948669],
+    [0.6261494864979865, 0.3666185648208119],
+    [0.626239939155976, 0.3665487864594209],
+    [0.626330304034954, 0.3664790339762617],
+    [0.6264205812575084, 0.3664093074365751],
+    [0.6265107709459925, 0.36633960690527523],
+    [0.6266008732225254, 0.3662699324469516],
+    [0.6266908882089925, 0.3662002841258696],
+    [0.6267808160270458, 0.36613066200597205],
+    [0.6268706567981053, 0.3660610661508794],
+    [0.6269604106433577, 0.3659914966238927],
+    [0.6270500776837586, 0.3659219534879926],
+    [0.6271396580400319, 0.3658524368058413],
+    [0.6272291518326704, 0.36578294663978445],
+    [0.6273185591819364, 0.365713483051851],
+    [0.6274078802078625, 0.36564404610375467],
+    [0.6274971150302511, 0.36557463585689565],
+    [0.6275862637686761, 0.3655052523723607],
+    [0.6276753265424823, 0.36543589571092505],
+    [0.6277643034707863, 0.36536656593305267],
+    [0.6278531946724768, 0.3652972630988985],
+    [0.6279420002662153, 0.36522798726830813],
+    [0.6280307203704361, 0.36515873850082003],
+    [0.6281193551033476, 0.36508951685566604],
+    [0.6282079045829312, 0.3650203223917726],
+    [0.628296368926944, 0.36495115516776133],
+    [0.6283847482529166, 0.36488201524195074],
+    [0.6284730426781562, 0.36481290267235733],
+    [0.6285612523197441, 0.3647438175166964],
+    [0.6286493772945397, 0.36467475983238207],
+    [0.6287374177191779, 0.3646057296765302],
+    [0.6288253737100705, 0.36453672710595847],
+    [0.628913245383408, 0.36446775217718674],
+    [0.6290010328551573, 0.3643988049464398],
+    [0.6290887362410646, 0.36432988546964656],
+    [0.6291763556566549, 0.3642609938024425],
+    [0.629263891217233, 0.36419213000016937],
+    [0.6293513430378819, 0.3641232941178779],
+    [0.6294387112334663, 0.36405448621032654],
+    [0.6295259959186306, 0.36398570633198546],
+    [0.6296131972078006, 0.36391695453703454],
+    [0.6297003152151838, 0.3638482308793662],
+    [0.6297873500547688, 0.3637795354125862],
+    [0.6298743018403279, 0.3637108681900134],
+    [0.6299611706854146, 0.36364222926468287],
+    [0.6300479567033668, 0.36357361868934535],
+    [0.6301346600073052, 0.3635050365164685],
+    [0.6302212807101362, 0.3634364827982375],
+    [0.6303078189245483, 0.3633679575865577],
+    [0.6303942747630173, 0.3632994609330534],
+    [0.6304806483378029, 0.3632309928890706],
+    [0.6305669397609512, 0.3631625535056767],
+    [0.6306531491442947, 0.36309414283366287],
+    [0.6307392765994522, 0.363025760923543],
+    [0.63082532223783, 0.36295740782555647],
+    [0.6309112861706216, 0.3628890835896689],
+    [0.6309971685088088, 0.36282078826557207],
+    [0.631082969363162, 0.3627525219026857],
+    [0.6311686888442399, 0.3626842845501581],
+    [0.6312543270623908, 0.36261607625686776],
+    [0.6313398841277528, 0.36254789707142293],
+    [0.6314253601502541, 0.3624797470421643],
+    [0.6315107552396131, 0.3624116262171645],
+    [0.6315960695053401, 0.36234353464422964],
+    [0.6316813030567356, 0.3622754723709005],
+    [0.6317664560028933, 0.362207439444453],
+    [0.6318515284526979, 0.36213943591189907],
+    [0.6319365205148276, 0.3620714618199882],
+    [0.6320214322977534, 0.362003517215208],
+    [0.63210626390974, 0.3619356021437849],
+    [0.6321910154588464, 0.36186771665168493],
+    [0.6322756870529253, 0.361799860784616],
+    [0.6323602787996246, 0.36173203458802666],
+    [0.6324447908063874, 0.3616642381071092],
+    [0.6325292231804526, 0.36159647138679857],
+    [0.6326135760288549, 0.36152873447177486],
+    [0.632697849458426, 0.36146102740646324],
+    [0.6327820435757936, 0.3613933502350357],
+    [0.6328661584873839, 0.36132570300141076],
+    [0.63295019429942, 0.36125808574925555],
+    [0.6330341511179237, 0.36119049852198587],
+    [0.6331180290487154, 0.36112294136276785],
+    [0.6332018281974134, 0.3610554143145181],
+    [0.6332855486694374, 0.36098791741990466],
+    [0.6333691905700053, 0.3609204507213487],
+    [0.633452754004136, 0.3608530142610247],
+    [0.6335362390766491, 0.3607856080808608],
+    [0.633619645892165, 0.36071823222254124],
+    [0.6337029745551053, 0.3606508867275059],
+    [0.6337862251696946, 0.36058357163695104],
+    [0.633869397839959, 0.36051628699183175],
+    [0.6339524926697273, 0.3604490328328611],
+    [0.6340355097626321, 0.3603818092005116],
+    [0.634118449222109, 0.3603146161350169],
+    [0.6342013111513974, 0.36024745367637084],
+    [0.6342840956535417, 0.3601803218643301],
+    [0.6343668028313909, 0.3601132207384139],
+    [0.6344494327875987, 0.3600461503379057],
+    [0.6345319856246255, 0.3599791107018524],
+    [0.6346144614447364, 0.3599121018690681],
+    [0.6346968603500039, 0.3598451238781317],
+    [0.6347791824423067, 0.35977817676739043],
+    [0.6348614278233313, 0.3597112605749584],
+    [0.6349435965945716, 0.35964437533871924],
+    [0.6350256888573291, 0.3595775210963258],
+    [0.6351077047127145, 0.35951069788520196],
+    [0.6351896442616471, 0.3594439057425421],
+    [0.6352715076048553, 0.3593771447053132],
+    [0.6353532948428772, 0.3593104148102552],
+    [0.6354350060760608, 0.3592437160938817],
+    [0.6355166414045647, 0.35917704859248084],
+    [0.6355982009283585, 0.35911041234211566],
+    [0.6356796847472229, 0.35904380737862635],
+    [0.6357610929607502, 0.35897723373762946],
+    [0.6358424256683454, 0.3589106914545187],
+    [0.6359236829692244, 0.3588441805644681],
+    [0.6360048649624179, 0.358777701102429],
+    [0.6360859717467684, 0.35871125310313473],
+    [0.6361670034209326, 0.3586448366010982],
+    [0.6362479600833809, 0.35857845163061497],
+    [0.6363288418323988, 0.35851209822576297],
+    [0.6364096487660859, 0.3584457764204028],
+    [0.6364903809823577, 0.35837948624818033],
+    [0.6365710385789441, 0.3583132277425255],
+    [0.6366516216533925, 0.3582470009366541],
+    [0.636732130303066, 0.35818080586356826],
+    [0.6368125646251444, 0.3581146425560574],
+    [0.6368929247166244, 0.3580485110466993],
+    [0.636973210674321, 0.35798241136786024],
+    [0.637053422594867, 0.3579163435516956],
+    [0.6371335605747126, 0.357850307630152],
+    [0.6372136247101279, 0.3577843036349661],
+    [0.6372936150972012, 0.3577183315976673],
+    [0.6373735318318413, 0.3576523915495769],
+    [0.6374533750097763, 0.35758648352180933],
+    [0.6375331447265543, 0.357520607545274],
+    [0.6376128410775441, 0.3574547636506746],
+    [0.6376924641579363, 0.35738895186851044],
+    [0.637772014062742, 0.357323172229077],
+    [0.6378514908867948, 0.3572574247624668],
+    [0.6379308947247501, 0.3571917094985707],
+    [0.6380102256710857, 0.3571260264670777],
+    [0.6380894838201029, 0.3570603756974757],
+    [0.6381686692659261, 0.35699475721905316],
+    [0.6382477821025027, 0.35692917106089944],
+    [0.6383268224236054, 0.35686361725190446],
+    [0.6384057903228304, 0.3567980958207615],
+    [0.6384846858935993, 0.35673260679596575],
+    [0.6385635092291587, 0.3566671502058167],
+    [0.6386422604225811, 0.3566017260784173],
+    [0.6387209395667639, 0.3565363344416767],
+    [0.6387995467544323, 0.35647097532330946],
+    [0.6388780820781375, 0.3564056487508359],
+    [0.6389565456302572, 0.35634035475158493],
+    [0.6390349375029979, 0.3562750933526916],
+    [0.639113257788393, 0.35620986458110127],
+    [0.639191506578304, 0.3561446684635676],
+    [0.6392696839644216, 0.356079505026655],
+    [0.6393477900382654, 0.3560143742967373],
+    [0.6394258248911836, 0.3559492763000012],
+    [0.6395037886143549, 0.35588421106244483],
+    [0.6395816812987876, 0.35581917860987894],
+    [0.6396595030353203, 0.3557541789679284],
+    [0.6397372539146227, 0.3556892121620318],
+    [0.6398149340271958, 0.35562427821744247],
+    [0.6398925434633718, 0.35555937715922964],
+    [0.639970082313315, 0.35549450901227847],
+    [0.6400475506670215, 0.35542967380129137],
+    [0.6401249486143202, 0.3553648715507881],
+    [0.6402022762448741, 0.3553001022851061],
+    [0.6402795336481777, 0.3552353660284033],
+    [0.6403567209135602, 0.3551706628046556],
+    [0.6404338381301851, 0.3551059926376599],
+    [0.6405108853870497, 0.3550413555510339],
+    [0.6405878627729863, 0.3549767515682172],
+    [0.6406647703766626, 0.3549121807124709],
+    [0.6407416082865814, 0.3548476430068801],
+    [0.6408183765910813, 0.35478313847435244],
+    [0.6408950753783382, 0.35471866713762024],
+    [0.6409717047363629, 0.35465422901924076],
+    [0.6410482647530046, 0.3545898241415967],
+    [0.6411247555159488, 0.35452545252689655],
+    [0.6412011771127191, 0.35446111419717646],
+    [0.6412775296306767, 0.3543968091742994],
+    [0.6413538131570222, 0.3543325374799563],
+    [0.6414300277787935, 0.3542682991356676],
+    [0.6415061735828685, 0.3542040941627825],
+    [0.6415822506559639, 0.35413992258248045],
+    [0.6416582590846373, 0.3540757844157712],
+    [0.6417341989552845, 0.3540116796834963],
+    [0.6418100703541435, 0.353947608406329],
+    [0.6418858733672921, 0.3538835706047752],
+    [0.6419616080806496, 0.35381956629917394],
+    [0.6420372745799772, 0.3537555955096974],
+    [0.6421128729508772, 0.35369165825635307],
+    [0.6421884032787945, 0.35362775455898326],
+    [0.6422638656490165, 0.3535638844372658],
+    [0.6423392601466734, 0.35350004791071465],
+    [0.6424145868567387, 0.3534362449986807],
+    [0.6424898458640295, 0.35337247572035285],
+    [0.6425650372532067, 0.35330874009475727],
+    [0.6426401611087755, 0.35324503814075964],
+    [0.6427152175150862, 0.3531813698770641],
+    [0.642790206556333, 0.35311773532221535],
+    [0.6428651283165557, 0.3530541344945988],
+    [0.642939982879641, 0.3529905674124401],
+    [0.6430147703293198, 0.3529270340938074],
+    [0.6430894907491701, 0.3528635345566108],
+    [0.6431641442226165, 0.3528000688186034],
+    [0.6432387308329306, 0.35273663689738183],
+    [0.6433132506632314, 0.3526732388103867],
+    [0.6433877037964854, 0.3526098745749034],
+    [0.6434620903155069, 0.3525465442080626],
+    [0.6435364103029586, 0.35248324772684064],
+    [0.643610663841352, 0.3524199851480608],
+    [0.643684851013048, 0.3523567564883922],
+    [0.6437589719002558, 0.352293561764353],
+    [0.6438330265850347, 0.3522304009923088],
+    [0.6439070151492947, 0.35216727418847377],
+    [0.6439809376747953, 0.35210418136891153],
+    [0.6440547942431462, 0.35204112254953607],
+    [0.6441285849358098, 0.3519780977461108],
+    [0.6442023098340977, 0.3519151069742514],
+    [0.6442759690191745, 0.3518521502494242],
+    [0.6443495625720569, 0.35178922758694753],
+    [0.6444230905736121, 0.3517263390019939],
+    [0.6444965531045621, 0.35166348450958734],
+    [0.644569950245481, 0.3516006641246066],
+    [0.6446432820767956, 0.3515378778617846],
+    [0.6447165486787869, 0.3514751257357091],
+    [0.6447897501315896, 0.3514124077608239],
+    [0.6448628865151929, 0.35134972395142805],
+    [0.6449359579094401, 0.3512870743216775],
+    [0.6450089643940297, 0.35122445888558557],
+    [0.6450819060485149, 0.3511618776570234],
+    [0.6451547829523052, 0.35109933064971943],
+    [0.6452275951846657, 0.35103681787726165],
+    [0.645300342824717, 0.3509743393530975],
+    [0.6453730259514372, 0.3509118950905336],
+    [0.6454456446436602, 0.3508494851027373],
+    [0.6455181989800775, 0.35078710940273694],
+    [0.6455906890392381, 0.3507247680034218],
+    [0.6456631148995488, 0.3506624609175442],
+    [0.6457354766392737, 0.3506001881577181],
+    [0.6458077743365364, 0.3505379497364205],
+    [0.6458800080693184, 0.350475745665992],
+    [0.6459521779154603, 0.3504135759586381],
+    [0.6460242839526626, 0.3503514406264275],
+    [0.6460963262584841, 0.35028933968129544],
+    [0.646168304910345, 0.35022727313504143],
+    [0.6462402199855254, 0.3501652409993322],
+    [0.6463120715611645, 0.3501032432857009],
+    [0.6463838597142647, 0.3500412800055476],
+    [0.6464555845216877, 0.34997935117014034],
+    [0.6465272460601581, 0.34991745679061487],
+    [0.6465988444062605, 0.3498555968779768],
+    [0.6466703796364437, 0.3497937714430992],
+    [0.6467418518270174, 0.34973198049672677],
+    [0.6468132610541542, 0.34967022404947334],
+    [0.6468846073938904, 0.3496085021118234],
+    [0.6469558909221249, 0.3495468146941331],
+    [0.6470271117146209, 0.34948516180663053],
+    [0.6470982698470049, 0.34942354345941506],
+    [0.6471693653947677, 0.3493619596624599],
+    [0.6472403984332649, 0.34930041042561094],
+    [0.6473113690377168, 0.3492388957585874],
+    [0.647382277283209, 0.3491774156709836],
+    [0.647453123244692, 0.34911597017226775],
+    [0.6475239069969828, 0.3490545592717838],
+    [0.6475946286147639, 0.3489931829787508],
+    [0.6476652881725842, 0.34893184130226484],
+    [0.6477358857448591, 0.3488705342512974],
+    [0.6478064214058713, 0.3488092618346983],
+    [0.6478768952297703, 0.3487480240611938],
+    [0.6479473072905737, 0.3486868209393893],
+    [0.648017657662166, 0.34862565247776806],
+    [0.6480879464183009, 0.3485645186846924],
+    [0.6481581736325996, 0.34850341956840436],
+    [0.648228339378552, 0.34844235513702615],
+    [0.6482984437295181, 0.3483813253985593],
+    [0.6483684867587255, 0.34832033036088783],
+    [0.6484384685392726, 0.34825937003177604],
+    [0.648508389144127, 0.3481984444188703],
+    [0.6485782486461272, 0.34813755352969916],
+    [0.6486480471179816, 0.34807669737167435],
+    [0.6487177846322689, 0.34801587595209044],
+    [0.6487874612614397, 0.3479550892781252],
+    [0.6488570770778149, 0.3478943373568421],
+    [0.6489266321535885, 0.3478336201951873],
+    [0.6489961265608248, 0.34777293779999296],
+    [0.649065560371461, 0.3477122901779771],
+    [0.6491349336573065, 0.3476516773357429],
+    [0.6492042464900437, 0.34759109927978016],
+    [0.6492734989412278, 0.34753055601646576],
+    [0.6493426910822873, 0.34747004755206345],
+    [0.6494118229845246, 0.347409573892725],
+    [0.6494808947191157, 0.34734913504449016],
+    [0.6495499063571105, 0.3472887310132875],
+    [0.6496188579694336, 0.34722836180493466],
+    [0.6496877496268845, 0.3471680274251385],
+    [0.6497565814001369, 0.3471077278794963],
+    [0.6498253533597411, 0.3470474631734946],
+    [0.6498940655761215, 0.3469872333125122],
+    [0.6499627181195788, 0.3469270383018182],
+    [0.6500313110602906, 0.34686687814657363],
+    [0.6500998444683097, 0.3468067528518313],
+    [0.6501683184135665, 0.3467466624225372],
+    [0.6502367329658673, 0.34668660686352953],
+    [0.6503050881948967, 0.34662658617954034],
+    [0.6503733841702161, 0.3465666003751952],
+    [0.6504416209612646, 0.3465066494550143],
+    [0.6505097986373596, 0.3464467334234121],
+    [0.6505779172676966, 0.34638685228469807],
+    [0.6506459769213504, 0.3463270060430773],
+    [0.6507139776672732, 0.346267194702651],
+    [0.6507819195742975, 0.3462074182674162],
+    [0.6508498027111347, 0.3461476767412671],
+    [0.6509176271463755, 0.3460879701279952],
+    [0.6509853929484913, 0.3460282984312886],
+    [0.6510531001858337, 0.34596866165473394],
+    [0.6511207489266334, 0.345909059801817],
+    [0.6511883392390035, 0.345849492875921],
+    [0.6512558711909373, 0.345789960880329],
+    [0.6513233448503087, 0.3457304638182238],
+    [0.6513907602848747, 0.3456710016926877],
+    [0.6514581175622726, 0.3456115745067042],
+    [0.6515254167500225, 0.3455521822631562],
+    [0.6515926579155263, 0.34549282496482947],
+    [0.6516598411260696, 0.3454335026144099],
+    [0.6517269664488191, 0.3453742152144864],
+    [0.6517940339508259, 0.3453149627675499],
+    [0.6518610436990242, 0.3452557452759938],
+    [0.6519279957602314, 0.34519656274211524],
+    [0.651994890201149, 0.34513741516811447],
+    [0.652061727088363, 0.3450783025560957],
+    [0.6521285064883431, 0.3450192249080679],
+    [0.6521952284674444, 0.3449601822259441],
+    [0.6522618930919059, 0.34490117451154345],
+    [0.6523285004278532, 0.34484220176658914],
+    [0.6523950505412959, 0.34478326399271125],
+    [0.6524615434981299, 0.34472436119144656],
+    [0.6525279793641374, 0.3446654933642372],
+    [0.6525943582049861, 0.3446066605124331],
+    [0.6526606800862306, 0.3445478626372915],
+    [0.6527269450733116, 0.3444890997399776],
+]}
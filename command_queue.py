@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+import time
+import threading
+
+'''
+    Coalescing command queue in front of light_source.set_light.
+
+    CommandQueue.set_light returns immediately. A worker thread applies the newest
+    requested state once the device is ready: updates equal to the state already
+    applied (or about to be) are dropped, bursts collapse to their latest state (and
+    are dropped when that is the applied state again), and commands are spaced to the
+    device's maximum command rate. Luminance is capped to 1.0 like light_source does.
+
+        queue = CommandQueue(light)
+        for lum in slider_values:
+            queue.set_light(luminance=lum, cct=5000)
+        queue.flush()
+'''
+
+# Maximum commands per second per backend, None for unlimited.
+MAX_COMMAND_RATE = {'arri': 44.0,   # DMX refresh rate
+                    'solbox': 20.0,
+                    'dxo': 44.0,
+                    'dummy': None}
+
+
+class CommandQueue(object):
+    def __init__(self, light, max_rate=None):
+        self.light = light
+        self.max_rate = MAX_COMMAND_RATE.get(light.selected_source) if max_rate is None else max_rate
+        self.stats = {'submitted': 0, 'dropped': 0, 'coalesced': 0, 'sent': 0, 'errors': 0}
+        self.last_error = None
+        self._acked = None
+        self._in_flight = None
+        self._pending = None
+        self._last_sent = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='CommandQueue')
+        self._thread.start()
+
+    def _latest_state(self):
+        for state in (self._pending, self._in_flight, self._acked):
+            if state is not None:
+                return state[0]
+        return (self.light.luminance, self.light.cct, 0)
+
+    def set_light(self, luminance=None, cct=None, flicker_freq=0, **kwargs):
+        '''
+            Queue a state, unset luminance/cct keep the latest queued value.
+        '''
+        with self._cond:
+            if self._closed:
+                raise Exception('Command queue closed')
+            self.stats['submitted'] += 1
+            latest = self._latest_state()
+            if luminance is not None and luminance > 1.0:
+                # light_source caps it the same way, so equal states compare equal.
+                luminance = 1.0
+            state = (latest[0] if luminance is None else luminance,
+                     latest[1] if cct is None else cct,
+                     flicker_freq)
+            if state == latest and (self._pending is not None or self._in_flight is not None
+                                    or self._acked is not None):
+                self.stats['dropped'] += 1
+                return False
+            if self._pending is not None:
+                self.stats['coalesced'] += 1
+            self._pending = (state, kwargs)
+            self._cond.notify_all()
+            return True
+
+    def flush(self, timeout=None):
+        '''
+            Wait until every queued state was handled. False when timeout expired or
+            a command failed meanwhile (see last_error), True otherwise.
+        '''
+        with self._cond:
+            errors = self.stats['errors']
+            done = self._cond.wait_for(lambda: self._pending is None and self._in_flight is None, timeout)
+            return done and self.stats['errors'] == errors
+
+    def close(self, timeout=None):
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                if self._closed and self._pending is None:
+                    return
+                if self.max_rate and self._last_sent is not None:
+                    # Keep coalescing while the device is rate limited.
+                    delay = self._last_sent + 1.0 / self.max_rate - time.monotonic()
+                    if delay > 0:
+                        self._cond.wait(delay)
+                        continue
+                if self._acked is not None and self._pending[0] == self._acked[0]:
+                    # Coalesced back to the applied state, e.g. A -> B -> A.
+                    self.stats['dropped'] += 1
+                    self._pending = None
+                    self._cond.notify_all()
+                    continue
+                self._in_flight, self._pending = self._pending, None
+            (luminance, cct, flicker_freq), kwargs = self._in_flight
+            self._last_sent = time.monotonic()
+            try:
+                self.light.set_light(luminance=luminance, cct=cct, flicker_freq=flicker_freq, **kwargs)
+            except Exception as e:
+                with self._cond:
+                    self.stats['errors'] += 1
+                    self.last_error = e
+                    self._acked = None
+                    self._in_flight = None
+                    self._cond.notify_all()
+                continue
+            with self._cond:
+                self.stats['sent'] += 1
+                self._acked, self._in_flight = self._in_flight, None
+                self._cond.notify_all()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+import re
+import math
+import time
+import random
+import threading
+from light_control import (light_source, DummySerial, ArriFrameEncoder, ARRI_FRAME_HEADER,
+                           ARRI_FRAME_FOOTER, WAITING_KEY_WORD, cct_duv_of_xy)
+
+'''
+    Light box emulation for running light_control without hardware.
+
+    EmulatedSolBox, EmulatedArri and EmulatedDxo are drop in serial ports that speak
+    the device protocols: writes take as long as the baud rate allows, replies arrive
+    after a response latency, and the commanded state drives an EmulatedLight.
+    VirtualChromameter reads that light with a first order rise time, so settle
+    detection and set_light_abs behave like on a real rig.
+
+        light = emulated_light_source('solbox', rise_time=0.2)
+        light.set_light_abs(300, cct=5000)
+'''
+
+
+class EmulatedLight(object):
+    '''
+        Light output following the commanded luminance with a first order response.
+        lux = ambient + max_lux * luminance at steady state, rise_time is the time
+        constant in seconds.
+    '''
+    def __init__(self, max_lux=1000.0, rise_time=0.2, ambient=0.0):
+        self.max_lux = max_lux
+        self.rise_time = rise_time
+        self.ambient = ambient
+        self.luminance = 0.0
+        self.cct = None
+        self.xy = None
+        self.flicker_freq = 0
+        self.commands = 0
+        self._lux_start = ambient
+        self._changed = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _target(self):
+        return self.ambient + self.max_lux * self.luminance
+
+    def lux(self, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return self._lux_at(now)
+
+    def _lux_at(self, now):
+        if self.rise_time <= 0:
+            return self._target()
+        decay = math.exp(-(now - self._changed) / self.rise_time)
+        return self._target() + (self._lux_start - self._target()) * decay
+
+    def command(self, luminance, cct=None, xy=None, flicker_freq=0):
+        now = time.monotonic()
+        with self._lock:
+            self._lux_start = self._lux_at(now)
+            self._changed = now
+            self.luminance = luminance
+            self.cct = cct
+            self.xy = xy
+            self.flicker_freq = flicker_freq
+            self.commands += 1
+
+
+class EmulatedSerial(DummySerial):
+    '''
+        DummySerial with timing: write() blocks for the transfer time at baudrate
+        (10 bits per byte), replies become readable response_latency seconds after
+        the command was received, and read() blocks up to timeout like pyserial.
+    '''
+    def __init__(self, port='emulated', baudrate=57600, timeout=None, light=None,
+                 response_latency=0.005, **kwargs):
+        DummySerial.__init__(self, port=port, baudrate=baudrate, timeout=timeout)
+        self.light = EmulatedLight() if light is None else light
+        self.response_latency = response_latency
+        self.bytes_written = 0
+        self._open = True
+        self._rx = bytearray()
+        self._ready = bytearray()
+        self._replies = []
+        self._cond = threading.Condition()
+
+    def write(self, data):
+        data = bytes(data)
+        time.sleep(len(data) * 10.0 / self.baudrate)
+        self.bytes_written += len(data)
+        self._rx += data
+        self.handle_input()
+        return len(data)
+
+    def handle_input(self):
+        '''
+            Consume complete commands from self._rx, implemented per device.
+        '''
+        del self._rx[:]
+
+    def reply(self, data):
+        with self._cond:
+            self._replies.append((time.monotonic() + self.response_latency, data))
+            self._cond.notify_all()
+
+    def _collect(self):
+        now = time.monotonic()
+        while self._replies and self._replies[0][0] <= now:
+            self._ready += self._replies.pop(0)[1]
+        return now
+
+    def inWaiting(self):
+        with self._cond:
+            self._collect()
+            return len(self._ready)
+
+    def read(self, size=1):
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                now = self._collect()
+                if len(self._ready) >= size or (deadline is not None and now >= deadline):
+                    break
+                wait = self._replies[0][0] - now if self._replies else None
+                if deadline is not None:
+                    wait = deadline - now if wait is None else min(wait, deadline - now)
+                self._cond.wait(wait)
+            data = bytes(self._ready[:size])
+            del self._ready[:size]
+            return data
+
+
+class EmulatedSolBox(EmulatedSerial):
+    '''
+        SolBox: answers the zero byte probe with its banner and acks every
+        "L <lux*1000> T <cct> F <flicker>" command.
+    '''
+    command_pattern = re.compile(rb'L (\d+) T (\d+) F (\d+)')
+    banner = WAITING_KEY_WORD['solbox'].encode() + b'\r\n'
+    ack = WAITING_KEY_WORD['solbox'].encode() + b' OK\r\n'
+
+    def handle_input(self):
+        while self._rx[:1] == b'\x00':
+            del self._rx[:1]
+            self.reply(self.banner)
+        last = 0
+        for match in self.command_pattern.finditer(self._rx):
+            luminance, cct, flicker_freq = (int(v) for v in match.groups())
+            self.light.command(luminance / 1000.0, cct=cct, flicker_freq=flicker_freq)
+            self.reply(self.ack)
+            last = match.end()
+        # Commands are not terminated, keep only what follows the last full one.
+        del self._rx[:last]
+
+
+class EmulatedArri(EmulatedSerial):
+    '''
+        Arri panel: silent, decodes 0x7E ... 0xE7 DMX frames into light state.
+    '''
+    def handle_input(self):
+        size = ArriFrameEncoder.frame_size
+        while True:
+            start = self._rx.find(bytes([ARRI_FRAME_HEADER[0]]))
+            if start < 0:
+                del self._rx[:]
+                return
+            del self._rx[:start]
+            if len(self._rx) < size:
+                return
+            frame = bytes(self._rx[:size])
+            if frame[:len(ARRI_FRAME_HEADER)] != bytes(ARRI_FRAME_HEADER) or frame[-1] != ARRI_FRAME_FOOTER:
+                del self._rx[:1]
+                continue
+            del self._rx[:size]
+            luminance, x, y = ArriFrameEncoder.decode(frame)
+            self.light.command(luminance, cct=float(cct_duv_of_xy(x, y)[0]), xy=(x, y))
+
+
+class EmulatedDxo(EmulatedSerial):
+    '''
+        DxO SerialToDmx: answers the probe with its banner, ignores commands.
+    '''
+    banner = WAITING_KEY_WORD['dxo'].encode() + b'\r\n'
+
+    def handle_input(self):
+        if b'\x00' in self._rx:
+            self.reply(self.banner)
+        del self._rx[:]
+
+
+EMULATORS = {'solbox': EmulatedSolBox,
+             'arri': EmulatedArri,
+             'dxo': EmulatedDxo}
+
+
+class VirtualChromameter(object):
+    '''
+        Chroma meter reading an EmulatedLight, with a serial round trip of
+        read_latency seconds and relative gaussian noise.
+    '''
+    def __init__(self, light, name='virtual', read_latency=0.02, noise=0.002):
+        self.light = light
+        self.name = name
+        self.read_latency = read_latency
+        self.noise = noise
+        self.reads = 0
+
+    def start(self):
+        pass
+
+    @property
+    def get_luminance(self):
+        time.sleep(self.read_latency)
+        self.reads += 1
+        return self.light.lux() * (1 + random.gauss(0, self.noise))
+
+    def items(self):
+        return {'name': self.name, 'luminance': self.light.lux()}.items()
+
+    def __del__(self):
+        pass
+
+    def __repr__(self):
+        return 'VirtualChromameter({})'.format(self.name)
+
+
+def emulated_light_source(device='solbox', chromameters=1, max_lux=1000.0, rise_time=0.2, ambient=0.0,
+                          response_latency=0.005, read_latency=0.02, noise=0.002, verbose=0, **kwargs):
+    '''
+        light_source connected to an emulated device and virtual chroma meters.
+        The emulated light is available as light.emulated_light. Device cache and
+        calibration table are off unless passed explicitly, so emulation does not
+        touch the files used by real rigs.
+    '''
+    light = EmulatedLight(max_lux=max_lux, rise_time=rise_time, ambient=ambient)
+
+    def serial_factory(port, **dev_config):
+        return EMULATORS[device](port=port, light=light, response_latency=response_latency, **dev_config)
+
+    kwargs.setdefault('device_cache', False)
+    kwargs.setdefault('calibration_table', False)
+    source = light_source(light_source=device, dummy=True, verbose=verbose,
+                          serial_factory=serial_factory, **kwargs)
+    source.emulated_light = light
+    for index in range(chromameters):
+        name = 'virtual{}'.format(index)
+        source.chromameters[name] = VirtualChromameter(light, name=name, read_latency=read_latency, noise=noise)
+    return source
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+import os
+import time
+import subprocess
+
+'''
+    Android device readiness after a reboot.
+
+    Instead of sleeping a fixed minute after "adb reboot", wait for the device to come
+    back: "adb wait-for-device", then poll "getprop sys.boot_completed" with
+    exponential backoff until it reads 1 or the deadline expires. The boot id
+    (/proc/sys/kernel/random/boot_id) taken before the reboot tells the new boot from
+    the old one, which still reports boot_completed=1 for a moment after the command.
+    When the boot id can not be read, the device has to be seen going down first.
+
+        device = AdbDevice()
+        seconds = device.reboot(timeout=180)
+
+    The adb binary is $ADB when set, so the module can be exercised with a stub script
+    such as adb_stub.py (see test_device_readiness.py).
+'''
+
+ADB = os.environ.get('ADB', 'adb')
+
+
+class DeviceNotReady(Exception):
+    pass
+
+
+class AdbDevice(object):
+    def __init__(self, serial=None, adb=None, command_timeout=10.0, verbose=1):
+        self.serial = serial
+        self.adb = adb or ADB
+        self.command_timeout = command_timeout
+        self.verbose = verbose
+        self.reboot_times = []  # Measured reboot durations (s)
+
+    def _command(self, *args):
+        command = [self.adb]
+        if self.serial:
+            command += ['-s', self.serial]
+        return command + list(args)
+
+    def run(self, *args, timeout=None):
+        '''
+            Run an adb command, returns its stripped stdout. Raises
+            subprocess.CalledProcessError or subprocess.TimeoutExpired.
+        '''
+        output = subprocess.run(self._command(*args), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                timeout=self.command_timeout if timeout is None else timeout, check=True)
+        return output.stdout.decode(errors='ignore').strip()
+
+    def getprop(self, name):
+        return self.run('shell', 'getprop', name)
+
+    def boot_id(self):
+        '''
+            Id of the running boot, None when the device does not answer.
+        '''
+        try:
+            return self.run('shell', 'cat', '/proc/sys/kernel/random/boot_id') or None
+        except (subprocess.SubprocessError, OSError):
+            return None
+
+    def state(self):
+        '''
+            "adb get-state" ("device" once it is online), None when it fails.
+        '''
+        try:
+            return self.run('get-state') or None
+        except (subprocess.SubprocessError, OSError):
+            return None
+
+    def boot_completed(self):
+        try:
+            return self.getprop('sys.boot_completed') == '1'
+        except (subprocess.SubprocessError, OSError):
+            return False
+
+    def wait_until_ready(self, timeout=180.0, interval=0.5, max_interval=2.0, backoff=2.0, previous_boot_id=None,
+                         wait_for_drop=False):
+        '''
+            Block until the device is connected and booted, polling every interval
+            seconds, growing by backoff up to max_interval. With previous_boot_id the
+            device only counts as ready once it runs a different boot. Without one,
+            wait_for_drop makes it count only after it was seen going down (offline
+            or boot not completed), so the boot before a reboot is not taken for
+            the new one. Returns the seconds waited, raises DeviceNotReady after
+            timeout.
+        '''
+        start = time.monotonic()
+        deadline = start + timeout
+        dropped = not wait_for_drop
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeviceNotReady('Device not ready after {:.0f} s'.format(timeout))
+            if not dropped:
+                dropped = self.state() != 'device' or not self.boot_completed()
+            if dropped:
+                try:
+                    self.run('wait-for-device', timeout=remaining)
+                except subprocess.TimeoutExpired:
+                    raise DeviceNotReady('Device not connected after {:.0f} s'.format(timeout))
+                except (subprocess.CalledProcessError, OSError):
+                    pass
+                else:
+                    # Boot id first: boot_completed read before it may still come from the old
+                    # boot, and an unreadable id (device going down) is not a new boot.
+                    booted = previous_boot_id is None or self.boot_id() not in (None, previous_boot_id)
+                    if booted and self.boot_completed():
+                        return time.monotonic() - start
+            time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
+            interval = min(interval * backoff, max_interval)
+
+    def reboot(self, timeout=180.0, **kwargs):
+        '''
+            Reboot and wait until the device is ready again (see wait_until_ready).
+            Returns the measured reboot time, also appended to reboot_times.
+        '''
+        boot_id = self.boot_id()
+        start = time.monotonic()
+        self.run('reboot', timeout=timeout)
+        self.wait_until_ready(timeout=timeout - (time.monotonic() - start), previous_boot_id=boot_id,
+                              wait_for_drop=boot_id is None, **kwargs)
+        elapsed = time.monotonic() - start
+        self.reboot_times.append(elapsed)
+        if self.verbose > 0:
+            print('Device ready {:.1f} s after reboot'.format(elapsed))
+        return elapsed
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Reboot an Android device and wait until it is ready')
+    parser.add_argument('--serial', '-s', help='adb device serial', default=None)
+    parser.add_argument('--timeout', help='Seconds to wait for the device', default=180.0, type=float)
+    parser.add_argument('--wait_only', help='Only wait for the device, do not reboot it', action='store_true')
+    args = parser.parse_args()
+
+    device = AdbDevice(serial=args.serial)
+    if args.wait_only:
+        print('Ready after {:.1f} s'.format(device.wait_until_ready(timeout=args.timeout)))
+    else:
+        device.reboot(timeout=args.timeout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+import os
+import argparse
+import light_control
+
+'''
+    Writes cie_tables.py, the CIE tables light_control loads instead of computing
+    them at startup: the colour matching function weights of the Planck integration
+    grid (the only runtime use of scipy) and the default CCTTable.
+
+    Rerun after changing _tristimulus, _PLANCK_WAVELENGTHS or the CCTTable defaults:
+
+        python3 generate_cie_tables.py
+'''
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cie_tables.py')
+
+
+def _rows(array, indent='    '):
+    return '\n'.join('{}[{}],'.format(indent, ', '.join(repr(float(v)) for v in row)) for row in array)
+
+
+def render():
+    light_control.USE_CIE_TABLES = False
+    del light_control._PLANCK_GRID[:]
+    _, weights = light_control._planck_grid()
+    table = light_control.CCTTable()
+    return ('# Generated by generate_cie_tables.py, do not edit.\n'
+            '\n'
+            'PLANCK_WAVELENGTHS = {wavelengths!r}\n'
+            '\n'
+            '# CMF weights (x, y, z) per Planck grid wavelength inside 360-830 nm.\n'
+            'PLANCK_CMF_WEIGHTS = [\n{weights}\n]\n'
+            '\n'
+            "CCT_TABLE = {{'range': {range!r},\n"
+            "             'max_error': {max_error!r},\n"
+            "             'xy': [\n{xy}\n]}}\n").format(
+                wavelengths=light_control._PLANCK_WAVELENGTHS,
+                weights=_rows(weights),
+                range=(table.cct_min, table.cct_max, table.samples),
+                max_error=table.max_error,
+                xy=_rows(table.xy))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the precomputed CIE tables of light_control')
+    parser.add_argument('--output', '-o', default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+    with open(args.output, 'w') as f:
+        f.write(render())
+    print('Wrote {}'.format(args.output))
+
+
+if __name__ == '__main__':
+    main()
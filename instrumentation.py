@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+import os
+import json
+import math
+import time
+import threading
+import collections
+
+'''
+    Lightweight span timing and counters for light_control.
+
+        instr = Instrumentation([HistogramSink(), JsonlTraceSink('trace.jsonl')])
+        light = light_source(..., instrumentation=instr)
+        ...
+        print(instr.sinks[0].summary())
+
+    light_source defaults to NULL_INSTRUMENTATION, whose span() returns a shared no-op
+    context manager, so the hooks cost one method call when disabled.
+'''
+
+
+class _NullSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullInstrumentation(object):
+    enabled = False
+
+    def span(self, name, **tags):
+        return _NULL_SPAN
+
+    def count(self, name, value=1, **tags):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+class _Span(object):
+    __slots__ = ('instrumentation', 'name', 'tags', 'wall', 'start')
+
+    def __init__(self, instrumentation, name, tags):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.tags = tags
+
+    def __enter__(self):
+        self.wall = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        self.instrumentation.record(self.name, self.wall, duration, self.tags,
+                                    None if exc_type is None else exc_type.__name__)
+        return False
+
+
+class Instrumentation(object):
+    enabled = True
+
+    def __init__(self, sinks=()):
+        self.sinks = list(sinks)
+        self.counters = collections.Counter()
+        self._lock = threading.Lock()
+
+    def span(self, name, **tags):
+        return _Span(self, name, tags)
+
+    def record(self, name, wall, duration, tags, error=None):
+        for sink in self.sinks:
+            sink.span(name, wall, duration, tags, error)
+
+    def count(self, name, value=1, **tags):
+        with self._lock:
+            self.counters[name] += value
+        for sink in self.sinks:
+            sink.count(name, value, tags)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class HistogramSink(object):
+    '''
+        In memory latency histograms per span name, quarter octave buckets from 1 us.
+    '''
+    def __init__(self):
+        self.histograms = collections.defaultdict(collections.Counter)
+        self.stats = {}
+        self.counters = collections.Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def bucket(duration):
+        return max(0, int(math.floor(4 * math.log2(max(duration, 1e-6) * 1e6))))
+
+    @staticmethod
+    def bucket_upper(bucket):
+        return 2 ** ((bucket + 1) / 4.0) * 1e-6
+
+    def span(self, name, wall, duration, tags, error):
+        with self._lock:
+            self.histograms[name][self.bucket(duration)] += 1
+            count, total, low, high, errors = self.stats.get(name, (0, 0.0, duration, duration, 0))
+            self.stats[name] = (count + 1, total + duration, min(low, duration), max(high, duration),
+                                errors + (error is not None))
+
+    def count(self, name, value, tags):
+        with self._lock:
+            self.counters[name] += value
+
+    def percentile(self, name, q):
+        '''
+            Upper bucket edge (s) below which q percent of the spans fell.
+        '''
+        histogram = self.histograms[name]
+        target = sum(histogram.values()) * q / 100.0
+        seen = 0
+        for bucket in sorted(histogram):
+            seen += histogram[bucket]
+            if seen >= target:
+                return self.bucket_upper(bucket)
+        return None
+
+    def summary(self):
+        with self._lock:
+            stats = dict(self.stats)
+            counters = dict(self.counters)
+        spans = {}
+        for name, (count, total, low, high, errors) in stats.items():
+            spans[name] = {'count': count, 'mean_ms': total / count * 1e3, 'min_ms': low * 1e3,
+                           'max_ms': high * 1e3, 'errors': errors,
+                           'p50_ms': self.percentile(name, 50) * 1e3,
+                           'p95_ms': self.percentile(name, 95) * 1e3,
+                           'p99_ms': self.percentile(name, 99) * 1e3}
+        return {'spans': spans, 'counters': counters}
+
+    def close(self):
+        pass
+
+
+class JsonlTraceSink(object):
+    '''
+        One JSON line per span and counter increment.
+    '''
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a')
+        self._lock = threading.Lock()
+
+    def _write(self, entry):
+        line = json.dumps(entry) + '\n'
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line)
+
+    def span(self, name, wall, duration, tags, error):
+        entry = {'span': name, 'time': wall, 'duration': duration}
+        if tags:
+            entry['tags'] = tags
+        if error is not None:
+            entry['error'] = error
+        self._write(entry)
+
+    def count(self, name, value, tags):
+        entry = {'counter': name, 'time': time.time(), 'value': value}
+        if tags:
+            entry['tags'] = tags
+        self._write(entry)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class PrometheusTextfileSink(object):
+    '''
+        Span totals and counters in the Prometheus text format, for the node_exporter
+        textfile collector. The file is rewritten atomically at most every interval
+        seconds and on close.
+    '''
+    def __init__(self, path, prefix='light_control', interval=10.0):
+        self.path = path
+        self.prefix = prefix
+        self.interval = interval
+        self.spans = {}
+        self.counters = collections.Counter()
+        self._written = 0.0
+        self._lock = threading.Lock()
+
+    def span(self, name, wall, duration, tags, error):
+        with self._lock:
+            count, total, errors = self.spans.get(name, (0, 0.0, 0))
+            self.spans[name] = (count + 1, total + duration, errors + (error is not None))
+        self._maybe_write()
+
+    def count(self, name, value, tags):
+        with self._lock:
+            self.counters[name] += value
+        self._maybe_write()
+
+    def _maybe_write(self):
+        if time.monotonic() - self._written >= self.interval:
+            self.write()
+
+    def render(self):
+        with self._lock:
+            spans = dict(self.spans)
+            counters = dict(self.counters)
+        p = self.prefix
+        lines = ['# TYPE {}_span_seconds summary'.format(p)]
+        for name, (count, total, errors) in sorted(spans.items()):
+            lines.append('{}_span_seconds_sum{{span="{}"}} {}'.format(p, name, total))
+            lines.append('{}_span_seconds_count{{span="{}"}} {}'.format(p, name, count))
+        lines.append('# TYPE {}_span_errors_total counter'.format(p))
+        for name, (count, total, errors) in sorted(spans.items()):
+            lines.append('{}_span_errors_total{{span="{}"}} {}'.format(p, name, errors))
+        lines.append('# TYPE {}_events_total counter'.format(p))
+        for name, value in sorted(counters.items()):
+            lines.append('{}_events_total{{event="{}"}} {}'.format(p, name, value))
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        self._written = time.monotonic()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, self.path)
+
+    def close(self):
+        self.write()
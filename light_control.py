@@ -1,14 +1,26 @@
 #!/usr/bin/env python3
-import os
 import sys
-try:
-    import serial
-except Exception:
-    raise Exception('Failed to import "serial" module\nTry to install "pyserial": \033[91mpython3 -m pip install pyserial --user\033[0m')
 import time
-import numpy as np
-from scipy.interpolate import interp1d
-import chromameters as CMM
+import threading
+import functools
+import contextlib
+import collections
+import concurrent.futures
+import serial_discovery
+import calibration
+import settle
+from instrumentation import NULL_INSTRUMENTATION, Instrumentation, JsonlTraceSink, PrometheusTextfileSink
+
+# Heavy dependencies are imported on first use so short CLI invocations (-L, dummy,
+# solbox) start fast: numpy, pyserial, scipy and chromameters are imported by the
+# functions that need them. See benchmark_startup.py.
+
+def _serial():
+    try:
+        import serial
+    except Exception:
+        raise Exception('Failed to import "serial" module\nTry to install "pyserial": \033[91mpython3 -m pip install pyserial --user\033[0m')
+    return serial
 
 _CONFIG_ARRI = {'baudrate': 57600}
 
@@ -20,11 +32,207 @@ _DEVICE_CONFIG = {'dxo': {},
 WAITING_KEY_WORD = {'dxo': 'SerialToDmx',
                     'solbox': 'SolBox'}
 
+SOLBOX_ACK = WAITING_KEY_WORD['solbox'].encode()
+SOLBOX_FLICKER_FREQS = [0, 50, 60] + list(range(100, 1001, 50))
+
+
+ARRI_FRAME_HEADER = (0x7E, 0x06, 0x01, 0x02, 0x0)
+ARRI_FRAME_FOOTER = 0xE7
+ARRI_DMX_CHANNELS = 512
+
+
+class ArriFrameEncoder(object):
+    """
+    DMX frame encoder for the Arri backend.
+    Owns one preallocated frame with the 0x7E ... 0xE7 envelope in place, encode()
+    only patches the luminance and xy channels and returns that same buffer.
+    """
+    frame_size = len(ARRI_FRAME_HEADER) + ARRI_DMX_CHANNELS + 1
+    _channel_slice = slice(len(ARRI_FRAME_HEADER), len(ARRI_FRAME_HEADER) + 6)
+
+    def __init__(self):
+        import numpy as np
+        self.frame = self.blank_frames(1)
+        self._channels = np.frombuffer(self.frame, dtype=np.uint8)[self._channel_slice]
+
+    @classmethod
+    def blank_frames(cls, count):
+        """
+        Contiguous buffer of count frames, envelope set and all channels at zero.
+        """
+        import numpy as np
+        buffer = bytearray(cls.frame_size * count)
+        frames = np.frombuffer(buffer, dtype=np.uint8).reshape(count, cls.frame_size)
+        frames[:, :len(ARRI_FRAME_HEADER)] = ARRI_FRAME_HEADER
+        frames[:, -1] = ARRI_FRAME_FOOTER
+        return buffer
+
+    @staticmethod
+    def channel_values(luminance, cct):
+        """
+        DMX channels 1-6 (luminance, x, y as 16 bit big endian), vectorized over
+        luminance and cct. Returns a uint8 array of shape (..., 6).
+        """
+        import numpy as np
+        lum = np.clip(np.round(np.asarray(luminance, dtype=float) * 65535), 0, 65535)
+        xy = np.clip((xyofT(cct) / 0.8 * 65535).round(), 0, 65535)
+        words = np.stack(np.broadcast_arrays(lum, xy[..., 0], xy[..., 1]), axis=-1).astype(np.uint16)
+        channels = np.empty(words.shape[:-1] + (6,), dtype=np.uint8)
+        channels[..., 0::2] = words // 256
+        channels[..., 1::2] = words % 256
+        return channels
+
+    def encode(self, luminance, cct):
+        self._channels[:] = self.channel_values(luminance, cct)
+        return self.frame
+
+    def encode_batch(self, states):
+        """
+        Encode a sequence of (luminance, cct) states into one contiguous buffer of
+        len(states) frames, for playback with frames().
+        """
+        import numpy as np
+        states = np.asarray(states, dtype=float).reshape(-1, 2)
+        buffer = self.blank_frames(len(states))
+        frames = np.frombuffer(buffer, dtype=np.uint8).reshape(len(states), self.frame_size)
+        frames[:, self._channel_slice] = self.channel_values(states[:, 0], states[:, 1])
+        return buffer
+
+    @classmethod
+    def decode(cls, frame):
+        """
+        (luminance, x, y) carried by a frame, the inverse of encode().
+        """
+        channels = bytes(frame[cls._channel_slice])
+        luminance, x, y = (channels[i] * 256 + channels[i + 1] for i in (0, 2, 4))
+        return luminance / 65535, x / 65535 * 0.8, y / 65535 * 0.8
+
+    @classmethod
+    def frames(cls, buffer):
+        """
+        Iterate over the frames of an encode_batch buffer without copying.
+        """
+        view = memoryview(buffer)
+        for start in range(0, len(view), cls.frame_size):
+            yield view[start:start + cls.frame_size]
+
+
+class SolBoxReader(object):
+    """
+    Reads SolBox acknowledgements on a dedicated thread.
+    The thread blocks on the port with a read timeout instead of polling, and every
+    "SolBox" ack resolves the oldest pending future, so several commands can be
+    written back to back and their acks awaited afterwards.
+    """
+    def __init__(self, serial_port, read_timeout=0.1):
+        self.serial = serial_port
+        self.read_timeout = read_timeout
+        self._pending = collections.deque()
+        self._buffer = b''
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running():
+            return
+        self._stop.clear()
+        self.serial.timeout = self.read_timeout
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='SolBoxReader-{}'.format(self.serial.port))
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self.is_running() and self._thread is not threading.current_thread():
+            self._thread.join(self.read_timeout * 10)
+        self._fail_pending(Exception('SolBox reader stopped'))
+
+    def expect_ack(self):
+        """
+        Queue a future for the next unclaimed ack, for callers doing their own writes.
+        """
+        future = concurrent.futures.Future()
+        with self._lock:
+            self._pending.append(future)
+        return future
+
+    def send(self, msg):
+        """
+        Write msg and return a future resolved with the ack bytes.
+        """
+        # Register before writing so a fast ack cannot arrive unclaimed.
+        future = self.expect_ack()
+        try:
+            self.serial.write(msg)
+        except Exception:
+            self.discard(future)
+            raise
+        return future
+
+    def discard(self, future):
+        """
+        Give up on a pending ack (write failed or timed out). Its future is taken out
+        of the queue, so a lost ack does not shift every later ack onto the previous
+        command, and the partial bytes buffered so far are dropped.
+        """
+        future.cancel()
+        with self._lock:
+            try:
+                self._pending.remove(future)
+            except ValueError:
+                pass
+            self._buffer = b''
+
+    def feed(self, data):
+        with self._lock:
+            self._buffer += data
+            index = self._buffer.find(SOLBOX_ACK)
+            while index >= 0:
+                end = index + len(SOLBOX_ACK)
+                line_end = self._buffer.find(b'\n', end)
+                if line_end >= 0:
+                    end = line_end + 1
+                ack, self._buffer = self._buffer[index:end], self._buffer[end:]
+                # Acks of commands that already timed out are consumed, not reassigned.
+                if self._pending:
+                    future = self._pending.popleft()
+                    if future.set_running_or_notify_cancel():
+                        future.set_result(ack)
+                index = self._buffer.find(SOLBOX_ACK)
+            # Only a partial keyword can still complete, drop older unsolicited bytes.
+            self._buffer = self._buffer[-(len(SOLBOX_ACK) - 1):]
+
+    def pending_data(self):
+        with self._lock:
+            return self._buffer
+
+    def _fail_pending(self, exc):
+        with self._lock:
+            pending, self._pending = self._pending, collections.deque()
+        for future in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(exc)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                data = self.serial.read(max(1, self.serial.in_waiting))
+            except Exception as e:
+                self._fail_pending(e)
+                return
+            if data:
+                self.feed(data)
+
 
 class DummySerial:
-    def __init__(self, port='dummy', baudrate=57600, **kwargs):
+    def __init__(self, port='dummy', baudrate=57600, timeout=None, **kwargs):
         self.port = port
         self.baudrate = baudrate
+        self.timeout = timeout
         self._open = False
 
     def open(self):
@@ -37,6 +245,9 @@ class DummySerial:
         pass
 
     def read(self, size=0):
+        # Behave like a port with nothing to read, block for the read timeout.
+        if self.timeout:
+            time.sleep(self.timeout)
         return b''
 
     def isOpen(self):
@@ -75,30 +286,147 @@ def port_selector(ports, selection=None):
         return select_list_ports(ports)
 
 
+def match_port(ports, selection=None):
+    '''
+        Port port_selector picks for selection, None when it would ask which one.
+    '''
+    if len(ports) == 1:
+        return ports[0]
+    if selection is None or len(ports) == 0:
+        return None
+    try:
+        return ports[int(selection)]
+    except (ValueError, IndexError):
+        pass
+    possible_ports = [port for port in ports if selection in port]
+    if len(possible_ports) < len(ports):
+        return match_port(possible_ports, selection)
+    return None
+
+
+def _read_chromameter(cm, lock):
+    # The lock serialises on-demand reads with a background sampler on the same meter.
+    with lock:
+        lux = cm.get_luminance
+    return time.time(), lux
+
+
+class LuminanceReading(object):
+    """
+    Result of light_source.read_luminance: per meter values and read timestamps,
+    failed meters in errors, and the mean over the meters not rejected as outliers.
+    """
+    def __init__(self):
+        self.values = {}
+        self.timestamps = {}
+        self.errors = {}
+        self.rejected = []
+        self.mean = float('nan')
+
+    def reject_outliers(self, k=3.0, rel_floor=0.05):
+        """
+        With three or more meters, drop readings further than k scaled MADs from the
+        median (at least rel_floor of the median), then average the rest.
+        """
+        import numpy as np
+        names = list(self.values)
+        values = np.array([self.values[name] for name in names], dtype=float)
+        if len(values) == 0:
+            return self.mean
+        keep = np.ones(len(values), dtype=bool)
+        if len(values) >= 3:
+            median = np.median(values)
+            threshold = max(k * 1.4826 * np.median(np.abs(values - median)), rel_floor * abs(median))
+            keep = np.abs(values - median) <= threshold
+        self.rejected = [name for name, kept in zip(names, keep) if not kept]
+        self.mean = float(values[keep].mean())
+        return self.mean
+
+    def stamped(self):
+        """
+        (timestamp, mean) with the time of the oldest read in the mean, the mean
+        alone when no meter answered.
+        """
+        kept = [self.timestamps[name] for name in self.values if name not in self.rejected]
+        if not kept:
+            return self.mean
+        return min(kept), self.mean
+
+    def __float__(self):
+        return float(self.mean)
+
+    def __repr__(self):
+        return 'LuminanceReading(mean={}, values={}, rejected={}, errors={})'.format(
+            self.mean, self.values, self.rejected, self.errors)
+
+
 class light_source(object):
-    def __init__(self, port=None, light_source=None, calibration_mode=True, verbose=1, dummy=False):
+    def __init__(self, port=None, light_source=None, calibration_mode=True, verbose=1, dummy=False,
+                 device_cache=True, rescan=False, calibration_table=True, serial_factory=None,
+                 instrumentation=None, chromameter_ports=None):
         self._chromameters = {} # Class reference
         self.chromameters = {} # Connected object reference
         self.verbose = verbose
         self.calibration_mode = calibration_mode
+        # Replaces serial.Serial/DummySerial when set, e.g. a device_emulator class.
+        self.serial_factory = serial_factory
+        # Span timing and counters, see instrumentation.Instrumentation.
+        self.instrumentation = NULL_INSTRUMENTATION if instrumentation is None else instrumentation
+        # Port -> device type cache, keyed by USB serial number. rescan ignores cached entries.
+        # Pass a DeviceCache or CalibrationTable to share it between light sources.
+        if isinstance(device_cache, serial_discovery.DeviceCache):
+            self.device_cache = device_cache
+        else:
+            self.device_cache = serial_discovery.DeviceCache() if device_cache else None
+        self.rescan = rescan
+        # Command luminance vs measured lux, seeds set_light_abs.
+        if isinstance(calibration_table, calibration.CalibrationTable):
+            self.calibration = calibration_table
+        else:
+            self.calibration = calibration.CalibrationTable() if calibration_table else None
         ports = self.connected_devices()
         self.chromameter_connected(ports)
         # Remove the ports used by chromameters.
         for port_name in self._chromameters:
             ports.remove(port_name)
+        # With several light boxes on one host, only use the meters of this one.
+        if chromameter_ports is not None:
+            self._chromameters = {port: cls for port, cls in self._chromameters.items()
+                                  if any(selection in port for selection in chromameter_ports)}
 
+        # Candidate light source ports, port_selector picked self.port out of them.
+        self.ports = ports
         if dummy or light_source == 'dummy':
             self.port = 'dummy'
         else:
             if len(ports) == 0:
                 raise Exception('No connected serial device for light source')
-            self.port = port_selector(ports, selection=port)
+            found = None
+            if port is None and light_source is not None and len(ports) > 1:
+                found = self._find_port(ports, light_source)
+            self.port = found or port_selector(ports, selection=port)
         self.serial = None
         self.luminance = 0.0
         self.cct = 5000
         self.timeout = 1
         self.abs_luminance = None
         self.flicker_freq = 0
+        # Seconds from the last SolBox command write to its ack.
+        self.last_ack_latency = None
+        # Settle detection after light changes, see settle.SettleDetector.
+        # window and drift_horizon are in seconds.
+        self.settle_config = {'band': 0.01, 'window': 1.0, 'min_samples': 5, 'drift_horizon': 2.0,
+                              'min_wait': 0.2, 'abs_band': 0.05, 'interval': 0.05, 'timeout': 10.0}
+        self.last_settle = None
+        self.chromameter_timeout = 2.0
+        self._chromameter_pool = None
+        self._chromameter_reads = {}
+        self._chromameter_locks = {}
+        self.samplers = {}
+        self._arri_encoder = None
+        self._solbox_reader = None
+        # Stops another ack reader on the port (AsyncLightSource) before the thread takes it.
+        self._release_ack_reader = None
         self._mapping = {'arri': self._set_light_arri,
                          'solbox': self._set_light_iq_sol,
                          'dxo': self._set_light_dxo,
@@ -109,6 +437,9 @@ class light_source(object):
         self._initial_connect(self.port)
 
     def chromameter_connected(self, ports):
+        if not ports:
+            return
+        import chromameters as CMM
         for port in ports:
             for ident in CMM.CHROMA_METERS_IDENTIFIER:
                 if ident in port:
@@ -121,10 +452,12 @@ class light_source(object):
         dev_config = _DEVICE_CONFIG[self.selected_source]
         if self.verbose > 1:
             print(f'Connecting to serial: {port}')
-        if self.port == 'dummy':
+        if self.serial_factory is not None:
+            self.serial = self.serial_factory(port, **(dev_config or {}))
+        elif self.port == 'dummy':
             self.serial = DummySerial()
         else:
-            self.serial = serial.Serial(port, **dev_config)
+            self.serial = _serial().Serial(port, **dev_config)
 
         if self.verbose > 1:
             print(f'Connection status: {self.serial}')
@@ -137,12 +470,7 @@ class light_source(object):
                 self.chromameters[name].start()
 
     def connected_devices(self):
-        ports = []
-        if sys.platform == 'darwin':
-            # OSX system
-            ports = [os.path.join('/dev', d) for d in os.listdir('/dev') if 'cu.usb' in d.lower()]
-
-        return ports
+        return serial_discovery.candidate_ports()
 
     def _open(self):
         if self.serial is not None and self.serial.isOpen():
@@ -162,37 +490,126 @@ class light_source(object):
         return self.port in self.connected_devices()
 
     def reconnect(self):
-        if self.check_still_connected():
-            self.serial.close()
-            time.sleep(0.1)
-            self.serial.open()
-        else:
-            self.serial.close()
-            raise Exception('Device no longer connected')
+        self.instrumentation.count('reconnect')
+        with self.instrumentation.span('reconnect'):
+            self._stop_solbox_reader()
+            if self.check_still_connected():
+                self.serial.close()
+                time.sleep(0.1)
+                self.serial.open()
+            else:
+                self.serial.close()
+                raise Exception('Device no longer connected')
+
+    def _find_port(self, ports, light_source):
+        """
+        The one port of ports identified as light_source, all probed concurrently.
+        None when there is no such port or more than one.
+        """
+        if self.rescan and self.device_cache is not None:
+            for port in ports:
+                self.device_cache.forget(port)
+        devices = serial_discovery.identify_devices(ports, cache=self.device_cache, verbose=self.verbose)
+        matching = [port for port in ports if devices.get(port) == light_source]
+        return matching[0] if len(matching) == 1 else None
 
     def identify_device(self, port):
-        ser_obj = serial.Serial(port)
-        self.serial = ser_obj
-        ser_obj.write(bytearray([0]))
-        time.sleep(1)
-        bytes_in_waiting = ser_obj.inWaiting()
-        device = None
-        if bytes_in_waiting:
-            data = ser_obj.read(bytes_in_waiting).decode()
-            for kw in WAITING_KEY_WORD:
-                if WAITING_KEY_WORD[kw] in data:
-                    self.selected_source = kw
-                    break
-        self.serial.close()
-        # Hardcoded since Arri light doesn't give a reply when connecting.
-        if self.selected_source is None:
-            self.selected_source = 'arri'
+        if self.rescan and self.device_cache is not None:
+            self.device_cache.forget(port)
+        devices = serial_discovery.identify_devices([port], cache=self.device_cache,
+                                                    timeout=self.timeout, verbose=self.verbose)
+        if port not in devices:
+            raise Exception('Failed to identify device at port: {}'.format(port))
+        self.selected_source = devices[port]
         if self.verbose > 1:
             print('Device connected: <{}> at port: <{}>'.format(self.selected_source, self.port))
         return self.selected_source
 
     def get_avg_luminance(self):
-        return np.mean([cm.get_luminance for cm in self.chromameters.values()])
+        return self.read_luminance().mean
+
+    def read_luminance(self, timeout=None):
+        """
+        Read all chroma meters concurrently, returns a LuminanceReading.
+        A meter that does not answer within timeout (default chromameter_timeout) is
+        left out and not queried again until its pending read has returned.
+        """
+        with self.instrumentation.span('read_luminance'):
+            return self._read_luminance(timeout)
+
+    def _read_luminance(self, timeout):
+        timeout = self.chromameter_timeout if timeout is None else timeout
+        if self._chromameter_pool is None:
+            self._chromameter_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, len(self.chromameters)), thread_name_prefix='chromameter')
+        reading = LuminanceReading()
+        reads = {}
+        for name, cm in self.chromameters.items():
+            if name in self._chromameter_reads and not self._chromameter_reads[name].done():
+                reading.errors[name] = 'busy'
+                continue
+            reads[name] = self._chromameter_reads[name] = self._chromameter_pool.submit(
+                _read_chromameter, cm, self._chromameter_lock(name))
+        concurrent.futures.wait(reads.values(), timeout=timeout)
+        for name, future in reads.items():
+            if not future.done():
+                reading.errors[name] = 'timeout'
+                self.instrumentation.count('chromameter_timeout', meter=name)
+            elif future.exception() is not None:
+                reading.errors[name] = future.exception()
+            else:
+                reading.timestamps[name], reading.values[name] = future.result()
+        reading.reject_outliers()
+        if self.verbose > 1 and reading.errors:
+            print('Chroma meter read failed: {}'.format(reading.errors))
+        if self.chromameters and not reading.values:
+            raise Exception('No chroma meter reading within {} s: {}'.format(timeout, reading.errors))
+        return reading
+
+    def _chromameter_lock(self, name):
+        return self._chromameter_locks.setdefault(name, threading.Lock())
+
+    def start_sampling(self, rate=10.0, capacity=4096):
+        """
+        Start a background ChromameterSampler per connected chroma meter.
+        """
+        from chromameter_sampler import ChromameterSampler
+        for name, cm in self.chromameters.items():
+            if name not in self.samplers:
+                read = functools.partial(_read_chromameter, cm, self._chromameter_lock(name))
+                self.samplers[name] = ChromameterSampler(read, rate=rate, capacity=capacity, name=name)
+            self.samplers[name].start()
+        return self.samplers
+
+    def stop_sampling(self):
+        for sampler in self.samplers.values():
+            sampler.stop()
+
+    def sampled_luminance(self, since=None, timeout=1.0):
+        """
+        Mean of the background samplers' latest readings, without a blocking meter
+        read. With since (time.time()) only samples taken after it count, waiting up
+        to timeout for them. Falls back to get_avg_luminance without samplers or
+        fresh samples.
+        """
+        if not self.samplers:
+            return self.get_avg_luminance()
+        deadline = time.monotonic() + timeout
+        while True:
+            latest = [sampler.latest() for sampler in self.samplers.values()]
+            fresh = [sample[1] for sample in latest if sample is not None and (since is None or sample[0] >= since)]
+            if len(fresh) == len(latest) or time.monotonic() >= deadline:
+                break
+            time.sleep(0.01)
+        if not fresh:
+            return self.get_avg_luminance()
+        return sum(fresh) / len(fresh)
+
+    def sampled_window(self, t0, t1=None):
+        """
+        Per meter statistics of the background samples between t0 and t1 (time.time()).
+        """
+        return {name: sampler.summary(t0, t1) for name, sampler in self.samplers.items()}
 
     def set_light_abs(self, abs_luminance, cct=None, tolerance=0.01, **kwargs):
         """
@@ -201,33 +618,101 @@ class light_source(object):
         if len(self.chromameters) == 0 or self.calibration_mode == False:
             raise Exception('No connected chroma meters')
         self.abs_luminance = abs_luminance
-        chroma_lux = self.get_avg_luminance()
-        ratio = self.abs_luminance / chroma_lux
+        commands = self._abs_luminance_commands(cct, tolerance, self.get_avg_luminance())
+        for iteration, luminance in enumerate(commands):
+            if iteration:
+                self.instrumentation.count('set_light_abs_retry')
+            self.set_light(luminance=luminance, cct=cct)
+            commands.send(self.wait_for_settle().value)
+
+    def wait_for_settle(self, **kwargs):
+        """
+        Poll the chroma meters until the luminance settles, returns a settle.SettleResult
+        whose value is the settled average luminance. kwargs override settle_config.
+        """
+        config = dict(self.settle_config, **kwargs)
+        with self.instrumentation.span('wait_for_settle'):
+            self.last_settle = settle.wait_for_settle(self._settle_reading, **config)
+        if not self.last_settle.settled:
+            self.instrumentation.count('settle_timeout')
+        if self.last_settle.value is None:
+            self.last_settle.value = self.get_avg_luminance()
+        if self.verbose > 1:
+            print('Settle: {}'.format(self.last_settle))
+        return self.last_settle
+
+    def _settle_reading(self):
+        """
+        (timestamp, mean luminance) for settle detection, stamped with the oldest
+        meter read in the mean.
+        """
+        return self.read_luminance().stamped()
+
+    def _abs_luminance_commands(self, cct, tolerance, chroma_lux):
+        """
+        The set_light_abs iteration, shared by the blocking and asyncio drivers.
+        Yields the next luminance command and must be sent the chroma meter reading
+        taken once that command was applied.
+        """
+        import numpy as np
+
+        def lux_ratio(chroma_lux):
+            # Dark meters (0 lux): the ratio is unbounded, met only by a 0 lux target.
+            if chroma_lux <= 0:
+                return float('inf') if self.abs_luminance > 0 else 1.0
+            return self.abs_luminance / chroma_lux
+
+        ratio = lux_ratio(chroma_lux)
         prev_lum = None
         max_iterations = 10
         while np.abs(ratio - 1.0) > tolerance and max_iterations or cct != self.cct:
             if prev_lum is None:
-                self.set_light(luminance=0.1, cct=cct)
+                luminance = self._calibrated_luminance(self.abs_luminance, cct)
             elif self.luminance < 1.0/(65535):
-                self.set_light(luminance = 0.0, cct=cct)
-                #self.set_light(luminance = 0.5, cct=cct)
+                luminance = 0.0
+                #luminance = 0.5
             else:
-                self.set_light(luminance=ratio * self.luminance,
-                           cct=cct)
-            time.sleep(3)
-            chroma_lux = self.get_avg_luminance()
+                luminance = ratio * self.luminance
+            chroma_lux = yield luminance
+            # Return from send(), the driver's loop resumes us with next().
+            yield
             if self.verbose > 0:
                 print('Luminance avg measured: {}'.format(chroma_lux))
-            ratio = self.abs_luminance / chroma_lux
+            if self.calibration is not None:
+                self.calibration.record(self.device_id, self.cct, self.luminance, chroma_lux)
+            ratio = lux_ratio(chroma_lux)
             if prev_lum == self.luminance:
                 break
             prev_lum = self.luminance
             max_iterations -= 1
+        if self.calibration is not None:
+            try:
+                self.calibration.save()
+            except OSError as e:
+                if self.verbose > 0:
+                    print('Failed to save calibration {}: {}'.format(self.calibration.path, e))
 
-    def set_light(self, luminance=None, cct=None, **kwargs):
-        if self.selected_source != 'dummy' and  self.serial is None:
-            self._open()
+    @property
+    def device_id(self):
+        serial_number = None
+        if self.device_cache is not None and self.port != 'dummy':
+            serial_number = self.device_cache.serial_number(self.port)
+        return '{}:{}'.format(self.selected_source, serial_number or self.port)
 
+    def _calibrated_luminance(self, abs_luminance, cct=None, default=0.1):
+        """
+        First set_light_abs command, from the calibration table when it has data.
+        """
+        if self.calibration is None:
+            return default
+        luminance = self.calibration.predict(self.device_id, cct or self.cct, abs_luminance)
+        if luminance is None:
+            return default
+        if self.verbose > 1:
+            print('Calibrated start luminance: {}'.format(luminance))
+        return luminance
+
+    def _update_state(self, luminance=None, cct=None):
         if luminance is not None:
             self.luminance = luminance
         if cct:
@@ -237,10 +722,25 @@ class light_source(object):
             if self.verbose > 0:
                 print('Luminance intensity input capped to 1.0')
 
-        # if self.verbose > 0:
-            # print('Setting {} to CCT: {} and luminance: {}'.format(
-            # self.selected_source, self.cct, self.luminance))
-        self._mapping[self.selected_source](luminance=self.luminance, cct=self.cct, **kwargs)
+    def set_light(self, luminance=None, cct=None, **kwargs):
+        with self.instrumentation.span('set_light'):
+            if self.selected_source != 'dummy' and  self.serial is None:
+                self._open()
+
+            self._update_state(luminance, cct)
+
+            # if self.verbose > 0:
+                # print('Setting {} to CCT: {} and luminance: {}'.format(
+                # self.selected_source, self.cct, self.luminance))
+            with self.instrumentation.span('backend.' + self.selected_source):
+                self._mapping[self.selected_source](luminance=self.luminance, cct=self.cct, **kwargs)
+
+    def cct_error(self, x, y):
+        """
+        (CCT, Duv, CCT error vs the commanded cct) for measured chromaticities.
+        """
+        cct, duv = cct_duv_of_xy(x, y)
+        return cct, duv, cct - self.cct
 
     def print_chromameters(self):
         for name, cm in self.chromameters.items():
@@ -249,62 +749,101 @@ class light_source(object):
                 print(f'\n{key}: {value}')
 
     def _set_light_arri(self, **kwargs):
-        params = np.zeros(512, dtype=np.uint8)
-
-        lum = np.round(kwargs['luminance'] * 65535)
-        params[[0,1]] = lum // 256, lum % 256
-        xy = xyofT(kwargs['cct'])
+        if self._arri_encoder is None:
+            self._arri_encoder = ArriFrameEncoder()
         if self.verbose > 1:
-            print('Set arri at x: {}, y: {}'.format(*xy))
-        xy = (xyofT(kwargs['cct']) / 0.8 * 65535).round().astype(np.uint16)
-        params[[2,4]] = xy // 256
-        params[[3,5]] = xy % 256
-        serial_arr = [0x7E, 0x06, 0x01, 0x02, 0x0] + list(params) + [0xE7]
+            print('Set arri at x: {}, y: {}'.format(*xyofT(kwargs['cct'])))
+        frame = self._arri_encoder.encode(kwargs['luminance'], kwargs['cct'])
         # Do we need a sleep here?
         # time.sleep(0.5)
-        self.serial.write(bytearray(serial_arr))
+        self.serial.write(frame)
         time.sleep(0.05)
 
     def _set_light_iq_sol(self, **kwargs):
+        self._select_flicker_freq(**kwargs)
+        self._write_iq_sol()
+        # Reset flicker_freq
+        self.flicker_freq = 0
+
+    def _select_flicker_freq(self, **kwargs):
         if 'flicker_freq' in kwargs:
-            if kwargs['flicker_freq'] in [0, 50, 60] + list(range(100, 1001, 50)):
+            if kwargs['flicker_freq'] in SOLBOX_FLICKER_FREQS:
                 self.flicker_freq = kwargs['flicker_freq']
                 # print('Flicker freq: {}'.format(self.flicker_freq))
             else:
-                print('Flicker frequency {} NOT within limits: {}'.format(kwargs['flicker_freq'], [0, 50, 60] + list(range(100, 1001, 50))))
+                print('Flicker frequency {} NOT within limits: {}'.format(kwargs['flicker_freq'], SOLBOX_FLICKER_FREQS))
         else:
             self.flicker_freq = 0
-        self._write_iq_sol()
-        # Reset flicker_freq
-        self.flicker_freq = 0
+        return self.flicker_freq
 
     def _set_light_dxo(self, **kwargs):
         self.serial.write
 
+    @staticmethod
+    def _iq_sol_message(luminance, cct, flicker_freq):
+        return 'L {} T {} F {}'.format(int(luminance * 1000), int(cct), flicker_freq).encode()
+
+    def _solbox_ack_reader(self):
+        if self._solbox_reader is None or self._solbox_reader.serial is not self.serial:
+            self._stop_solbox_reader()
+            if self._release_ack_reader is not None:
+                self._release_ack_reader()
+            self._solbox_reader = SolBoxReader(self.serial)
+        self._solbox_reader.start()
+        return self._solbox_reader
+
+    def _stop_solbox_reader(self):
+        if self._solbox_reader is not None:
+            self._solbox_reader.stop()
+            self._solbox_reader = None
+
+    def send_iq_sol(self, luminance=None, cct=None, flicker_freq=None):
+        """
+        Write a SolBox command without waiting, returns a future for its ack.
+        Unset values default to the current state.
+        """
+        msg = self._iq_sol_message(self.luminance if luminance is None else luminance,
+                                   self.cct if cct is None else cct,
+                                   self.flicker_freq if flicker_freq is None else flicker_freq)
+        try:
+            return self._solbox_ack_reader().send(msg)
+        except Exception as e:
+            # pyserial is only loaded once a real port was opened.
+            serial = sys.modules.get('serial')
+            if serial is not None and isinstance(e, serial.SerialException):
+                raise serial.SerialException('Failed to write to serial port: {}'.format(self.port))
+            raise
+
     def _write_iq_sol(self):
+        start = time.perf_counter()
+        ack = self.send_iq_sol()
         try:
-            msg = 'L {} T {} F {}'.format(int(self.luminance * 1000), int(self.cct), self.flicker_freq).encode()
-            self.serial.write(msg)
-        except serial.SerialException:
-            raise serial.SerialException('Failed to write to serial port: {}'.format(self.port))
-
-        self.timer = self.timeout
-        while self.serial.in_waiting == 0 and self.timer > 0:
-            time.sleep(0.001)
-            self.timer -= 0.001
-        ret = self.serial.read(self.serial.in_waiting)
-        if b'SolBox' not in ret:
-            raise Exception('Unexpected return from IQ Solution Box: {}'.format(ret))
+            with self.instrumentation.span('solbox_ack_wait'):
+                ack.result(timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            received = self._solbox_reader.pending_data()
+            self._solbox_reader.discard(ack)
+            self.instrumentation.count('solbox_ack_timeout')
+            raise Exception('Unexpected return from IQ Solution Box: {}'.format(received))
+        self.last_ack_latency = time.perf_counter() - start
         return True
 
     def __del__(self):
+        if getattr(self, 'samplers', None):
+            self.stop_sampling()
+        if getattr(self, '_chromameter_pool', None) is not None:
+            self._chromameter_pool.shutdown(wait=False)
+            self._chromameter_pool = None
+        if getattr(self, '_solbox_reader', None) is not None:
+            self._stop_solbox_reader()
         if hasattr(self, 'serial') and self.serial is not None:
             self.serial.close()
         for name in self.chromameters:
             self.chromameters[name].__del__()
 
 
-_tristimulus = np.array([
+# CIE 1931 2 degree colour matching functions: wavelength (nm), x, y, z.
+_tristimulus = [
     [360, 0.000129900000000, 0.000003917000000, 0.000606100000000],
     [370, 0.000414900000000, 0.000012390000000, 0.001946000000000],
     [380, 0.001368000000000, 0.000039000000000, 0.006450001000000],
@@ -353,14 +892,25 @@ _tristimulus = np.array([
     [810, 0.000005085868000, 0.000001836600000, 0.000000000000000],
     [820, 0.000002522525000, 0.000000910930000, 0.000000000000000],
     [830, 0.000001251141000, 0.000000451810000, 0.000000000000000],
-])
+]
+
+_CMF_INTERPOLANTS = {}
+
+def _cmf_interpolants(kind='cubic'):
+    """
+    CIE colour matching function interpolants, built once per kind and reused.
+    """
+    import numpy as np
+    if kind not in _CMF_INTERPOLANTS:
+        from scipy.interpolate import interp1d
+        table = np.array(_tristimulus)
+        _CMF_INTERPOLANTS[kind] = [interp1d(table[:,0], table[:,i], kind=kind)
+                                   for i in range(1,4)]
+    return _CMF_INTERPOLANTS[kind]
 
 def wavelength_to_XYZ(wavelength, kind='cubic'):
-    xyz = []
-    for i in range(1,4):
-        interp_fn = interp1d(_tristimulus[:,0], _tristimulus[:,i], kind = kind)
-        xyz.append(interp_fn(wavelength))
-    return np.array(xyz).T
+    import numpy as np
+    return np.array([interp_fn(wavelength) for interp_fn in _cmf_interpolants(kind)]).T
 
 class wavefunc(object):
     def __init__(self, wavelengths, values):
@@ -368,40 +918,287 @@ class wavefunc(object):
         self.values = values
 
 def clip_to_range(wave, wmin, wmax):
+    import numpy as np
     approved = np.logical_and(wave.wavelengths >= wmin, wave.wavelengths <= wmax)
-    wave.wavelengths = wave.wavelengths[approved]
-    wave.values = wave.values[approved]
-    return wave
+    return wavefunc(wave.wavelengths[approved], wave.values[approved])
 
 def interp_waves(a,b):
+    import numpy as np
     wavelengths = np.arange(max(a.wavelengths[0], b.wavelengths[0]), min(a.wavelengths[-1], b.wavelengths[-1])+1, 1)
     v_a = np.interp(wavelengths, a.wavelengths, a.values)
     v_b = np.interp(wavelengths, b.wavelengths, b.values)
     return wavefunc(wavelengths, v_a * v_b)
 
+_CMF_GRIDS = {}
+
+def cmf_on_grid(wavelengths, wmin=360, wmax=830):
+    """
+    (mask, weights) for a wavelength grid: mask selects the samples inside the
+    tristimulus range and weights are the CMF at those samples times the sample
+    interval, so XYZ = values[..., mask].dot(weights). Cached per grid.
+    """
+    import numpy as np
+    wavelengths = np.asarray(wavelengths, dtype=float)
+    key = (wavelengths.tobytes(), wmin, wmax)
+    if key not in _CMF_GRIDS:
+        mask = np.logical_and(wavelengths >= wmin, wavelengths <= wmax)
+        w = wavelengths[mask]
+        interval = (w[-1] - w[0]) / (len(w) - 1)
+        _CMF_GRIDS[key] = (mask, wavelength_to_XYZ(w) * interval)
+    return _CMF_GRIDS[key]
+
 def wave_to_xyz(wave):
-    wave = clip_to_range(wave, 360, 830)
-    t_xyz = wavelength_to_XYZ(wave.wavelengths)
-    interval = (wave.wavelengths[-1] - wave.wavelengths[0]) / (len(wave.wavelengths) -1)
-    return wave.values.dot(t_xyz) * interval
+    import numpy as np
+    mask, weights = cmf_on_grid(wave.wavelengths)
+    return np.asarray(wave.values)[..., mask].dot(weights)
+
+class SpectralBatch(object):
+    """
+    Many spectra on one shared wavelength grid, values has shape (spectra, wavelengths).
+    XYZ, xy and CCT of the whole batch come from one matrix product with the cached
+    CMF weights of the grid.
+    """
+    def __init__(self, wavelengths, values):
+        import numpy as np
+        self.wavelengths = np.asarray(wavelengths, dtype=float)
+        self.values = np.atleast_2d(np.asarray(values, dtype=float))
+        if self.values.shape[-1] != len(self.wavelengths):
+            raise ValueError('values has {} samples per spectrum, grid has {}'.format(
+                self.values.shape[-1], len(self.wavelengths)))
+
+    @classmethod
+    def from_waves(cls, waves, step=1):
+        """
+        Resample wavefunc objects onto their common range with step nm spacing.
+        """
+        import numpy as np
+        start = max(wave.wavelengths[0] for wave in waves)
+        stop = min(wave.wavelengths[-1] for wave in waves)
+        wavelengths = np.arange(start, stop + step / 2.0, step)
+        return cls(wavelengths, [np.interp(wavelengths, wave.wavelengths, wave.values) for wave in waves])
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return wavefunc(self.wavelengths, self.values[index])
+
+    def multiply(self, wave):
+        """
+        Batch weighted by one spectrum (filter, sensor or reflectance), interpolated
+        onto the batch grid, like interp_waves for every spectrum.
+        """
+        import numpy as np
+        inside = np.logical_and(self.wavelengths >= wave.wavelengths[0], self.wavelengths <= wave.wavelengths[-1])
+        weights = np.interp(self.wavelengths[inside], wave.wavelengths, wave.values)
+        return SpectralBatch(self.wavelengths[inside], self.values[:, inside] * weights)
+
+    def to_XYZ(self):
+        mask, weights = cmf_on_grid(self.wavelengths)
+        return self.values[:, mask].dot(weights)
+
+    def to_xy(self):
+        xyz = self.to_XYZ()
+        return xyz[:, :2] / xyz.sum(axis=1, keepdims=True)
+
+    def to_cct_duv(self):
+        """
+        (CCT (K), Duv) per spectrum, see cct_duv_of_xy.
+        """
+        xy = self.to_xy()
+        return cct_duv_of_xy(xy[:, 0], xy[:, 1])
+
+    def to_cct(self):
+        return self.to_cct_duv()[0]
+
+_PLANCK_H = 6.62607015e-34
+_PLANCK_C = 299792458.0
+_PLANCK_K = 1.380649e-23
+_PLANCK_WAVELENGTHS = (300, 800, 5)   # np.arange arguments (nm)
+_PLANCK_GRID = []
+
+# Load the precomputed tables from cie_tables.py, the generator turns this off.
+USE_CIE_TABLES = True
+
+def _cie_tables():
+    """
+    The cie_tables module written by generate_cie_tables.py, None when disabled or
+    missing, in which case the tables are computed at runtime (needs scipy).
+    """
+    if not USE_CIE_TABLES:
+        return None
+    try:
+        import cie_tables
+    except ImportError:
+        return None
+    return cie_tables
+
+def _planck_grid():
+    """
+    Wavelength grid (m) used by XYZofT and the matching CMF weights, already clipped
+    to the tristimulus range and scaled by the sample interval as in wave_to_xyz.
+    """
+    import numpy as np
+    if not _PLANCK_GRID:
+        wavelengths = np.arange(*_PLANCK_WAVELENGTHS)
+        tables = _cie_tables()
+        if tables is not None and tuple(tables.PLANCK_WAVELENGTHS) == _PLANCK_WAVELENGTHS:
+            mask = np.logical_and(wavelengths >= 360, wavelengths <= 830)
+            weights = np.array(tables.PLANCK_CMF_WEIGHTS)
+        else:
+            mask, weights = cmf_on_grid(wavelengths)
+        _PLANCK_GRID.append((wavelengths[mask] * 1e-9, weights))
+    return _PLANCK_GRID[0]
 
 def XYZofT(T, s=True):
-    w = np.arange(300,800,5)*1e-9
-    h = 6.62607015e-34
-    c = 299792458.0
-    k = 1.380649e-23
-    v = c/w
-    B = 8*np.pi * h * c / w**5 / (np.exp(h*c/k/T/w) - 1)
-    Bo = wavefunc(w*1e9, B)
-    xyz = wave_to_xyz(Bo)
+    """
+    XYZ of a black body at temperature T (K). T can be a scalar or an array, the
+    result has shape T.shape + (3,).
+    """
+    import numpy as np
+    w, cmf = _planck_grid()
+    T = np.asarray(T, dtype=float)
+    h, c, k = _PLANCK_H, _PLANCK_C, _PLANCK_K
+    B = 8*np.pi * h * c / w**5 / (np.exp(h*c/k/T[..., None]/w) - 1)
+    xyz = B.dot(cmf)
     if s:
-        return xyz/xyz[1]
+        return xyz/xyz[..., 1:2]
     else:
         return xyz
 
 def xyofT(T):
+    """
+    CIE 1931 xy chromaticity of a black body at T (K), vectorized over T.
+    """
     xyz = XYZofT(T)
-    return xyz[:2] / xyz.sum()
+    return xyz[..., :2] / xyz.sum(axis=-1, keepdims=True)
+
+class CCTTable(object):
+    """
+    Dense CCT -> xy table, sampled uniformly in mired (1e6 / T) where the Planckian
+    locus is close to linear, and looked up with linear interpolation.
+    max_error is the largest xy deviation from xyofT, measured at the midpoints
+    between samples where linear interpolation error peaks; with the default 2048
+    samples over 1000-25000 K it is below 1e-6.
+    """
+    def __init__(self, cct_min=1000, cct_max=25000, samples=2048):
+        import numpy as np
+        self.cct_min = cct_min
+        self.cct_max = cct_max
+        self.samples = samples
+        self.mired = np.linspace(1e6 / cct_max, 1e6 / cct_min, samples)
+        tables = _cie_tables()
+        if tables is not None and tables.CCT_TABLE['range'] == (cct_min, cct_max, samples):
+            self.xy = np.array(tables.CCT_TABLE['xy'])
+            self.max_error = tables.CCT_TABLE['max_error']
+            return
+        self.xy = xyofT(1e6 / self.mired)
+        mid = (self.mired[:-1] + self.mired[1:]) / 2
+        self.max_error = float(np.abs(self._lookup(mid) - xyofT(1e6 / mid)).max())
+
+    def _lookup(self, mired):
+        import numpy as np
+        return np.stack([np.interp(mired, self.mired, self.xy[:, 0]),
+                         np.interp(mired, self.mired, self.xy[:, 1])], axis=-1)
+
+    def __call__(self, T):
+        import numpy as np
+        T = np.asarray(T, dtype=float)
+        if np.any(T < self.cct_min) or np.any(T > self.cct_max):
+            raise ValueError('CCT outside table range {}-{} K'.format(self.cct_min, self.cct_max))
+        return self._lookup(1e6 / T)
+
+_CCT_TABLE = []
+
+def xyofT_table(T):
+    """
+    Table based xyofT for sweeps, see CCTTable for the error bound.
+    """
+    if not _CCT_TABLE:
+        _CCT_TABLE.append(CCTTable())
+    return _CCT_TABLE[0](T)
+
+def xy_to_uv(x, y):
+    """
+    CIE 1931 xy to CIE 1960 uv, the space CCT and Duv are defined in.
+    """
+    import numpy as np
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    d = -2 * x + 12 * y + 3
+    return 4 * x / d, 6 * y / d
+
+class PlanckianLocus(object):
+    """
+    xy -> (CCT, Duv) inverse of xyofT, vectorized over arrays of readings.
+    The locus is tabulated in CIE 1960 uv every step mired from the same Planck
+    integration as xyofT. Each reading finds its nearest table point (coarse pass,
+    then the fine points around it), is projected onto the neighbouring table
+    segments to interpolate the CCT, and Duv is measured against the exact locus
+    point at that CCT. Duv is positive above the locus (greenish), negative below.
+    With the default table CCT is within 0.5 K of xyofT's inverse over 1500-20000 K.
+    """
+    def __init__(self, cct_min=1000, cct_max=25000, step=1.0, coarse=16, chunk=8192):
+        import numpy as np
+        self.cct_min = cct_min
+        self.cct_max = cct_max
+        self.coarse = coarse
+        self.chunk = chunk
+        self.mired = np.arange(1e6 / cct_max, 1e6 / cct_min + step / 2.0, step)
+        xy = xyofT(1e6 / self.mired)
+        self.u, self.v = xy_to_uv(xy[:, 0], xy[:, 1])
+
+    def _nearest(self, u, v):
+        import numpy as np
+        last = len(self.mired) - 1
+        index = np.empty(len(u), dtype=int)
+        cu, cv = self.u[::self.coarse], self.v[::self.coarse]
+        window = np.arange(-self.coarse, self.coarse + 1)
+        for start in range(0, len(u), self.chunk):
+            su, sv = u[start:start + self.chunk, None], v[start:start + self.chunk, None]
+            coarse = np.argmin((su - cu)**2 + (sv - cv)**2, axis=1) * self.coarse
+            fine = np.clip(coarse[:, None] + window, 0, last)
+            best = np.argmin((su - self.u[fine])**2 + (sv - self.v[fine])**2, axis=1)
+            index[start:start + self.chunk] = fine[np.arange(len(fine)), best]
+        return index
+
+    def _project(self, u, v, a, b):
+        """
+        Fraction along table segment a -> b of the projection of (u, v), and distance.
+        """
+        import numpy as np
+        su, sv = self.u[b] - self.u[a], self.v[b] - self.v[a]
+        t = np.clip(((u - self.u[a]) * su + (v - self.v[a]) * sv) / (su * su + sv * sv), 0, 1)
+        return t, np.hypot(u - self.u[a] - t * su, v - self.v[a] - t * sv)
+
+    def cct_duv(self, x, y):
+        import numpy as np
+        shape = np.shape(x)
+        u, v = xy_to_uv(np.ravel(x), np.ravel(y))
+        i = self._nearest(u, v)
+        lower = np.maximum(i - 1, 0)
+        upper = np.minimum(i + 1, len(self.mired) - 1)
+        t_lower, d_lower = self._project(u, v, lower, i)
+        t_upper, d_upper = self._project(u, v, i, upper)
+        mired = np.where(d_lower < d_upper,
+                         self.mired[lower] + t_lower * (self.mired[i] - self.mired[lower]),
+                         self.mired[i] + t_upper * (self.mired[upper] - self.mired[i]))
+        cct = 1e6 / mired
+        locus = xyofT(cct)
+        lu, lv = xy_to_uv(locus[:, 0], locus[:, 1])
+        duv = np.copysign(np.hypot(u - lu, v - lv), v - lv)
+        return cct.reshape(shape), duv.reshape(shape)
+
+_PLANCKIAN_LOCUS = []
+
+def cct_duv_of_xy(x, y):
+    """
+    CCT (K) and Duv of CIE 1931 chromaticities, scalars or arrays, e.g. chroma meter
+    readings. Uses a shared PlanckianLocus built on first use.
+    """
+    if not _PLANCKIAN_LOCUS:
+        _PLANCKIAN_LOCUS.append(PlanckianLocus())
+    return _PLANCKIAN_LOCUS[0].cct_duv(x, y)
 
 def list_light_sources():
     print('Types of lightsources, use option -s and any of:')
@@ -410,11 +1207,6 @@ def list_light_sources():
 
 def main():
     import argparse
-    try:
-        from git_update import check_last_commit
-        check_last_commit()
-    except:
-        None
     parser = argparse.ArgumentParser(description='IQ Solution Light box controller')
     parser.add_argument('--luminance', '-l', help='Luminance (Lux) to set in the box',
                                             type=float, default=None)
@@ -431,8 +1223,26 @@ def main():
                         default=0.01, type=float)
     parser.add_argument('--verbose', '-v', help='Verbose level', default=1, type=int)
     parser.add_argument('--dummy', help='Set this to simulate specific light type', default=False, action='store_true')
+    parser.add_argument('--rescan', help='Probe the light source port even if its device type is cached', default=False, action='store_true')
+    parser.add_argument('--trace', help='Append span timings to this JSONL file', default=None)
+    parser.add_argument('--metrics', help='Write Prometheus textfile metrics to this path', default=None)
+    parser.add_argument('--playlist', help='CSV or JSONL file of setpoints to run in order ("-" for stdin), '
+                        'one JSON result line per step is printed. -t, -F, -c and -C set step defaults', default=None)
+    parser.add_argument('--serve', help='Keep the light source open and serve commands on --socket',
+                        default=False, action='store_true')
+    parser.add_argument('--socket', help='Unix socket of the light daemon', default=None)
+    parser.add_argument('--direct', help='Drive the light source directly even if a daemon is running',
+                        default=False, action='store_true')
+    parser.add_argument('--check_update', help='Check whether a newer commit of this tool is available',
+                        default=False, action='store_true')
 
     args = parser.parse_args()
+    if args.check_update:
+        try:
+            from git_update import check_last_commit
+            check_last_commit()
+        except:
+            None
     if (args.light_source is not None and args.light_source not in _DEVICE_CONFIG):
         list_light_sources()
         print(f'\n\t--light_source option "{args.light_source}" not valid selection from above list.')
@@ -442,16 +1252,58 @@ def main():
         list_light_sources()
         return
 
-    light = light_source(port=args.port, light_source=args.light_source, verbose=args.verbose, dummy=args.dummy)
+    import light_daemon
+    socket_path = args.socket or light_daemon.DEFAULT_SOCKET_PATH
+    if args.playlist:
+        import playlist
+        steps = playlist.load_playlist(args.playlist, cct=args.cct, flicker_freq=args.flicker_freq,
+                                       calibrated=args.calibrated, readback=args.chromameter_readback)
+    if not args.serve and not args.direct and not args.playlist:
+        client = light_daemon.LightClient.try_connect(socket_path)
+        if client is not None:
+            with client:
+                if light_daemon.run_client(client, args):
+                    return
+
+    sinks = []
+    if args.trace:
+        sinks.append(JsonlTraceSink(args.trace))
+    if args.metrics:
+        sinks.append(PrometheusTextfileSink(args.metrics))
+    instr = Instrumentation(sinks) if sinks else None
+    # Playlist results own stdout, the light_source diagnostics go to stderr.
+    results = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr) if args.playlist else contextlib.nullcontext():
+        light = light_source(port=args.port, light_source=args.light_source, verbose=args.verbose, dummy=args.dummy,
+                             rescan=args.rescan, instrumentation=instr)
+    if args.serve:
+        try:
+            light_daemon.LightDaemon(light, socket_path, verbose=args.verbose).serve_forever()
+        finally:
+            light.__del__()
+            light.instrumentation.close()
+        return
+    if args.playlist:
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                failures = playlist.run_playlist(light, steps, output=results)
+        finally:
+            light.__del__()
+            light.instrumentation.close()
+        if failures:
+            sys.exit(1)
+        return
     if args.calibrated:
         light.set_light_abs(abs_luminance=args.luminance, cct=args.cct, tolerance=args.tolerance, verbose=args.verbose, flicker_freq=args.flicker_freq)
     else:
         light.set_light(luminance=args.luminance, cct=args.cct, verbose=args.verbose, flicker_freq=args.flicker_freq)
     if args.chromameter_readback:
-        time.sleep(2)
-        print("Here")
+        if light.chromameters:
+            settled = light.wait_for_settle()
+            print('Settled: {} in {:.3f} s'.format(settled.settled, settled.settle_time))
         light.print_chromameters()
     light.__del__()
+    light.instrumentation.close()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+import os
+import json
+import time
+import socket
+import threading
+import socketserver
+
+'''
+    Long lived light_control daemon.
+
+    LightDaemon owns one light_source (serial port, device probe, chroma meters) and
+    serves JSON line requests on a Unix domain socket, so separate commands do not
+    pay for connecting and probing every time. light_control.py --serve runs it, the
+    regular CLI then talks to it through LightClient and falls back to direct mode
+    when no daemon is listening.
+
+    One request per line, one response per line:
+        {"cmd": "set", "luminance": 0.5, "cct": 5000}
+        {"ok": true, "luminance": 0.5, "cct": 5000, ...}
+
+    Commands: set, set_abs, read, ramp, status and shutdown.
+'''
+
+DEFAULT_SOCKET_PATH = os.environ.get(
+    'LIGHTBOX_SOCKET',
+    os.path.join(os.path.expanduser('~'), '.cache', 'lightbox', 'light_control.sock'))
+
+
+def _reading_dict(reading):
+    return {'mean': reading.mean, 'values': reading.values, 'errors': reading.errors,
+            'rejected': reading.rejected}
+
+
+def _settle_dict(result):
+    return {'settled': result.settled, 'settle_time': result.settle_time, 'elapsed': result.elapsed,
+            'value': result.value, 'samples': result.samples}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                response = dict(self.server.daemon.handle(request), ok=True)
+            except Exception as e:
+                response = {'ok': False, 'error': '{}: {}'.format(type(e).__name__, e)}
+            self.wfile.write((json.dumps(response, default=str) + '\n').encode())
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class LightDaemon(object):
+    '''
+        Serves one light_source on a Unix socket. Requests from any number of clients
+        are applied one at a time.
+    '''
+    def __init__(self, light, path=DEFAULT_SOCKET_PATH, verbose=1):
+        self.light = light
+        self.path = path
+        self.verbose = verbose
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._commands = {'set': self.set,
+                          'set_abs': self.set_abs,
+                          'read': self.read,
+                          'ramp': self.ramp,
+                          'status': self.status,
+                          'shutdown': self.shutdown}
+
+    def handle(self, request):
+        cmd = request.pop('cmd', None)
+        if cmd not in self._commands:
+            raise ValueError('Unknown command "{}", use one of {}'.format(cmd, list(self._commands)))
+        with self._lock:
+            self.requests += 1
+            with self.light.instrumentation.span('daemon.' + cmd):
+                return self._commands[cmd](**request)
+
+    def _state(self):
+        return {'luminance': self.light.luminance, 'cct': self.light.cct,
+                'flicker_freq': getattr(self.light, 'flicker_freq', 0)}
+
+    def set(self, luminance=None, cct=None, flicker_freq=0):
+        self.light.set_light(luminance=luminance, cct=cct, flicker_freq=flicker_freq, verbose=self.verbose)
+        return self._state()
+
+    def set_abs(self, abs_luminance, cct=None, tolerance=0.01, flicker_freq=0):
+        self.light.set_light_abs(abs_luminance=abs_luminance, cct=cct, tolerance=tolerance,
+                                 flicker_freq=flicker_freq)
+        return dict(self._state(), settle=_settle_dict(self.light.last_settle))
+
+    def read(self, settle=False, timeout=None):
+        '''
+            Chroma meter reading, after waiting for the light to settle when asked.
+        '''
+        result = {}
+        if settle:
+            result['settle'] = _settle_dict(self.light.wait_for_settle())
+        result['reading'] = _reading_dict(self.light.read_luminance(timeout))
+        result['chromameters'] = {name: dict(cm.items()) for name, cm in self.light.chromameters.items()}
+        return result
+
+    def ramp(self, keyframes, rate=None, start=None):
+        '''
+            Play keyframes (see ramp_engine.Keyframe) to the end, returns the timing.
+        '''
+        from ramp_engine import RampPlayer
+        player = RampPlayer(self.light, keyframes, rate=rate, start=start).play()
+        return dict(self._state(), timing=player.timing())
+
+    def status(self):
+        light = self.light
+        return dict(self._state(),
+                    light_source=light.selected_source,
+                    port=light.port,
+                    ports=light.ports,
+                    device_id=light.device_id,
+                    chromameters=list(light.chromameters),
+                    pid=os.getpid(),
+                    uptime=time.time() - self.started,
+                    requests=self.requests)
+
+    def shutdown(self):
+        # shutdown() waits for serve_forever to return, it can not run on a handler thread.
+        threading.Thread(target=self._server.shutdown, daemon=True).start()
+        return {}
+
+    def serve_forever(self):
+        '''
+            Listen on path until a shutdown request or KeyboardInterrupt. Refuses to
+            start when another daemon answers on path, a stale socket file is replaced.
+        '''
+        running = LightClient.try_connect(self.path)
+        if running is not None:
+            running.close()
+            raise Exception('A light daemon is already running on {}'.format(self.path))
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._server = _Server(self.path, _Handler)
+        self._server.daemon = self
+        os.chmod(self.path, 0o600)
+        if self.verbose > 0:
+            print('Serving {} on {}'.format(self.light.selected_source, self.path))
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+class LightClient(object):
+    '''
+        Client side of LightDaemon, one connection reused for every request.
+    '''
+    def __init__(self, path=DEFAULT_SOCKET_PATH, timeout=None):
+        self.path = path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile('rwb')
+
+    @classmethod
+    def try_connect(cls, path=DEFAULT_SOCKET_PATH, timeout=None):
+        '''
+            Connected client, or None when no daemon listens on path.
+        '''
+        try:
+            return cls(path, timeout)
+        except OSError:
+            return None
+
+    def request(self, cmd, **params):
+        self._file.write((json.dumps(dict(params, cmd=cmd)) + '\n').encode())
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise Exception('Light daemon on {} closed the connection'.format(self.path))
+        response = json.loads(line)
+        if not response.pop('ok'):
+            raise Exception('Light daemon: {}'.format(response['error']))
+        return response
+
+    def set_light(self, luminance=None, cct=None, flicker_freq=0):
+        return self.request('set', luminance=luminance, cct=cct, flicker_freq=flicker_freq)
+
+    def set_light_abs(self, abs_luminance, cct=None, tolerance=0.01, flicker_freq=0):
+        return self.request('set_abs', abs_luminance=abs_luminance, cct=cct, tolerance=tolerance,
+                            flicker_freq=flicker_freq)
+
+    def read(self, settle=False, timeout=None):
+        return self.request('read', settle=settle, timeout=timeout)
+
+    def ramp(self, keyframes, rate=None, start=None):
+        return self.request('ramp', keyframes=[list(k) for k in keyframes], rate=rate, start=start)
+
+    def status(self):
+        return self.request('status')
+
+    def shutdown(self):
+        return self.request('shutdown')
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def run_client(client, args):
+    '''
+        light_control.main's single command through a daemon. Returns False without
+        sending anything for --dummy and when the daemon drives a different port than
+        requested, so the caller can fall back to direct mode.
+        --port is matched as port_selector would, against the daemon's port list.
+        Raises when the command needs options the daemon can not honor, another light
+        source on the daemon's port, or a port selection that could pick that port.
+    '''
+    from light_control import match_port
+    if args.dummy:
+        return False
+    status = client.status()
+    unsupported = [option for option in ('trace', 'metrics', 'rescan') if getattr(args, option, None)]
+    if unsupported:
+        raise Exception('{} not supported through the light daemon (pid {}), use --direct with another port '
+                        'or stop the daemon'.format(', '.join('--' + o for o in unsupported), status['pid']))
+    port = status['port']
+    if args.port is not None:
+        ports = status['ports'] or [status['port']]
+        port = match_port(ports, args.port)
+        if port is None and any(args.port in p for p in ports):
+            raise Exception('Port selection "{}" is ambiguous among {}, the light daemon (pid {}) owns {}'.format(
+                args.port, ports, status['pid'], status['port']))
+    if port != status['port']:
+        if args.verbose > 0:
+            print('Light daemon drives {} on {}, using direct mode'.format(status['light_source'], status['port']))
+        return False
+    if args.light_source is not None and args.light_source != status['light_source']:
+        raise Exception('Light daemon (pid {}) drives {} on {}, not {}'.format(
+            status['pid'], status['light_source'], status['port'], args.light_source))
+    if args.calibrated:
+        client.set_light_abs(args.luminance, cct=args.cct, tolerance=args.tolerance, flicker_freq=args.flicker_freq)
+    else:
+        client.set_light(luminance=args.luminance, cct=args.cct, flicker_freq=args.flicker_freq)
+    if args.chromameter_readback and status['chromameters']:
+        result = client.read(settle=True)
+        print('Settled: {} in {:.3f} s'.format(result['settle']['settled'], result['settle']['settle_time']))
+        for name, items in result['chromameters'].items():
+            print(f'Chromameter: {name}')
+            for key, value in items.items():
+                print(f'\n{key}: {value}')
+    return True
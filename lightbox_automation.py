@@ -2,7 +2,14 @@ from light_control import light_source
 import time
 import datetime
 import os
+import argparse
+import glob
 import subprocess
+from matrix_runner import Journal, MatrixRunner, point_key
+from matrix_spec import MatrixSpec, parse_shard
+from pipelined_executor import PipelinedExecutor
+from device_readiness import AdbDevice, DeviceNotReady
+from matrix_scheduler import CostModel, Schedule, schedule
 
 
 '''
@@ -20,18 +27,25 @@ import subprocess
 	60,5500,0-10; 60,5500,10-100: 60,5500,100-1000; reboot
 	60,6500,0-10; 60,6500,10-100: 60,6500,100-1000; reboot
 
+	The matrix is matrix_spec.DEFAULT_SPEC, --spec runs another one. --schedule reorders
+	the sweeps and runs them up or down in lux by predicted wall time (see
+	matrix_scheduler), the device still reboots at the end of every sweep.
 '''
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 app_path = os.path.join(dir_path, 'data_collection_tamper-detection-mac-FN-ONLY', 'tamper-detection.pex')
-cmd_to_reboot_device = f"adb reboot"
+device = AdbDevice() # the device under test, adb from $ADB
+reboot_timeout = 180 # seconds a reboot may take before the run is stopped
 exec_time_dict={} # dictionary to hold execution times at the end of execution of every option(test scenario)
+light_stability_dict={} # chromameter statistics sampled in the background while each option ran
+exec_time_dict_live={} # same for the LIVESTREAMING-mode run
+light_stability_dict_live={}
 
 
 def light_box():
     '''
         Initializes the light_source class
-        Creates different options (or test scenarios), each option is a dictionary; creates a list of dictionaries.
+        The test matrix (options) comes from matrix_spec, see MatrixSpec.default().
     '''
 
     dict_setup = {
@@ -39,58 +53,35 @@ def light_box():
         "light_source" : "solbox"
     }
     light = light_source(**dict_setup) # create light source object
+    return light
 
-    options = []
-    for flicker_freq in [0,50,60]:
 
-        for temp in [5500, 6500]:
-
-            for lum in range (0, 10, 1):
-                dict_execute = {
-                    "luminance" : lum/1000,
-                    "cct" : temp,
-                    "flicker_freq" : flicker_freq}
-                options.append(dict_execute)
+def supernova_output(option, today, chromameter, capture_mode='SNAPSHOT'):
+    '''
+    output folder of the supernova test for an option
+    '''
+    luminance = int(option["luminance"]*1000)
+    return f"results/{today}/{option['flicker_freq']}Hz-{option['cct']}K-{luminance}LUX-LM{chromameter}_{capture_mode}_MODE"
 
-            for lum in range (10, 100, 10):
-                dict_execute = {
-                    "luminance" : lum/1000,
-                    "cct" : temp,
-                    "flicker_freq" : flicker_freq}
-                options.append(dict_execute)
 
-            for lum in range (100, 1001, 100):
-                dict_execute = {
-                    "luminance" : lum/1000,
-                    "cct" : temp,
-                    "flicker_freq" : flicker_freq}
-                options.append(dict_execute)
-        
-    return light, options
+def supernova_command(option, today, chromameter, capture_mode='SNAPSHOT', samples=5):
+    '''
+    supernova test command line for an option, capturing samples images
+    (the matrix spec uses 5 without flicker and 30 for 50&60 Hz flicker)
+    '''
+    output = supernova_output(option, today, chromameter, capture_mode)
+    cmd = f"python3 {app_path} -o {output} -c 2 -n {samples}"
+    if capture_mode not in 'SNAPSHOT':
+        cmd += " -s live-streaming"
+    return cmd
 
 
-def supernova_test(option, today, chromameter, capture_mode='SNAPSHOT'):
+def supernova_test(option, today, chromameter, capture_mode='SNAPSHOT', samples=5):
     '''
     for each option (test-scenario), execute the supernova test below
 
     '''
-
-    luminance = int(option["luminance"]*1000)
-    flicker_freq = option["flicker_freq"]
-    temp = option["cct"]
-
-    # if flicker frequency is 0, we are collecting 5 samples; for flicker frequency 50&60, we are collecting 30 samples
-    if flicker_freq==0:
-        if capture_mode in 'SNAPSHOT':
-            cmd = f"python3 {app_path} -o results/{today}/{flicker_freq}Hz-{temp}K-{luminance}LUX-LM{chromameter}_{capture_mode}_MODE -c 2 -n 5" # change 2 to 5
-        else:
-            cmd = f"python3 {app_path} -o results/{today}/{flicker_freq}Hz-{temp}K-{luminance}LUX-LM{chromameter}_{capture_mode}_MODE -c 2 -n 5 -s live-streaming" # change 2 to 5
-    elif flicker_freq in [50,60]:
-        if capture_mode in 'SNAPSHOT':
-            cmd = f"python3 {app_path} -o results/{today}/{flicker_freq}Hz-{temp}K-{luminance}LUX-LM{chromameter}_{capture_mode}_MODE -c 2 -n 30" # change 2 to 30
-        else:
-            cmd = f"python3 {app_path} -o results/{today}/{flicker_freq}Hz-{temp}K-{luminance}LUX-LM{chromameter}_{capture_mode}_MODE -c 2 -n 30 -s live-streaming" # change 2 to 30
-
+    cmd = supernova_command(option, today, chromameter, capture_mode, samples)
     try:
         print(f'Starting Supernova test...')
         output = subprocess.check_output(cmd, shell=True)
@@ -99,39 +90,11 @@ def supernova_test(option, today, chromameter, capture_mode='SNAPSHOT'):
         raise Exception("Supernova test execution raised excpeiton during execution.")
 
 
-#### Main Code ######
-
-# Create your presets
-light, options = light_box()
-today = datetime.datetime.now().strftime("%Y%m%d_%H%M")
-chromameter = light.get_avg_luminance()
-
-print(today)
-print(f'Chromameter readout: {chromameter}')
-print(options)
-
-#### Loop through all presets for SNAPSHOT mode ####
-print("========= Start of SNAPSHOT-mode run ==========")
-
-'''
-    - get start_timer
-    - set light conditions in the lightbox
-    - get chromameter reading
-    - execute supernova test
-    - get end timer
-    - update dictionary with exectuion time
-    - after lux=1000; restrt the device
-'''
-
-for option in options:
-
-    print("#### Start of individual run - snap #####")
-
-    print(f"Option:{option}")
-
-    start_time = time.time() # Start timer
-
-    # Set the light conditions in the SOL box
+def set_light(light, option):
+    '''
+    Set the light conditions in the SOL box, reconnect and retry once on failure.
+    Returns an error message, None on success.
+    '''
     try:
         light.set_light(**option)
     except Exception as e:
@@ -144,150 +107,246 @@ for option in options:
         print("There was exception, hence reTrying to set the light in the box for second time..")
         try:
             light.reconnect()
+            light.set_light(**option)
         except Exception as e:
-            exec_time_dict[str(option)]="Exception in setting light env in sol box." 
-            continue
+            print(e)
+            return "Exception in setting light env in sol box."
 
         #TODO:
         #    restart lightbox; sleep 2 secs; update exec_dict; continue with next option
         #raise Exception("Exception in writing to sol box... serial port exception")
+    return None
 
-    print(f"Chromameter readout:{light.get_avg_luminance()}")
 
-    msg=""
+def reboot_device():
+    '''
+    Reboot the device and wait until it booted again, returns the measured reboot time.
+    '''
     try:
-        supernova_test(option, today, chromameter)    # execute the tests for this given option
-    except Exception as e:
-        msg="Exception encountered while executing the test, may be timeout exception" 
-        
-    end_time = time.time() # End timer
-
-    elapsed_time = end_time - start_time # Execution time
-
-    if len(msg)==0:
-        exec_time_dict[str(option)]=elapsed_time     # make an entry into the exec_time diectionary, execution time taken for executing this option
-    else:
-        exec_time_dict[str(option)]=msg              # if there is an exception during execution, login a message in the dictionary instead of execution time..
-
-    # Rebooting the device on completion of one run of lux values from 0-1000
-    if option['luminance'] == 1.0:
-        try:
-            #import pdb; pdb.set_trace()
-            print(f'Rebooting the device at the end of run of lux from 0-1000')
-            output = subprocess.check_output(cmd_to_reboot_device, shell=True)
-            print(output)
-            time.sleep(60) # wait for the device to be back up and reinitialize
-
-        except subprocess.TimeoutExpired:
-            print(f'Failed to Reboot the device..')
-            raise Exception("Exception in rebooting the device..")
-
-    # once the test-run is done sleep for 5s
-    time.sleep(2) # after execution of every option, sleep for 5 secs to reinitialize
+        print(f'Rebooting the device at the end of run of lux from 0-1000')
+        return device.reboot(timeout=reboot_timeout)
 
-    # TODO: check if the number of captures in media folder is equal to count in n
-
-    print("#### End of run #####")
-
-print("========= END of SNAPSHOT-mode run ==========")
+    except (DeviceNotReady, subprocess.SubprocessError) as e:
+        print(f'Failed to Reboot the device.. {e}')
+        raise Exception("Exception in rebooting the device..")
 
 
-# TODO: Process the exection dcitonhary and find out for which all options, supernova test-execution failed in SNAPSHOT mode
-'''
-print("Printing all the options where supernova_test execution failed.. in SNAPSHOT MODE")
-for k, v in exec_time_dict.items():
-    if "Exception encountered" in v:
-        print(k)
-
-print("Printing successful execution times of all the options.. in SNAPSHOT MODE")
-for k, v in exec_time_dict.items():
-    if "Exception encountered" not in v:
-        print(k, v)
-'''
-
-#### Loop through all presets for LIVE_STREAMING mode ####
-print("========= Start of LIVESTREAMING-mode run ==========")
-
-exec_time_dict_live={} # dictionary to hold execution times at the end of execution of every option(test scenario)
+def end_of_sweep(point):
+    '''
+    The device reboots after every run of lux values from 0-1000.
+    '''
+    return point.option['luminance'] == 1.0
 
-for option in options:
 
-    print("#### Start of individual run - live-streaming #####")
+def run_option(light, point, today, chromameter, reboot_after=end_of_sweep):
+    '''
+    - get start_timer
+    - set light conditions in the lightbox
+    - get chromameter reading
+    - execute supernova test
+    - get end timer
+    - update dictionary with exectuion time
+    - after lux=1000 (reboot_after(point)); restrt the device
 
-    print(option)
+    Returns the journal record of the option: per-phase timings, output folder,
+    light stability and the error message if it failed.
+    '''
+    option, capture_mode = point.option, point.capture_mode
+    if capture_mode == 'SNAPSHOT':
+        exec_times, stability = exec_time_dict, light_stability_dict
+    else:
+        exec_times, stability = exec_time_dict_live, light_stability_dict_live
+    print(f"#### Start of individual run - {capture_mode} #####")
+    print(f"Option:{option}")
+    phases = {}
 
     start_time = time.time() # Start timer
+    msg = set_light(light, option)
+    phases['set_light'] = time.time() - start_time
+    if msg is not None:
+        exec_times[str(option)] = msg
+        return {'phases': phases, 'error': msg}
 
-    # Set the light conditions in the SOL box
-    try:
-        light.set_light(**option)
-    except Exception as e:
-        print(e)
-
-        print("Sleep for 2 secs before retrying")
-        time.sleep(2) # sleep for 2 secs before retrying it
+    phase_start = time.time()
+    readout = light.sampled_luminance(since=phase_start)
+    print(f"Chromameter readout:{readout}")
+    phases['readout'] = time.time() - phase_start
 
-        # there was exception, hence reTrying to set the light in the box for second time..
-        print("There was exception, hence reTrying to set the light in the box for second time..")
-        try:
-            light.reconnect()
-        except Exception as e:
-            exec_time_dict[str(option)]="Exception in setting light env in sol box." 
-            continue
-
-    print(f"Chromameter readout:{light.get_avg_luminance()}")
     msg=""
+    phase_start = time.time()
     try:
-        supernova_test(option, today, chromameter, capture_mode='LIVESTREAMING')    # execute the tests for this given option
+        supernova_test(option, today, chromameter, capture_mode, point.samples)    # execute the tests for this given option
     except Exception as e:
-        msg="Exception encountered while executing the test, may be timeout exception" 
-        
+        msg="Exception encountered while executing the test, may be timeout exception"
+    phases['test'] = time.time() - phase_start
+
     end_time = time.time() # End timer
 
     elapsed_time = end_time - start_time # Execution time
 
+    stability[str(option)]=light.sampled_window(start_time, end_time)
+    print(f"Light stability:{stability[str(option)]}")
+
     if len(msg)==0:
-        exec_time_dict_live[str(option)]=elapsed_time     # make an entry into the exec_time diectionary, execution time taken for executing this option
+        exec_times[str(option)]=elapsed_time     # make an entry into the exec_time diectionary, execution time taken for executing this option
     else:
-        exec_time_dict_live[str(option)]=msg              # if there is an exception during execution, login a message in the dictionary instead of execution time..
+        exec_times[str(option)]=msg              # if there is an exception during execution, login a message in the dictionary instead of execution time..
 
     # Rebooting the device on completion of one run of lux values from 0-1000
-    if option['luminance'] == 1.0:
+    # A failed reboot does not fail the option, its capture is done
+    reboot_error = None
+    if reboot_after(point):
         try:
-            #import pdb; pdb.set_trace()
-            print(f'Rebooting the device at the end of run of lux from 0-1000')
-            output = subprocess.check_output(cmd_to_reboot_device, shell=True)
-            print(output)
-            time.sleep(60) # wait for the device to be back up and reinitialize
-
-        except subprocess.TimeoutExpired:
-            print(f'Failed to Reboot the device..')
-            raise Exception("Exception in rebooting the device..")
+            phases['reboot'] = reboot_device()
+        except Exception as e:
+            reboot_error = str(e)
 
     # once the test-run is done sleep for 5s
+    phase_start = time.time()
     time.sleep(2) # after execution of every option, sleep for 5 secs to reinitialize
+    phases['cooldown'] = time.time() - phase_start
 
     # TODO: check if the number of captures in media folder is equal to count in n
 
     print("#### End of run #####")
-
-print("========= END of LIVESTREAMING-mode run ==========")
-
-
-# TODO: Process the exection dcitonhary and find out for which all options, supernova test-execution failed in LIVESTREAMING mode; exec_time_dict_live
-'''
-print("Printing all the options where supernova_test execution failed.. in SNAPSHOT MODE")
-for k, v in exec_time_dict_live.items():
-    if "Exception encountered" in v:
-        print(k)
-
-print("Printing successful execution times of all the options.. in SNAPSHOT MODE")
-for k, v in exec_time_dict.items():
-    if "Exception encountered" not in v:
-        print(k, v)
-'''
-
-print("Done with Test")
+    return {'phases': phases,
+            'output': supernova_output(option, today, chromameter, capture_mode),
+            'readout': readout,
+            'light_stability': stability[str(option)],
+            'reboot_error': reboot_error,
+            'error': msg or None}
 
 
+def pipelined_execute(light, today, chromameter, capture_done=None, reboot_after=end_of_sweep):
+    '''
+    Pipelined alternative to run_option, for MatrixRunner(..., lookahead=True): the
+    supernova test runs in the background and the light moves to the next option as
+    soon as the capture ends (capture_done matches its output, or when it exits).
+    '''
+    def after_test(point):
+        # Rebooting the device on completion of one run of lux values from 0-1000
+        if reboot_after(point):
+            return {'reboot': reboot_device()}
+
+    executor = PipelinedExecutor(light,
+                                 lambda point: supernova_command(point.option, today, chromameter,
+                                                                 point.capture_mode, point.samples),
+                                 capture_done=capture_done, after_test=after_test, cooldown=2,
+                                 set_light=set_light)
+
+    def execute(point, next_point):
+        if point.capture_mode == 'SNAPSHOT':
+            exec_times, stability = exec_time_dict, light_stability_dict
+        else:
+            exec_times, stability = exec_time_dict_live, light_stability_dict_live
+        print(f"#### Start of individual run - {point.capture_mode} (pipelined) #####")
+        print(f"Option:{point.option}")
+        start_time = time.time()
+        result = executor.execute(point, next_point)
+        if 'capture_window' in result:
+            stability[str(point.option)] = light.sampled_window(*result['capture_window'])
+            result['light_stability'] = stability[str(point.option)]
+        if 'after_test_error' in result:
+            result['reboot_error'] = result.pop('after_test_error')
+        exec_times[str(point.option)] = result.get('error') or time.time() - start_time
+        print("#### End of run #####")
+        return dict(result, output=supernova_output(point.option, today, chromameter, point.capture_mode))
+
+    return execute
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Supernova test matrix on the light box')
+    parser.add_argument('--resume', help='Journal of an interrupted run: skip its completed options, '
+                        'retry the failed ones and keep its results folder', default=None)
+    parser.add_argument('--spec', help='JSON/YAML test matrix spec (see matrix_spec), the default matrix if not set',
+                        default=None)
+    parser.add_argument('--capture_modes', nargs='+', help='Only run these capture modes of the spec', default=None)
+    parser.add_argument('--shard', help='Run shard k of n of the matrix, as k/n with k from 0', default=None)
+    parser.add_argument('--fraction', help='Random fraction of the matrix to run, e.g. 0.05 for a smoke test',
+                        type=float, default=None)
+    parser.add_argument('--seed', help='Seed of the --fraction subset', type=int, default=0)
+    parser.add_argument('--limit', help='Run at most this many options', type=int, default=None)
+    parser.add_argument('--pipelined', help='Move the light to the next option while the test post-processes',
+                        default=False, action='store_true')
+    parser.add_argument('--capture_done', help='Regex on the supernova test output marking the end of its '
+                        'capture, with --pipelined. Without it the light moves once the test exited', default=None)
+    parser.add_argument('--schedule', help='Reorder the options to minimise the predicted wall time',
+                        default=False, action='store_true')
+    parser.add_argument('--history', help='Journals of previous runs the wall time prediction is fitted on',
+                        default=os.path.join('results', '*', 'journal.jsonl'))
+    args = parser.parse_args()
+
+    # Create your presets
+    spec = MatrixSpec.load(args.spec) if args.spec else MatrixSpec.default()
+    capture_modes = args.capture_modes or spec.capture_modes
+    options = list(spec.expand(where=lambda point: point.capture_mode in capture_modes,
+                               shard=parse_shard(args.shard) if args.shard else None,
+                               fraction=args.fraction, seed=args.seed, limit=args.limit))
+    light = light_box()
+    if args.resume:
+        journal = Journal(args.resume)
+        if journal.header is None:
+            raise Exception(f"No run header in journal {args.resume}")
+        today = journal.header['today']
+        chromameter = journal.header['chromameter']
+    else:
+        today = datetime.datetime.now().strftime("%Y%m%d_%H%M")
+        chromameter = light.get_avg_luminance()
+        journal = Journal(os.path.join('results', today, 'journal.jsonl'))
+        journal.start(today=today, chromameter=chromameter)
+
+    # Sample the chromameters in the background, so light stability can be logged per option
+    light.start_sampling(rate=10)
+
+    print(today)
+    print(f'Chromameter readout: {chromameter}')
+    print(f'Journal: {journal.path}')
+    print(f'{len(options)} of {len(spec)} options')
+
+    # Predict the wall time of the options left from the timings of previous runs
+    model = CostModel.from_journals(sorted(glob.glob(args.history)))
+    completed = journal.completed()
+    pending = [point for point in options if point_key(point) not in completed]
+    if args.schedule:
+        plan = schedule(pending, model)
+        reboot_after = plan.reboot
+    else:
+        plan = Schedule(pending, set(point.index for point in pending if end_of_sweep(point)), model)
+        reboot_after = end_of_sweep
+    print(plan.report())
 
+    if args.pipelined:
+        runner = MatrixRunner(journal, pipelined_execute(light, today, chromameter, args.capture_done, reboot_after),
+                              lookahead=True)
+    else:
+        runner = MatrixRunner(journal, lambda point: run_option(light, point, today, chromameter, reboot_after))
+    run_start = time.time()
+    if args.schedule:
+        runner.run(plan.points)
+    else:
+        for capture_mode in capture_modes:
+            print(f"========= Start of {capture_mode}-mode run ==========")
+            runner.run(point for point in options if point.capture_mode == capture_mode)
+            print(f"========= END of {capture_mode}-mode run ==========")
+    print(f"Wall time {time.time() - run_start:.0f} s, predicted {plan.predicted['total']:.0f} s")
+
+    failed = journal.failed()
+    if failed:
+        print("Printing all the options where supernova_test execution failed..")
+        for key in sorted(failed):
+            print(key)
+        print(f"Rerun with --resume {journal.path} to retry them")
+    reboot_failures = [entry['key'] for entry in journal.entries if entry.get('reboot_error')]
+    if reboot_failures:
+        print("Device reboot failed after these options, their captures were kept..")
+        for key in reboot_failures:
+            print(key)
+
+    light.stop_sampling()
+
+    print("Done with Test")
+
+
+if __name__ == '__main__':
+    main()
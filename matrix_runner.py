@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+import os
+import json
+import time
+import datetime
+
+'''
+    Resumable test matrix runs.
+
+    Every finished option is appended to a JSONL journal and fsync'd before the next
+    one starts, so a crash loses at most the option that was running. Running again
+    with the same journal skips the options that completed and retries the failed
+    ones:
+
+        journal = Journal('results/journal.jsonl')
+        MatrixRunner(journal, execute).run(MatrixSpec.default().expand())
+
+    The first line of a journal is a header with the run name (the results folder),
+    so a resumed run keeps writing to the folder it started in.
+'''
+
+
+def option_key(option, capture_mode, metadata=None):
+    '''
+        Stable identifier of one option in one capture mode.
+    '''
+    if metadata:
+        return json.dumps([capture_mode, option, metadata], sort_keys=True)
+    return json.dumps([capture_mode, option], sort_keys=True)
+
+
+def point_key(point):
+    return option_key(point.option, point.capture_mode, point.metadata)
+
+
+class Journal(object):
+    '''
+        Append only JSONL log of the options a run finished.
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.header = None
+        self.entries = []
+        try:
+            with open(path) as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+        for number, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash, only possible at the end.
+                if number != len(lines) - 1:
+                    raise
+                continue
+            if 'header' in entry:
+                self.header = entry['header']
+            else:
+                self.entries.append(entry)
+
+    def start(self, **header):
+        '''
+            Header of the run, written once when the journal is new and returned as
+            stored when resuming.
+        '''
+        if self.header is None:
+            self.header = dict(header, started=datetime.datetime.now().isoformat(timespec='seconds'))
+            self._append({'header': self.header})
+        return self.header
+
+    def _append(self, entry):
+        directory = os.path.dirname(self.path)
+        new = not os.path.exists(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        if new and directory:
+            # Make the new file itself survive a crash.
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def record(self, entry):
+        self._append(entry)
+        self.entries.append(entry)
+
+    def latest(self):
+        '''
+            Last entry per option key.
+        '''
+        return {entry['key']: entry for entry in self.entries}
+
+    def completed(self):
+        return set(key for key, entry in self.latest().items() if entry['status'] == 'ok')
+
+    def failed(self):
+        return set(key for key, entry in self.latest().items() if entry['status'] != 'ok')
+
+
+class MatrixRunner(object):
+    '''
+        Runs execute(point) for every matrix_spec.MatrixPoint not yet completed in the
+        journal. execute returns a dict with the option's phase timings and output
+        path; an 'error' in it, or an exception, marks the option failed. Failed
+        options are retried by the next run with the same journal.
+        With lookahead, execute(point, next_point) also gets the point that runs
+        next (None for the last one), see pipelined_executor.
+    '''
+    def __init__(self, journal, execute, verbose=1, lookahead=False):
+        self.journal = journal
+        self.execute = execute
+        self.verbose = verbose
+        self.lookahead = lookahead
+
+    def pending(self, points):
+        completed = self.journal.completed()
+        return [point for point in points if point_key(point) not in completed]
+
+    def run(self, points):
+        '''
+            Run the pending points in order, returns the journal entries written.
+        '''
+        points = list(points)
+        pending = self.pending(points)
+        attempts = {}
+        for entry in self.journal.entries:
+            attempts[entry['key']] = entry.get('attempt', 1)
+        if self.verbose > 0:
+            print('{} options to run, {} already completed'.format(len(pending), len(points) - len(pending)))
+        written = []
+        for index, point in enumerate(pending):
+            key = point_key(point)
+            attempts[key] = attempts.get(key, 0) + 1
+            start = time.time()
+            try:
+                if self.lookahead:
+                    result = self.execute(point, pending[index + 1] if index + 1 < len(pending) else None)
+                else:
+                    result = self.execute(point)
+            except Exception as e:
+                result = {'error': '{}: {}'.format(type(e).__name__, e)}
+            entry = dict(result, key=key, option=point.option, capture_mode=point.capture_mode,
+                         samples=point.samples, metadata=point.metadata,
+                         status='failed' if result.get('error') else 'ok',
+                         attempt=attempts[key], start=start, elapsed=time.time() - start)
+            self.journal.record(entry)
+            written.append(entry)
+        return written
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+import glob
+import json
+import statistics
+import collections
+from matrix_runner import Journal
+
+'''
+    Test matrix ordering by expected wall time.
+
+    CostModel estimates what an order costs: the light transition between
+    consecutive options (which of CCT and flicker change, plus the luminance step),
+    switching the capture mode, the capture by capture mode and sample count, the
+    cooldown after every option and the device reboots.
+
+    The device reboots once a sweep is complete, as in the generation order: a sweep
+    is the options differing only in luminance (one 0-1000 lux run). schedule()
+    keeps every sweep together, so the reboot count and the options between two
+    reboots do not change, and orders the sweeps and their direction (up or down in
+    luminance) to minimise the transitions and capture mode switches: nearest
+    neighbour, then 2-opt.
+
+        model = CostModel.from_journals(glob.glob('results/*/journal.jsonl'))
+        plan = schedule(points, model)
+        print(plan.report())
+        runner.run(plan.points)
+'''
+
+# Seconds, used for whatever the history does not cover.
+DEFAULT_COSTS = {'capture_base': 15.0,       # test start up and teardown
+                 'capture_per_sample': 1.0,  # per captured image (-n)
+                 'capture_mode': 5.0,        # extra capture time after a capture mode switch
+                 'reboot': 60.0,
+                 'cooldown': 2.0,
+                 'luminance_rate': 0.5,      # settle time per unit luminance step
+                 'transition': {'none': 0.1, 'luminance': 0.3, 'cct': 1.0, 'flicker_freq': 1.0,
+                                'cct+flicker_freq': 1.5}}
+
+# The axis swept between two reboots.
+SWEEP_AXIS = 'luminance'
+
+
+def transition_kind(a, b):
+    '''
+        Which light settings change from option a to option b: 'none', 'luminance',
+        'cct', 'flicker_freq' or 'cct+flicker_freq'.
+    '''
+    if a == b:
+        return 'none'
+    changed = [name for name in ('cct', 'flicker_freq') if a.get(name) != b.get(name)]
+    return '+'.join(changed) if changed else 'luminance'
+
+
+def sweep_key(point, axis=SWEEP_AXIS):
+    '''
+        Identifier of the sweep a point belongs to: everything but the swept axis.
+    '''
+    option = {name: value for name, value in point.option.items() if name != axis}
+    return json.dumps([point.capture_mode, option, point.metadata], sort_keys=True)
+
+
+class CostModel(object):
+    def __init__(self, costs=None, capture=None):
+        self.costs = dict(DEFAULT_COSTS, **(costs or {}))
+        self.costs['transition'] = dict(DEFAULT_COSTS['transition'], **self.costs['transition'])
+        # (capture_mode, samples) -> measured capture seconds
+        self.capture = dict(capture or {})
+
+    @classmethod
+    def from_journals(cls, paths, costs=None):
+        '''
+            Model fitted on the phase timings of previous runs: median capture time
+            per capture mode and sample count, median extra capture time after a
+            capture mode switch, median reboot time and median transition time per
+            transition kind, the defaults for the rest.
+        '''
+        captures = collections.defaultdict(list)
+        switched = []
+        transitions = collections.defaultdict(list)
+        reboots = []
+        for path in paths:
+            previous = None
+            for entry in sorted(Journal(path).entries, key=lambda e: e.get('start', 0)):
+                phases = entry.get('phases', {})
+                if entry.get('status') == 'ok' and 'test' in phases:
+                    key = (entry['capture_mode'], entry.get('samples'))
+                    if previous is not None and previous['capture_mode'] != entry['capture_mode']:
+                        switched.append((key, phases['test']))
+                    else:
+                        captures[key].append(phases['test'])
+                if 'reboot' in phases:
+                    reboots.append(phases['reboot'])
+                transition = entry.get('transition') or {}
+                spent = phases.get('set_light', transition.get('set_light'))
+                if previous is not None and spent is not None and not transition.get('overlapped'):
+                    spent += phases.get('readout', 0.0) + transition.get('settle', 0.0)
+                    transitions[transition_kind(previous['option'], entry['option'])].append(spent)
+                previous = entry
+        capture = {key: statistics.median(times) for key, times in captures.items()}
+        fitted = dict(costs or {})
+        extra = [test - capture[key] for key, test in switched if key in capture]
+        if extra:
+            fitted.setdefault('capture_mode', max(0.0, statistics.median(extra)))
+        if reboots:
+            fitted.setdefault('reboot', statistics.median(reboots))
+        fitted.setdefault('transition', {kind: statistics.median(times) for kind, times in transitions.items()})
+        return cls(fitted, capture)
+
+    def capture_cost(self, point):
+        measured = self.capture.get((point.capture_mode, point.samples))
+        if measured is not None:
+            return measured
+        return self.costs['capture_base'] + self.costs['capture_per_sample'] * (point.samples or 0)
+
+    def transition_cost(self, a, b):
+        '''
+            Seconds to move the light from point a to point b (a None: from dark).
+        '''
+        if a is None:
+            return self.costs['transition']['cct+flicker_freq'] + self.costs['luminance_rate'] * b.option.get('luminance', 0)
+        kind = transition_kind(a.option, b.option)
+        cost = self.costs['transition'].get(kind, self.costs['transition']['cct+flicker_freq'])
+        return cost + self.costs['luminance_rate'] * abs(a.option.get('luminance', 0) - b.option.get('luminance', 0))
+
+    def switch_cost(self, a, b):
+        '''
+            Extra seconds when point b runs in another capture mode than point a.
+        '''
+        if a is None or a.capture_mode == b.capture_mode:
+            return 0.0
+        return self.costs['capture_mode']
+
+    def step_cost(self, a, b):
+        '''
+            Order dependent seconds of running point b right after point a.
+        '''
+        return self.transition_cost(a, b) + self.switch_cost(a, b)
+
+    def total(self, points, reboots):
+        '''
+            Expected seconds to run points in order with the given number of reboots,
+            broken down per cost.
+        '''
+        pairs = list(zip([None] + points[:-1], points))
+        breakdown = {'capture': sum(self.capture_cost(p) for p in points),
+                     'transition': sum(self.transition_cost(a, b) for a, b in pairs),
+                     'mode_switch': sum(self.switch_cost(a, b) for a, b in pairs),
+                     'cooldown': self.costs['cooldown'] * len(points),
+                     'reboot': self.costs['reboot'] * reboots}
+        breakdown['total'] = sum(breakdown.values())
+        return breakdown
+
+
+class Schedule(object):
+    def __init__(self, points, reboot_after, model, baseline=None):
+        self.points = points
+        self.reboot_after = reboot_after    # MatrixPoint indexes followed by a reboot
+        self.model = model
+        self.predicted = model.total(points, len(reboot_after))
+        self.baseline = baseline            # Prediction for the input order
+
+    def reboot(self, point):
+        return point.index in self.reboot_after
+
+    def report(self):
+        def hours(seconds):
+            return '{:d}h{:02d}m{:02d}s'.format(int(seconds // 3600), int(seconds % 3600 // 60), int(seconds % 60))
+        lines = ['{} options, {} reboots, predicted wall time {}'.format(
+                 len(self.points), len(self.reboot_after), hours(self.predicted['total']))]
+        lines.append('\t' + ', '.join('{} {}'.format(k, hours(v)) for k, v in self.predicted.items() if k != 'total'))
+        if self.baseline is not None:
+            lines.append('\tgeneration order {}, saves {}'.format(
+                hours(self.baseline['total']), hours(self.baseline['total'] - self.predicted['total'])))
+        return '\n'.join(lines)
+
+
+def sweeps(points, axis=SWEEP_AXIS):
+    '''
+        Points grouped per sweep in first appearance order, each sweep sorted up
+        along axis.
+    '''
+    groups = collections.OrderedDict()
+    for point in points:
+        groups.setdefault(sweep_key(point, axis), []).append(point)
+    return [sorted(group, key=lambda p: p.option.get(axis, 0)) for group in groups.values()]
+
+
+def _order(groups, model):
+    '''
+        Sweep order and directions: nearest neighbour from dark, improved with 2-opt.
+        Step costs are symmetric, so reversing a run of sweeps (each one turned
+        around) only changes the two steps at its ends.
+    '''
+    remaining = list(groups)
+    order = []
+    current = None
+    while remaining:
+        best = min(((model.step_cost(current, sweep[0 if up else -1]), n, up)
+                    for n, sweep in enumerate(remaining) for up in (True, False)), key=lambda c: c[0])
+        sweep = remaining.pop(best[1])
+        order.append(sweep if best[2] else sweep[::-1])
+        current = order[-1][-1]
+
+    cost = model.step_cost
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order)):
+            before = order[i - 1][-1] if i > 0 else None
+            for j in range(i, len(order)):
+                after = order[j + 1][0] if j + 1 < len(order) else None
+                old = cost(before, order[i][0]) + (cost(order[j][-1], after) if after is not None else 0.0)
+                new = cost(before, order[j][-1]) + (cost(order[i][0], after) if after is not None else 0.0)
+                if new < old - 1e-9:
+                    order[i:j + 1] = [sweep[::-1] for sweep in reversed(order[i:j + 1])]
+                    improved = True
+    return order
+
+
+def schedule(points, model=None, axis=SWEEP_AXIS):
+    '''
+        Schedule of points minimising the expected wall time under model, with a
+        reboot after every sweep along axis.
+    '''
+    model = model or CostModel()
+    points = list(points)
+    groups = sweeps(points, axis)
+    baseline = model.total(points, len(groups))
+    order = _order(groups, model)
+    return Schedule([point for sweep in order for point in sweep], set(sweep[-1].index for sweep in order),
+                    model, baseline)
+
+
+def main():
+    import argparse
+    from matrix_spec import MatrixSpec
+    parser = argparse.ArgumentParser(description='Order a test matrix by predicted wall time')
+    parser.add_argument('spec', nargs='?', help='JSON/YAML matrix spec, the default lightbox matrix if not set')
+    parser.add_argument('--history', help='Glob of previous run journals', default='results/*/journal.jsonl')
+    parser.add_argument('--print', help='Print the scheduled options', action='store_true')
+    args = parser.parse_args()
+
+    spec = MatrixSpec.load(args.spec) if args.spec else MatrixSpec.default()
+    plan = schedule(spec.expand(), CostModel.from_journals(glob.glob(args.history)))
+    if args.print:
+        for point in plan.points:
+            print(point.capture_mode, point.option, 'reboot' if plan.reboot(point) else '')
+    print(plan.report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+import os
+import json
+import random
+import itertools
+import functools
+import collections
+
+'''
+    Declarative test matrices.
+
+    A MatrixSpec declares the axes of a sweep, the capture sample count per axis value
+    and the capture modes. expand() generates the matrix lazily, one MatrixPoint at a
+    time, and can filter it, take shard k of n or a random subset, so a sweep can be
+    split over machines or cut to a smoke test without editing code.
+
+    Specs are JSON (or YAML with PyYAML installed), e.g. the default lightbox matrix:
+
+        {"axes": {"flicker_freq": [0, 50, 60],
+                  "cct": [5500, 6500],
+                  "luminance": [{"range": [0, 10, 1], "scale": 0.001},
+                                {"range": [10, 100, 10], "scale": 0.001},
+                                {"range": [100, 1001, 100], "scale": 0.001}]},
+         "samples": {"default": 5, "flicker_freq": {"50": 30, "60": 30}},
+         "capture_modes": ["SNAPSHOT", "LIVESTREAMING"],
+         "exclude": [{"flicker_freq": 60, "cct": 6500}]}
+
+    Axes nest in the order given, the first one outermost, and capture modes are the
+    outermost loop. Axis values are numbers, strings, or {"range": [start, stop, step],
+    "scale": s} for start*s, (start+step)*s, ... below stop*s.
+'''
+
+# Axes passed to light_source.set_light, every other axis is metadata.
+LIGHT_PARAMETERS = ('luminance', 'cct', 'flicker_freq')
+
+MatrixPoint = collections.namedtuple('MatrixPoint', ['index', 'capture_mode', 'option', 'samples', 'metadata'])
+MatrixPoint.__doc__ = '''
+    One test: option holds the set_light arguments, metadata the other axes, index
+    the position in the full (unfiltered) matrix.
+'''
+
+DEFAULT_SPEC = {'axes': collections.OrderedDict([
+                    ('flicker_freq', [0, 50, 60]),
+                    ('cct', [5500, 6500]),
+                    ('luminance', [{'range': [0, 10, 1], 'scale': 0.001},
+                                   {'range': [10, 100, 10], 'scale': 0.001},
+                                   {'range': [100, 1001, 100], 'scale': 0.001}])]),
+                # 5 captures without flicker, 30 to cover the 50/60 Hz flicker period
+                'samples': {'default': 5, 'flicker_freq': {'50': 30, '60': 30}},
+                'capture_modes': ['SNAPSHOT', 'LIVESTREAMING']}
+
+
+def axis_values(values):
+    '''
+        Expand an axis declaration into its list of values.
+    '''
+    expanded = []
+    for value in values:
+        if isinstance(value, dict):
+            start, stop, step = value['range']
+            scale = value.get('scale', 1)
+            # Rounded so 7 * 0.001 gives the same float as 7 / 1000.
+            expanded.extend(round(v * scale, 12) if scale != 1 else v for v in range(start, stop, step))
+        else:
+            expanded.append(value)
+    return expanded
+
+
+def _matches(point_values, conditions):
+    return all(point_values.get(axis) == value for axis, value in conditions.items())
+
+
+class MatrixSpec(object):
+    def __init__(self, axes, samples=5, capture_modes=('SNAPSHOT',), exclude=()):
+        self.axes = collections.OrderedDict((name, axis_values(values)) for name, values in axes.items())
+        self.samples = samples
+        self.capture_modes = list(capture_modes)
+        self.exclude = list(exclude)
+        for name, values in self.axes.items():
+            if not values:
+                raise ValueError('Axis "{}" has no values'.format(name))
+
+    @classmethod
+    def from_dict(cls, spec):
+        unknown = set(spec) - {'axes', 'samples', 'capture_modes', 'exclude'}
+        if unknown:
+            raise ValueError('Unknown matrix spec keys: {}'.format(sorted(unknown)))
+        return cls(spec['axes'], spec.get('samples', 5), spec.get('capture_modes', ['SNAPSHOT']),
+                   spec.get('exclude', ()))
+
+    @classmethod
+    def default(cls):
+        return cls.from_dict(DEFAULT_SPEC)
+
+    @classmethod
+    def load(cls, path):
+        '''
+            Spec from a JSON file, or YAML for .yaml/.yml files (needs PyYAML).
+        '''
+        with open(path) as f:
+            if os.path.splitext(path)[1] in ('.yaml', '.yml'):
+                try:
+                    import yaml
+                except Exception:
+                    raise Exception('Failed to import "yaml" module\nTry to install "pyyaml": '
+                                    '\033[91mpython3 -m pip install pyyaml --user\033[0m')
+                return cls.from_dict(yaml.safe_load(f))
+            return cls.from_dict(json.load(f, object_pairs_hook=collections.OrderedDict))
+
+    def __len__(self):
+        '''
+            Size of the full matrix, before exclusions and selections.
+        '''
+        return len(self.capture_modes) * functools.reduce(lambda n, v: n * len(v), self.axes.values(), 1)
+
+    def samples_for(self, values):
+        '''
+            Capture sample count of a point: the count of the first axis with an
+            entry for the point's value on that axis, else the default.
+        '''
+        if not isinstance(self.samples, dict):
+            return self.samples
+        for axis, counts in self.samples.items():
+            if axis == 'default' or axis not in values:
+                continue
+            for value, count in counts.items():
+                if str(values[axis]) == str(value):
+                    return count
+        return self.samples.get('default', 5)
+
+    def points(self):
+        '''
+            Every point of the matrix in order, exclusions applied.
+        '''
+        names = list(self.axes)
+        index = 0
+        for capture_mode in self.capture_modes:
+            for combination in itertools.product(*self.axes.values()):
+                values = dict(zip(names, combination))
+                point_index = index
+                index += 1
+                if any(_matches(dict(values, capture_mode=capture_mode), c) for c in self.exclude):
+                    continue
+                option = {name: values[name] for name in names if name in LIGHT_PARAMETERS}
+                metadata = {name: values[name] for name in names if name not in LIGHT_PARAMETERS}
+                yield MatrixPoint(point_index, capture_mode, option, self.samples_for(values), metadata)
+
+    def expand(self, where=None, shard=None, fraction=None, seed=0, limit=None):
+        '''
+            Lazily selected points:
+                where       predicate on a MatrixPoint
+                shard       (k, n), every n-th point starting at the k-th (0 based),
+                            on the full matrix index so shards do not depend on where
+                fraction    keep each point with this probability, decided per index
+                            and seed so every machine agrees on the subset
+                limit       stop after this many points
+        '''
+        if shard is not None:
+            k, n = shard
+            if not 0 <= k < n:
+                raise ValueError('Shard {} of {} out of range'.format(k, n))
+        selected = 0
+        for point in self.points():
+            if limit is not None and selected >= limit:
+                return
+            if shard is not None and point.index % n != k:
+                continue
+            if fraction is not None and random.Random('{}:{}'.format(seed, point.index)).random() >= fraction:
+                continue
+            if where is not None and not where(point):
+                continue
+            selected += 1
+            yield point
+
+
+def parse_shard(text):
+    '''
+        "k/n" -> (k, n), k is 0 based.
+    '''
+    k, n = text.split('/')
+    return int(k), int(n)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Print the options of a test matrix spec')
+    parser.add_argument('spec', nargs='?', help='JSON/YAML matrix spec, the default lightbox matrix if not set')
+    parser.add_argument('--shard', help='Run shard k of n, as k/n with k from 0', default=None)
+    parser.add_argument('--fraction', help='Random fraction of the matrix to keep', type=float, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--limit', type=int, default=None)
+    args = parser.parse_args()
+
+    spec = MatrixSpec.load(args.spec) if args.spec else MatrixSpec.default()
+    shard = parse_shard(args.shard) if args.shard else None
+    count = 0
+    for point in spec.expand(shard=shard, fraction=args.fraction, seed=args.seed, limit=args.limit):
+        print(json.dumps(point._asdict()))
+        count += 1
+    print('{} of {} options'.format(count, len(spec)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+import re
+import time
+import shlex
+import threading
+import subprocess
+
+'''
+    Pipelined test execution: overlap light transitions with test post-processing.
+
+    A sequential run sets the light, waits for it, runs the test and only then moves
+    to the next option. PipelinedExecutor starts the test process asynchronously and
+    watches its output. Once the capture is over (a line matching capture_done, or the
+    process exit when no pattern is given) the light moves to the next option's state
+    and settles while the test is still post-processing.
+
+    An Interlock guarantees a capture never overlaps a transition: a capture waits for
+    a running transition to finish, a transition waits for a running capture, and the
+    light state is checked against the option before every capture starts.
+
+        executor = PipelinedExecutor(light, lambda point: ['python3', 'test.py', ...],
+                                     capture_done=r'Post-processing')
+        MatrixRunner(journal, executor.execute, lookahead=True).run(points)
+'''
+
+
+class InterlockError(Exception):
+    pass
+
+
+class Interlock(object):
+    '''
+        Light transitions and captures exclude each other.
+    '''
+    def __init__(self):
+        self.state = 'idle'
+        self._cond = threading.Condition()
+
+    def _enter(self, state, timeout=None):
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.state == 'idle', timeout):
+                raise InterlockError('Timed out waiting for {} to end before {}'.format(self.state, state))
+            self.state = state
+
+    def _exit(self):
+        with self._cond:
+            self.state = 'idle'
+            self._cond.notify_all()
+
+    def transition(self, timeout=None):
+        return _InterlockSection(self, 'transition', timeout)
+
+    def capture(self, timeout=None):
+        return _InterlockSection(self, 'capture', timeout)
+
+
+class _InterlockSection(object):
+    def __init__(self, interlock, state, timeout):
+        self.interlock = interlock
+        self.state = state
+        self.timeout = timeout
+
+    def __enter__(self):
+        self.interlock._enter(self.state, self.timeout)
+        return self
+
+    def __exit__(self, *exc):
+        self.interlock._exit()
+        return False
+
+
+class TestProcess(object):
+    '''
+        Test subprocess whose output is read by a thread. capture_done is set when a
+        line matches the pattern, or at exit.
+    '''
+    def __init__(self, command, capture_done=None, echo=True):
+        self.command = command
+        self.pattern = re.compile(capture_done) if capture_done else None
+        self.echo = echo
+        self.output = []
+        self.started = time.monotonic()
+        self.capture_ended = None
+        self.capture_done = threading.Event()
+        self.process = subprocess.Popen(command, shell=isinstance(command, str), stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, universal_newlines=True, bufsize=1)
+        self._reader = threading.Thread(target=self._read, daemon=True, name='TestProcess')
+        self._reader.start()
+
+    def _read(self):
+        try:
+            for line in self.process.stdout:
+                self.output.append(line)
+                if self.echo:
+                    print(line, end='')
+                if self.pattern is not None and not self.capture_done.is_set() and self.pattern.search(line):
+                    self._end_capture()
+        finally:
+            self.process.wait()
+            if not self.capture_done.is_set():
+                self._end_capture()
+
+    def _end_capture(self):
+        self.capture_ended = time.monotonic()
+        self.capture_done.set()
+
+    def wait_capture(self, timeout=None):
+        return self.capture_done.wait(timeout)
+
+    def wait(self, timeout=None):
+        try:
+            returncode = self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            raise
+        self._reader.join()
+        return returncode
+
+
+class PipelinedExecutor(object):
+    '''
+        execute(point, next_point) for MatrixRunner(..., lookahead=True).
+
+        command(point) gives the test command line (string for the shell, or list),
+        after_test(point), if set, runs once the test exited (e.g. a device reboot),
+        it may return a dict of phase times to record (e.g. {'reboot': seconds}), an
+        exception it raises is recorded as after_test_error without failing the
+        option. cooldown seconds are waited after each test. The light transitions
+        to next_point while the test post-processes, the reboot and the cooldown.
+        set_light(light, option), if set, replaces light.set_light(**option) (e.g. to
+        reconnect and retry), it returns an error message on failure, None on success.
+    '''
+    def __init__(self, light, command, capture_done=None, after_test=None, cooldown=0.0, settle=True,
+                 timeout=None, echo=True, set_light=None):
+        self.light = light
+        self.command = command
+        self.set_light = set_light
+        self.capture_done = capture_done
+        self.after_test = after_test
+        self.cooldown = cooldown
+        self.settle = settle
+        self.timeout = timeout
+        self.echo = echo
+        self.interlock = Interlock()
+        self._transition = None
+
+    def _set_state(self, option):
+        '''
+            Move the light to option and wait for it to settle, returns the phase times.
+        '''
+        phases = {}
+        with self.interlock.transition():
+            with self.light.instrumentation.span('pipeline.transition'):
+                start = time.perf_counter()
+                if self.set_light is None:
+                    self.light.set_light(**option)
+                else:
+                    error = self.set_light(self.light, option)
+                    if error is not None:
+                        raise Exception(error)
+                phases['set_light'] = time.perf_counter() - start
+                if self.settle and self.light.chromameters:
+                    start = time.perf_counter()
+                    result = self.light.wait_for_settle()
+                    phases['settle'] = time.perf_counter() - start
+                    phases['lux'] = result.value
+        return phases
+
+    def _start_transition(self, option):
+        transition = {'option': option, 'error': None}
+
+        def run():
+            try:
+                transition['phases'] = self._set_state(option)
+            except Exception as e:
+                transition['error'] = e
+
+        transition['thread'] = threading.Thread(target=run, daemon=True, name='PipelinedTransition')
+        transition['thread'].start()
+        self._transition = transition
+
+    def _finish_transition(self, option):
+        '''
+            Phases of the transition to option started by the previous point, None
+            when there was none. A failed or mismatched transition is redone here.
+        '''
+        transition, self._transition = self._transition, None
+        if transition is None:
+            return None
+        transition['thread'].join()
+        if transition['error'] is not None or transition['option'] != option:
+            return None
+        return dict(transition['phases'], overlapped=True)
+
+    def _check_state(self, option):
+        for name in ('luminance', 'cct'):
+            if option.get(name) is None:
+                continue  # Unset, the light keeps its value
+            expected = option[name]
+            if name == 'luminance':
+                # light_source caps luminance to 1.0
+                expected = min(expected, 1.0)
+            if getattr(self.light, name) != expected:
+                raise InterlockError('Light {} is {}, capture needs {}'.format(name, getattr(self.light, name),
+                                                                                expected))
+
+    def execute(self, point, next_point=None):
+        option = point.option
+        result = {'phases': {}}
+        transition = self._finish_transition(option)
+        if transition is None:
+            transition = self._set_state(option)
+        result['transition'] = transition
+
+        command = self.command(point)
+        result['command'] = command if isinstance(command, str) else ' '.join(shlex.quote(c) for c in command)
+        with self.interlock.capture():
+            self._check_state(option)
+            capture_start = time.time()
+            test = TestProcess(command, self.capture_done, echo=self.echo)
+            if not test.wait_capture(self.timeout):
+                test.process.kill()
+                test.wait()
+                result['error'] = 'Capture did not end within {} s'.format(self.timeout)
+                return result
+            capture_end = time.time()
+        result['phases']['capture'] = test.capture_ended - test.started
+        result['capture_window'] = (capture_start, capture_end)
+
+        if next_point is not None:
+            self._start_transition(next_point.option)
+        try:
+            returncode = test.wait(self.timeout)
+        except subprocess.TimeoutExpired:
+            result['error'] = 'Test did not exit within {} s'.format(self.timeout)
+            return result
+        result['phases']['test'] = time.monotonic() - test.started
+        result['phases']['post_processing'] = time.monotonic() - test.capture_ended
+        result['returncode'] = returncode
+        if returncode != 0:
+            result['error'] = 'Test exited with {}'.format(returncode)
+
+        if self.after_test is not None:
+            start = time.perf_counter()
+            try:
+                result['phases'].update(self.after_test(point) or {})
+            except Exception as e:
+                # The capture is done, the option does not fail with it.
+                result['after_test_error'] = '{}: {}'.format(type(e).__name__, e)
+            result['phases']['after_test'] = time.perf_counter() - start
+        if self.cooldown:
+            time.sleep(self.cooldown)
+            result['phases']['cooldown'] = self.cooldown
+        return result
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+import os
+import sys
+import csv
+import json
+import time
+import collections
+
+'''
+    Batch playlists for light_control.
+
+    A playlist is a sequence of setpoints applied in one process over one serial
+    connection, either CSV with a header row or JSONL with one object per line:
+
+        luminance,cct,flicker_freq,dwell,calibrated,readback
+        0.5,5000,0,2,,1
+        300,6500,,5,1,1
+
+    luminance is the 0-1 command, or lux when calibrated (set_light_abs). dwell holds
+    the state that many seconds after it was applied and read back. Every step
+    produces one JSON result line with the achieved lux, settle time and SolBox ack
+    latency:
+
+        python3 light_control.py -s solbox --playlist sweep.csv > results.jsonl
+
+    In playlist mode light_control prints its diagnostics to stderr, so stdout only
+    carries the result lines.
+'''
+
+Step = collections.namedtuple('Step', ['luminance', 'cct', 'flicker_freq', 'dwell', 'calibrated', 'readback'])
+Step.__new__.__defaults__ = (None, 0, 0.0, False, False)
+
+_TRUE = ('1', 'true', 'yes', 'y')
+
+
+def _step(entry, defaults):
+    '''
+        Step from a CSV row or JSON object, missing or empty fields from defaults.
+    '''
+    values = dict(defaults)
+    for field in Step._fields:
+        value = entry.get(field)
+        if value is None or value == '':
+            continue
+        if field in ('calibrated', 'readback'):
+            value = value if isinstance(value, bool) else str(value).strip().lower() in _TRUE
+        elif field in ('luminance', 'dwell'):
+            value = float(value)
+        else:
+            value = int(float(value))
+        values[field] = value
+    if values.get('luminance') is None:
+        raise ValueError('Playlist step without luminance: {}'.format(entry))
+    return Step(**values)
+
+
+def load_playlist(path, **defaults):
+    '''
+        Steps of a CSV or JSONL playlist, JSONL when the path ends in .jsonl/.json
+        or the first non empty line starts with "{". "-" reads stdin. defaults fill
+        fields a step leaves out, e.g. cct=5000.
+    '''
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path) as f:
+            lines = f.read().splitlines()
+    content = [line for line in lines if line.strip() and not line.lstrip().startswith('#')]
+    if not content:
+        return []
+    if os.path.splitext(path)[1] in ('.jsonl', '.json') or content[0].lstrip().startswith('{'):
+        entries = [json.loads(line) for line in content]
+    else:
+        entries = [{k.strip(): v.strip() if isinstance(v, str) else v for k, v in row.items()}
+                   for row in csv.DictReader(content)]
+    return [_step(entry, defaults) for entry in entries]
+
+
+def run_step(light, step):
+    '''
+        Apply one step and return its result dict.
+    '''
+    result = {'luminance': step.luminance, 'cct': step.cct, 'flicker_freq': step.flicker_freq,
+              'calibrated': step.calibrated}
+    start = time.perf_counter()
+    light.last_ack_latency = None
+    if step.calibrated:
+        light.set_light_abs(abs_luminance=step.luminance, cct=step.cct, flicker_freq=step.flicker_freq)
+        settled = light.last_settle
+    else:
+        light.set_light(luminance=step.luminance, cct=step.cct, flicker_freq=step.flicker_freq)
+        settled = None
+    result['command_ms'] = (time.perf_counter() - start) * 1e3
+    if light.last_ack_latency is not None:
+        result['ack_latency_ms'] = light.last_ack_latency * 1e3
+    if step.readback and light.chromameters and settled is None:
+        settled = light.wait_for_settle()
+    if settled is not None:
+        result.update(lux=settled.value, settled=settled.settled, settle_time=settled.settle_time)
+    result['command_luminance'] = light.luminance
+    result['cct'] = light.cct
+    if step.dwell:
+        time.sleep(step.dwell)
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def run_playlist(light, steps, output=sys.stdout):
+    '''
+        Run steps in order, writing one JSON line per step to output as it finishes.
+        A failing step is reported with its error and the playlist continues.
+        Returns the number of failed steps.
+    '''
+    failures = 0
+    for index, step in enumerate(steps):
+        try:
+            result = run_step(light, step)
+        except Exception as e:
+            failures += 1
+            light.instrumentation.count('playlist_step_error')
+            result = dict(step._asdict(), error='{}: {}'.format(type(e).__name__, e))
+        result['step'] = index
+        result['time'] = time.time()
+        output.write(json.dumps(result) + '\n')
+        output.flush()
+    return failures
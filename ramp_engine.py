@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+import time
+import threading
+import collections
+import numpy as np
+from light_control import ArriFrameEncoder, _CONFIG_ARRI
+from command_queue import MAX_COMMAND_RATE
+
+'''
+    Timed light transitions.
+
+    A ramp is a list of Keyframes, each one moving the light from the previous state
+    to (luminance, cct) over duration seconds with an easing curve. render_frames()
+    precomputes every frame at a fixed rate in one vectorized pass, RampPlayer plays
+    them from its own thread on absolute deadlines and reports the timing jitter.
+
+        dawn = [Keyframe(0.0, 2700, 0), Keyframe(0.3, 4000, 60, 'ease_in'),
+                Keyframe(1.0, 6500, 120, 'ease_in_out')]
+        player = RampPlayer(light, dawn).play()
+        print(player.timing())
+'''
+
+Keyframe = collections.namedtuple('Keyframe', ['luminance', 'cct', 'duration', 'easing'])
+Keyframe.__new__.__defaults__ = ('linear',)
+
+EASINGS = {'linear': lambda t: t,
+           'ease_in': lambda t: t * t,
+           'ease_out': lambda t: 1 - (1 - t) ** 2,
+           'ease_in_out': lambda t: t * t * (3 - 2 * t),
+           'step': lambda t: (t >= 1.0).astype(float)}
+
+
+def render_frames(keyframes, rate, start=None):
+    '''
+        Frame times (s from ramp start), luminance and cct arrays at rate frames per
+        second, the last frame always at the end of the ramp. start is the
+        (luminance, cct) before the first keyframe, by default the first keyframe
+        itself. CCT is interpolated in mired, which is closer to perceptually
+        uniform than kelvin.
+    '''
+    keyframes = [Keyframe(*k) for k in keyframes]
+    if not keyframes:
+        raise ValueError('No keyframes')
+    for k in keyframes:
+        if k.easing not in EASINGS:
+            raise ValueError('Unknown easing "{}", use one of {}'.format(k.easing, list(EASINGS)))
+    if start is None:
+        start = (keyframes[0].luminance, keyframes[0].cct)
+    lum = np.array([start[0]] + [k.luminance for k in keyframes], dtype=float)
+    mired = 1e6 / np.array([start[1]] + [k.cct for k in keyframes], dtype=float)
+    ends = np.cumsum([k.duration for k in keyframes], dtype=float)
+    begins = ends - [k.duration for k in keyframes]
+
+    times = np.arange(int(np.floor(ends[-1] * rate + 1e-9)) + 1) / float(rate)
+    if ends[-1] - times[-1] > 1e-9:
+        # The ramp ends between two frames, the last frame is the end state.
+        times = np.append(times, ends[-1])
+    segment = np.minimum(np.searchsorted(ends, times, side='left'), len(keyframes) - 1)
+    span = ends[segment] - begins[segment]
+    fraction = np.ones_like(times)
+    moving = span > 0
+    fraction[moving] = np.clip((times[moving] - begins[segment][moving]) / span[moving], 0, 1)
+    for name, easing in EASINGS.items():
+        mask = np.array([keyframes[s].easing == name for s in range(len(keyframes))])[segment]
+        if mask.any():
+            fraction[mask] = easing(fraction[mask])
+    luminance = lum[segment] + (lum[segment + 1] - lum[segment]) * fraction
+    cct = 1e6 / (mired[segment] + (mired[segment + 1] - mired[segment]) * fraction)
+    return times, luminance, cct
+
+
+class RampPlayer(object):
+    '''
+        Fixed rate playback of a ramp on a light_source. Arri frames are pre-encoded
+        into one buffer and written directly, other backends go through set_light.
+        A frame more than one period late is skipped so the ramp keeps its duration.
+    '''
+    def __init__(self, light, keyframes, rate=None, start=None, **kwargs):
+        self.light = light
+        self.rate = rate or self.max_rate(light)
+        if start is None:
+            start = (light.luminance, light.cct)
+        self.times, self.luminance, self.cct = render_frames(keyframes, self.rate, start)
+        self.luminance = np.clip(self.luminance, 0.0, 1.0)
+        self.kwargs = kwargs
+        self._frames = None
+        if light.selected_source == 'arri':
+            states = np.stack([self.luminance, self.cct], axis=-1)
+            self._frames = list(ArriFrameEncoder.frames(ArriFrameEncoder().encode_batch(states)))
+        self.lateness = np.full(len(self.times), np.nan)
+        self.skipped = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self.error = None
+
+    @staticmethod
+    def max_rate(light):
+        '''
+            Default frame rate: the backend's command rate, capped for Arri by how many
+            frames per second the serial link can carry (10 bits per byte).
+        '''
+        rate = MAX_COMMAND_RATE.get(light.selected_source) or 44.0
+        if light.selected_source == 'arri':
+            baudrate = getattr(light.serial, 'baudrate', None) or _CONFIG_ARRI['baudrate']
+            rate = min(rate, baudrate / 10.0 / ArriFrameEncoder.frame_size)
+        return rate
+
+    @property
+    def duration(self):
+        return float(self.times[-1])
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name='RampPlayer')
+        self._thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        if self.error is not None:
+            raise self.error
+        return self
+
+    def play(self):
+        return self.start().wait()
+
+    def stop(self):
+        self._stop.set()
+
+    def _send(self, index):
+        light = self.light
+        if self._frames is not None:
+            light.luminance, light.cct = float(self.luminance[index]), float(self.cct[index])
+            light.serial.write(self._frames[index])
+        else:
+            light.set_light(luminance=float(self.luminance[index]), cct=float(self.cct[index]), **self.kwargs)
+
+    def _run(self):
+        if self.light.selected_source != 'dummy' and self.light.serial is None:
+            self.light._open()
+        period = 1.0 / self.rate
+        t0 = time.perf_counter()
+        try:
+            for index, offset in enumerate(self.times):
+                if self._stop.is_set():
+                    break
+                deadline = t0 + offset
+                delay = deadline - time.perf_counter()
+                if delay > 0:
+                    self._stop.wait(delay)
+                late = time.perf_counter() - deadline
+                if late > period and index < len(self.times) - 1:
+                    self.skipped += 1
+                    continue
+                self._send(index)
+                self.lateness[index] = late
+        except Exception as e:
+            self.error = e
+
+    def timing(self):
+        '''
+            Frame timing statistics in ms, lateness is the send time minus the frame's
+            deadline, jitter the standard deviation of the sent frame intervals.
+        '''
+        sent = ~np.isnan(self.lateness)
+        late = self.lateness[sent] * 1e3
+        if len(late) == 0:
+            return {'frames': len(self.times), 'sent': 0, 'skipped': self.skipped}
+        intervals = np.diff(self.times[sent] * 1e3 + late)
+        return {'frames': len(self.times),
+                'sent': int(sent.sum()),
+                'skipped': self.skipped,
+                'rate': self.rate,
+                'lateness_mean_ms': float(late.mean()),
+                'lateness_p95_ms': float(np.percentile(late, 95)),
+                'lateness_max_ms': float(late.max()),
+                'jitter_ms': float(intervals.std()) if len(intervals) else 0.0}
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+import os
+import time
+import collections
+import concurrent.futures
+import serial_discovery
+import calibration
+from light_control import light_source
+from instrumentation import NULL_INSTRUMENTATION
+
+'''
+    Several light boxes driven from one process.
+
+    Each rig is a light_source with its own chroma meters and its own worker thread,
+    so commands to one rig run in order while all rigs run in parallel, and a rig
+    that raises or hangs does not hold up the others.
+
+        rigs = RigManager.open([{'name': 'a', 'port': 'usbmodem206', 'light_source': 'solbox',
+                                 'chromameter_ports': ['usbserial-A1']},
+                                {'name': 'b', 'port': 'usbmodem208', 'light_source': 'solbox',
+                                 'chromameter_ports': ['usbserial-B2']}])
+        rigs.set_light(luminance=0.5, cct=5000)
+        results = rigs.run_queue(options, lambda rig, option: rig.light.set_light(**option))
+'''
+
+RigResult = collections.namedtuple('RigResult', ['rig', 'value', 'error', 'elapsed'])
+
+
+class Rig(object):
+    '''
+        One light box: its light_source, a single worker thread and error state.
+        A rig with max_failures consecutive errors is marked failed and skipped,
+        as is a rig whose worker is stuck in a timed out call.
+    '''
+    def __init__(self, name, light, error=None, max_failures=3):
+        self.name = name
+        self.light = light
+        self.error = error
+        self.failures = 0 if error is None else max_failures
+        self.max_failures = max_failures
+        self._worker = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='rig-' + name)
+        self._hung = None
+
+    @property
+    def failed(self):
+        return self.light is None or self.failures >= self.max_failures or self.hung
+
+    @property
+    def hung(self):
+        return self._hung is not None and not self._hung.done()
+
+    def timed_out(self, future, timeout):
+        '''
+            Record a call still running after timeout: it counts as a failure and
+            the rig is skipped until the call returns, since the worker is busy.
+        '''
+        self.error = concurrent.futures.TimeoutError('{} busy after {}s'.format(self.name, timeout))
+        self.failures += 1
+        self._hung = future
+        return RigResult(self.name, None, self.error, timeout)
+
+    def submit(self, function, *args, **kwargs):
+        return self._worker.submit(self._call, function, args, kwargs)
+
+    def _call(self, function, args, kwargs):
+        start = time.perf_counter()
+        try:
+            value = function(*args, **kwargs)
+        except Exception as e:
+            self.error = e
+            self.failures += 1
+            return RigResult(self.name, None, e, time.perf_counter() - start)
+        self.failures = 0
+        return RigResult(self.name, value, None, time.perf_counter() - start)
+
+    def close(self):
+        self._worker.shutdown(wait=False)
+        if self.light is not None:
+            self.light.__del__()
+
+    def __repr__(self):
+        return 'Rig({}, {}, failed={})'.format(self.name, None if self.light is None else self.light.device_id,
+                                               self.failed)
+
+
+class RigManager(object):
+    def __init__(self, rigs=(), instrumentation=None):
+        self.rigs = collections.OrderedDict((rig.name, rig) for rig in rigs)
+        self.instrumentation = NULL_INSTRUMENTATION if instrumentation is None else instrumentation
+
+    @staticmethod
+    def discover(timeout=1.0, verbose=1, device_cache=True):
+        '''
+            Rig configs for every light box on the host, chroma meter ports left out.
+            Meters can only be paired with a box automatically when there is one
+            box, otherwise add chromameter_ports to the configs.
+        '''
+        ports = serial_discovery.candidate_ports()
+        try:
+            import chromameters as CMM
+            identifiers = list(CMM.CHROMA_METERS_IDENTIFIER)
+        except ImportError:
+            identifiers = []
+        meter_ports = [port for port in ports if any(ident in port for ident in identifiers)]
+        light_ports = [port for port in ports if port not in meter_ports]
+        cache = serial_discovery.DeviceCache() if device_cache else None
+        devices = serial_discovery.identify_devices(light_ports, cache=cache, timeout=timeout, verbose=verbose)
+        configs = [{'name': os.path.basename(port), 'port': port, 'light_source': device}
+                   for port, device in devices.items()]
+        if len(configs) == 1:
+            configs[0]['chromameter_ports'] = meter_ports
+        else:
+            for config in configs:
+                config['chromameter_ports'] = []
+            if meter_ports and verbose > 0:
+                print('Chroma meters {} not paired with a light box, set chromameter_ports'.format(meter_ports))
+        return configs
+
+    @classmethod
+    def open(cls, configs, instrumentation=None, max_failures=3, **common):
+        '''
+            Connect every rig config (light_source keyword arguments plus a name)
+            in parallel. common is passed to every light_source. A rig that fails
+            to connect is kept with its error and marked failed. Rigs share one
+            device cache and calibration table.
+        '''
+        common.setdefault('device_cache', serial_discovery.DeviceCache())
+        common.setdefault('calibration_table', calibration.CalibrationTable())
+        common.setdefault('instrumentation', instrumentation)
+        configs = [dict(config) for config in configs]
+        names = [config.pop('name', None) or config.get('port') or 'rig{}'.format(i)
+                 for i, config in enumerate(configs)]
+        if len(set(names)) != len(names):
+            raise ValueError('Rig names must be unique: {}'.format(names))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(configs))) as pool:
+            futures = [pool.submit(light_source, **dict(common, **config)) for config in configs]
+        rigs = []
+        for name, future in zip(names, futures):
+            try:
+                rigs.append(Rig(name, future.result(), max_failures=max_failures))
+            except Exception as e:
+                rigs.append(Rig(name, None, error=e, max_failures=max_failures))
+        return cls(rigs, instrumentation=instrumentation)
+
+    def active(self, names=None):
+        return [rig for name, rig in self.rigs.items()
+                if not rig.failed and (names is None or name in names)]
+
+    def apply(self, method, *args, rigs=None, timeout=None, **kwargs):
+        '''
+            Call light_source.method on the active rigs (or the named ones) in
+            parallel. Returns {name: RigResult}, errors are returned, not raised.
+            A rig still busy after timeout gets a TimeoutError result, counts a
+            failure and is skipped until the hung call returns.
+        '''
+        with self.instrumentation.span('rigs.' + method):
+            futures = {rig.name: rig.submit(getattr(rig.light, method), *args, **kwargs)
+                       for rig in self.active(rigs)}
+            concurrent.futures.wait(list(futures.values()), timeout=timeout)
+        results = {}
+        for name, future in futures.items():
+            if future.done():
+                results[name] = future.result()
+            else:
+                results[name] = self.rigs[name].timed_out(future, timeout)
+                self.instrumentation.count('rig_timeout')
+            if results[name].error is not None:
+                self.instrumentation.count('rig_error')
+        return results
+
+    def set_light(self, luminance=None, cct=None, rigs=None, **kwargs):
+        return self.apply('set_light', luminance=luminance, cct=cct, rigs=rigs, **kwargs)
+
+    def set_light_abs(self, abs_luminance, cct=None, rigs=None, **kwargs):
+        return self.apply('set_light_abs', abs_luminance, cct=cct, rigs=rigs, **kwargs)
+
+    def read_luminance(self, rigs=None, timeout=None):
+        return self.apply('read_luminance', rigs=rigs, timeout=timeout)
+
+    def run_queue(self, items, work, retries=1, timeout=None):
+        '''
+            Shared work queue: every active rig takes the next item and runs
+            work(rig, item) until the queue is empty, so faster rigs take more items.
+            A failed item is put back for another attempt (on any rig) up to retries
+            times. An item still running after timeout seconds counts as failed and
+            its rig is skipped while the call hangs, so the other rigs drain the queue.
+            Returns (item, RigResult) pairs in completion order.
+        '''
+        pending = collections.deque((item, 0) for item in items)
+        results = []
+        running = {}    # future -> (rig, item, attempt, deadline)
+
+        def finish(item, attempt, result):
+            if result.error is not None:
+                self.instrumentation.count('rig_error')
+                if attempt < retries:
+                    pending.append((item, attempt + 1))
+                    return
+            results.append((item, result))
+
+        if not self.active():
+            raise Exception('No working rig')
+        while True:
+            busy = set(rig.name for rig, _, _, _ in running.values())
+            for rig in self.active():
+                if pending and rig.name not in busy:
+                    item, attempt = pending.popleft()
+                    deadline = None if timeout is None else time.monotonic() + timeout
+                    running[rig.submit(work, rig, item)] = (rig, item, attempt, deadline)
+            if not running:
+                break
+            deadlines = [deadline for _, _, _, deadline in running.values() if deadline is not None]
+            wait = None if not deadlines else max(0.0, min(deadlines) - time.monotonic())
+            done, _ = concurrent.futures.wait(list(running), timeout=wait,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            now = time.monotonic()
+            for future, (rig, item, attempt, deadline) in list(running.items()):
+                if future in done:
+                    del running[future]
+                    finish(item, attempt, future.result())
+                elif deadline is not None and now >= deadline:
+                    del running[future]
+                    self.instrumentation.count('rig_timeout')
+                    finish(item, attempt, rig.timed_out(future, timeout))
+        # Items left when every rig failed.
+        for item, attempt in pending:
+            results.append((item, RigResult(None, None, Exception('No working rig left'), 0.0)))
+        return results
+
+    def status(self):
+        return {name: {'device_id': None if rig.light is None else rig.light.device_id,
+                       'failed': rig.failed,
+                       'hung': rig.hung,
+                       'error': None if rig.error is None else repr(rig.error)}
+                for name, rig in self.rigs.items()}
+
+    def close(self):
+        for rig in self.rigs.values():
+            rig.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def main():
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(description='Drive several light boxes at once')
+    parser.add_argument('--config', help='JSON list of rig configs (light_source arguments plus a name), '
+                        'discovered when not set', default=None)
+    parser.add_argument('--luminance', '-l', help='Luminance to set on every rig', type=float, default=None)
+    parser.add_argument('--cct', '-t', help='CCT (K) to set on every rig', type=int, default=None)
+    parser.add_argument('--verbose', '-v', help='Verbose level', default=1, type=int)
+    args = parser.parse_args()
+
+    if args.config:
+        with open(args.config) as f:
+            configs = json.load(f)
+    else:
+        configs = RigManager.discover(verbose=args.verbose)
+    with RigManager.open(configs, verbose=args.verbose) as rigs:
+        if args.luminance is not None or args.cct is not None:
+            for name, result in rigs.set_light(luminance=args.luminance, cct=args.cct).items():
+                print('{}: {}'.format(name, 'ok' if result.error is None else result.error))
+        print(json.dumps(rigs.status(), indent=1))
+
+
+if __name__ == '__main__':
+    main()
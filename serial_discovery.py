@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+import os
+import sys
+import glob
+import json
+import time
+import threading
+import concurrent.futures
+
+'''
+    Serial port discovery for light boxes.
+
+    candidate_ports() lists the USB serial ports on macOS and Linux, identify_devices()
+    probes them all concurrently and returns as soon as each port shows its banner.
+    Banner-confirmed results are cached on disk by USB serial number, so a warm start
+    needs no probing.
+'''
+
+# Same banners as light_control.WAITING_KEY_WORD, kept here so discovery does not
+# import the light control stack.
+DEVICE_BANNERS = {'dxo': 'SerialToDmx',
+                  'solbox': 'SolBox'}
+# Arri panels do not answer the probe.
+SILENT_DEVICE = 'arri'
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'LIGHTBOX_DEVICE_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'lightbox', 'device_cache.json'))
+
+
+def candidate_ports():
+    '''
+        USB serial ports of the host. On Linux the stable /dev/serial/by-id names are
+        preferred over the ttyUSB/ttyACM nodes they point to.
+    '''
+    if sys.platform == 'darwin':
+        return sorted(os.path.join('/dev', d) for d in os.listdir('/dev') if 'cu.usb' in d.lower())
+    if sys.platform.startswith('linux'):
+        ports = sorted(glob.glob('/dev/serial/by-id/*'))
+        seen = set(os.path.realpath(p) for p in ports)
+        for node in sorted(glob.glob('/dev/ttyUSB*') + glob.glob('/dev/ttyACM*')):
+            if os.path.realpath(node) not in seen:
+                ports.append(node)
+        return ports
+    return []
+
+
+def usb_serial_numbers():
+    '''
+        Map of resolved device node to USB serial number, empty when pyserial's
+        port listing is not available.
+    '''
+    try:
+        from serial.tools import list_ports
+    except Exception:
+        return {}
+    return {os.path.realpath(p.device): p.serial_number for p in list_ports.comports() if p.serial_number}
+
+
+class DeviceCache(object):
+    '''
+        Persistent USB serial number -> device type map.
+    '''
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self._serial_numbers = None
+        self._lock = threading.Lock()
+        try:
+            with open(path) as f:
+                self.devices = json.load(f)
+        except (OSError, ValueError):
+            self.devices = {}
+
+    def serial_number(self, port):
+        if self._serial_numbers is None:
+            self._serial_numbers = usb_serial_numbers()
+        return self._serial_numbers.get(os.path.realpath(port))
+
+    def get(self, port):
+        serial_number = self.serial_number(port)
+        return self.devices.get(serial_number) if serial_number else None
+
+    def set(self, port, device):
+        serial_number = self.serial_number(port)
+        if serial_number:
+            with self._lock:
+                self.devices[serial_number] = device
+
+    def forget(self, port):
+        serial_number = self.serial_number(port)
+        with self._lock:
+            self.devices.pop(serial_number, None)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with self._lock:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.devices, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+def probe_port(port, timeout=1.0, poll=0.02):
+    '''
+        Write a zero byte and read until a known banner arrives or timeout expires.
+        Returns the device type, or SILENT_DEVICE when nothing recognisable came back.
+    '''
+    import serial
+    ser_obj = serial.Serial(port, timeout=poll)
+    try:
+        ser_obj.write(bytearray([0]))
+        data = b''
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            data += ser_obj.read(max(1, ser_obj.in_waiting))
+            text = data.decode(errors='ignore')
+            for device, banner in DEVICE_BANNERS.items():
+                if banner in text:
+                    return device
+    finally:
+        ser_obj.close()
+    return SILENT_DEVICE
+
+
+def identify_devices(ports, cache=None, timeout=1.0, verbose=1):
+    '''
+        Device type for every port in ports. Cached ports are answered without
+        opening them, the rest are probed concurrently. Types confirmed by a banner
+        are added to the cache, SILENT_DEVICE is probed again next time.
+    '''
+    devices = {}
+    to_probe = []
+    for port in ports:
+        device = cache.get(port) if cache is not None else None
+        # Entries written before only banners were cached may hold SILENT_DEVICE.
+        if device is None or device == SILENT_DEVICE:
+            to_probe.append(port)
+        else:
+            devices[port] = device
+    if to_probe:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(to_probe)) as pool:
+            probes = {port: pool.submit(probe_port, port, timeout) for port in to_probe}
+        for port, probe in probes.items():
+            try:
+                devices[port] = probe.result()
+            except Exception as e:
+                if verbose > 0:
+                    print('Failed to probe {}: {}'.format(port, e))
+                continue
+            # A missed banner looks like a silent device, only banners are cached.
+            if cache is not None and devices[port] != SILENT_DEVICE:
+                cache.set(port, devices[port])
+        if cache is not None:
+            try:
+                cache.save()
+            except OSError as e:
+                if verbose > 0:
+                    print('Failed to save device cache {}: {}'.format(cache.path, e))
+    return devices
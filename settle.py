@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+import time
+import collections
+
+'''
+    Light settle detection.
+
+    Instead of sleeping a fixed time after a light change, poll the chroma meters and
+    declare the light settled once the fresh readings of a rolling time window stay
+    within a relative band. A hard deadline bounds the wait for lights that never
+    settle.
+'''
+
+
+class SettleResult(object):
+    def __init__(self, settled, settle_time, elapsed, value, samples):
+        self.settled = settled          # False when the deadline expired first
+        self.settle_time = settle_time  # Seconds until the first reading of the settled window
+        self.elapsed = elapsed          # Seconds spent waiting
+        self.value = value              # Mean of the last window
+        self.samples = samples          # Number of readings taken
+
+    def __repr__(self):
+        return 'SettleResult(settled={}, settle_time={:.3f}, elapsed={:.3f}, value={}, samples={})'.format(
+            self.settled, self.settle_time, self.elapsed, self.value, self.samples)
+
+
+class SettleDetector(object):
+    '''
+        Rolling time window state machine, fed with (time, reading) pairs.
+        The light counts as settled once the readings of the last window seconds, at
+        least min_samples of them, stay within a band: relative to the window mean,
+        plus abs_band as an absolute floor so readings close to zero lux can settle
+        too. The least squares slope of the window, projected drift_horizon seconds
+        ahead, has to stay within the band as well, so a slow rise is not taken for
+        a settled light.
+        Only fresh readings count: readings taken before min_wait (a chroma meter
+        still reporting the previous state) and readings not newer than the previous
+        one (a repeated or cached value) are ignored.
+    '''
+    def __init__(self, band=0.01, window=1.0, min_wait=0.2, abs_band=0.05, min_samples=5, drift_horizon=2.0):
+        self.band = band
+        self.window = window
+        self.min_wait = min_wait
+        self.abs_band = abs_band
+        self.min_samples = min_samples
+        self.drift_horizon = drift_horizon
+        self.readings = collections.deque()
+        self.samples = 0
+        self.stale = 0
+        self._last = None
+
+    def update(self, t, value):
+        '''
+            Add a reading taken t seconds after the change, True once settled.
+        '''
+        self.samples += 1
+        if self._last is not None and t <= self._last:
+            self.stale += 1
+            return False
+        self._last = t
+        if t < self.min_wait:
+            return False
+        self.readings.append((t, value))
+        # Keep the newest readings spanning at least window seconds.
+        while len(self.readings) > 1 and self.readings[1][0] <= t - self.window:
+            self.readings.popleft()
+        if t - self.readings[0][0] < self.window or len(self.readings) < self.min_samples:
+            return False
+        values = [v for _, v in self.readings]
+        tolerance = self.band * abs(self.mean()) + self.abs_band
+        return max(values) - min(values) <= tolerance and abs(self.slope()) * self.drift_horizon <= tolerance
+
+    def slope(self):
+        '''
+            Least squares slope of the window readings per second.
+        '''
+        n = len(self.readings)
+        t_mean = sum(t for t, _ in self.readings) / n
+        v_mean = self.mean()
+        var = sum((t - t_mean) ** 2 for t, _ in self.readings)
+        if var == 0:
+            return 0.0
+        return sum((t - t_mean) * (v - v_mean) for t, v in self.readings) / var
+
+    def mean(self):
+        if not self.readings:
+            return None
+        return sum(v for _, v in self.readings) / len(self.readings)
+
+    def result(self, settled, elapsed):
+        settle_time = self.readings[0][0] if settled else elapsed
+        return SettleResult(settled, settle_time, elapsed, self.mean(), self.samples)
+
+
+def wait_for_settle(read, interval=0.05, timeout=10.0, **kwargs):
+    '''
+        Poll read() every interval seconds until settled or timeout seconds passed.
+        read() returns a reading, or (timestamp, reading) with the time.time() the
+        reading was taken, so a stale reading is not counted as a new one.
+        Extra keyword arguments configure the SettleDetector.
+    '''
+    detector = SettleDetector(**kwargs)
+    start = time.monotonic()
+    wall_start = time.time()
+    next_poll = start
+    while True:
+        value = read()
+        now = time.monotonic() - start
+        t = now
+        if isinstance(value, tuple):
+            timestamp, value = value
+            t = timestamp - wall_start
+        if detector.update(t, value):
+            return detector.result(True, now)
+        if now >= timeout:
+            return detector.result(False, now)
+        # Absolute schedule, a slow read does not push every later poll back.
+        next_poll = max(next_poll + interval, time.monotonic())
+        time.sleep(max(0.0, min(next_poll, start + timeout) - time.monotonic()))
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import tempfile
+import unittest
+from device_readiness import AdbDevice, DeviceNotReady
+
+'''
+    device_readiness against adb_stub.py: python3 -m unittest test_device_readiness
+'''
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'adb_stub.py')
+POLL = {'interval': 0.05, 'max_interval': 0.1}
+
+
+class AdbDeviceTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.environ = dict(os.environ)
+        os.environ.update(ADB_STUB_STATE=os.path.join(self.directory, 'state'),
+                          ADB_STUB_LINGER='0.3', ADB_STUB_OFFLINE='0.3', ADB_STUB_BOOT='1.0')
+        os.environ.pop('ADB_STUB_NO_BOOT_ID', None)
+        self.device = AdbDevice(adb=STUB, verbose=0)
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.environ)
+        shutil.rmtree(self.directory)
+
+    def test_booted_device_is_ready(self):
+        self.assertLess(self.device.wait_until_ready(timeout=5, **POLL), 0.5)
+
+    def test_reboot_waits_for_new_boot(self):
+        elapsed = self.device.reboot(timeout=10, **POLL)
+        self.assertGreaterEqual(elapsed, 1.0)
+        self.assertEqual(self.device.reboot_times, [elapsed])
+
+    def test_reboot_without_boot_id_waits_for_drop(self):
+        # The old boot still reports boot_completed=1 right after "adb reboot".
+        os.environ['ADB_STUB_NO_BOOT_ID'] = '1'
+        self.assertGreaterEqual(self.device.reboot(timeout=10, **POLL), 1.0)
+
+    def test_reboot_timeout(self):
+        os.environ['ADB_STUB_BOOT'] = '30'
+        with self.assertRaises(DeviceNotReady):
+            self.device.reboot(timeout=1.5, **POLL)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+import unittest
+from unittest import mock
+import device_emulator
+from device_emulator import EmulatedSolBox, emulated_light_source
+
+'''
+    light_control against the emulated devices: python3 -m unittest test_light_control
+'''
+
+
+class LossySolBox(EmulatedSolBox):
+    '''
+        SolBox that never answers the commands listed in lose (1 is the first command).
+    '''
+    lose = ()
+
+    def __init__(self, *args, **kwargs):
+        EmulatedSolBox.__init__(self, *args, **kwargs)
+        self.commands = 0
+
+    def reply(self, data):
+        if data == self.ack:
+            self.commands += 1
+            if self.commands in self.lose:
+                return
+        EmulatedSolBox.reply(self, data)
+
+
+class SolBoxAckTest(unittest.TestCase):
+    def open(self, lose):
+        solbox = type('LossySolBox', (LossySolBox,), {'lose': lose})
+        with mock.patch.dict(device_emulator.EMULATORS, solbox=solbox):
+            light = emulated_light_source('solbox', rise_time=0.0, noise=0.0)
+        self.addCleanup(light.__del__)
+        light.timeout = 0.3
+        return light
+
+    def test_lost_ack_fails_only_its_command(self):
+        light = self.open(lose=(2,))
+        light.set_light(luminance=0.1, cct=5000)
+        with self.assertRaises(Exception):
+            light.set_light(luminance=0.2, cct=5000)
+        for luminance in (0.3, 0.4, 0.5):
+            light.set_light(luminance=luminance, cct=5000)
+        self.assertAlmostEqual(light.emulated_light.lux(), 500.0)
+
+
+if __name__ == '__main__':
+    unittest.main()